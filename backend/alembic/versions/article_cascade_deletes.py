@@ -0,0 +1,29 @@
+"""delete a feed's articles, and their interactions and saves, in the database
+
+Revision ID: article_cascade_deletes
+Revises: user_preferences
+Create Date: 2024-05-04 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'article_cascade_deletes'
+down_revision = 'user_preferences'
+branch_labels = None
+depends_on = None
+
+def _recreate(name: str, table: str, column: str, referred: str, ondelete) -> None:
+    op.drop_constraint(name, table, type_='foreignkey')
+    op.create_foreign_key(name, table, referred, [column], ['id'], ondelete=ondelete)
+
+def upgrade() -> None:
+    _recreate('fk_articles_feed_id_feeds', 'articles', 'feed_id', 'feeds', 'CASCADE')
+    # Named by PostgreSQL when the initial migration created them
+    _recreate('interactions_article_id_fkey', 'interactions', 'article_id', 'articles', 'CASCADE')
+    _recreate('user_articles_article_id_fkey', 'user_articles', 'article_id', 'articles', 'CASCADE')
+
+def downgrade() -> None:
+    _recreate('user_articles_article_id_fkey', 'user_articles', 'article_id', 'articles', None)
+    _recreate('interactions_article_id_fkey', 'interactions', 'article_id', 'articles', None)
+    _recreate('fk_articles_feed_id_feeds', 'articles', 'feed_id', 'feeds', 'SET NULL')
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""add MinHash signatures and near-duplicate cluster ids to articles
+
+Revision ID: article_clusters
+Revises: article_search
+Create Date: 2024-04-20 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'article_clusters'
+down_revision = 'article_search'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column('articles', sa.Column('minhash', sa.LargeBinary(), nullable=True))
+    op.add_column('articles', sa.Column('cluster_id', sa.Integer(), nullable=True))
+    # Existing articles start as clusters of their own. They get no signature,
+    # so new articles are only matched against those ingested from now on
+    op.execute("UPDATE articles SET cluster_id = id")
+    op.create_index('ix_articles_cluster_id', 'articles', ['cluster_id'])
+
+def downgrade() -> None:
+    op.drop_index('ix_articles_cluster_id', table_name='articles')
+    op.drop_column('articles', 'cluster_id')
+    op.drop_column('articles', 'minhash')
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""link articles to feeds by id and store per-feed article counters
+
+Revision ID: article_feed_id
+Revises: article_listing_indexes
+Create Date: 2024-04-06 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'article_feed_id'
+down_revision = 'article_listing_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column('articles', sa.Column('feed_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_articles_feed_id_feeds', 'articles', 'feeds', ['feed_id'], ['id'], ondelete='SET NULL'
+    )
+    op.add_column('feeds', sa.Column('article_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('feeds', sa.Column('last_article_date', sa.DateTime(), nullable=True))
+    
+    # Backfill from the old name-based link; with duplicate names the oldest feed wins
+    op.execute("""
+        UPDATE articles SET feed_id = (
+            SELECT MIN(feeds.id) FROM feeds WHERE feeds.name = articles.source
+        )
+        WHERE feed_id IS NULL
+    """)
+    op.create_index('ix_articles_feed_id_date_published', 'articles', ['feed_id', 'date_published'])
+    op.execute("""
+        UPDATE feeds SET
+            article_count = (SELECT COUNT(*) FROM articles WHERE articles.feed_id = feeds.id),
+            last_article_date = (SELECT MAX(date_published) FROM articles WHERE articles.feed_id = feeds.id)
+    """)
+
+def downgrade() -> None:
+    op.drop_column('feeds', 'last_article_date')
+    op.drop_column('feeds', 'article_count')
+    op.drop_index('ix_articles_feed_id_date_published', table_name='articles')
+    op.drop_constraint('fk_articles_feed_id_feeds', 'articles', type_='foreignkey')
+    op.drop_column('articles', 'feed_id')
\ No newline at end of file
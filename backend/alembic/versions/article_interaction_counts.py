@@ -0,0 +1,44 @@
+"""add denormalized interaction counters to articles
+
+Revision ID: article_interaction_counts
+Revises: feed_conditional_get
+Create Date: 2024-03-23 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'article_interaction_counts'
+down_revision = 'feed_conditional_get'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column('articles', sa.Column('interaction_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('articles', sa.Column('save_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('articles', sa.Column('click_count', sa.Integer(), nullable=False, server_default='0'))
+    op.create_index('ix_interactions_article_id', 'interactions', ['article_id'])
+    
+    # Backfill from the existing interactions
+    op.execute("""
+        UPDATE articles SET
+            interaction_count = (
+                SELECT COUNT(*) FROM interactions WHERE interactions.article_id = articles.id
+            ),
+            save_count = (
+                SELECT COUNT(*) FROM interactions
+                WHERE interactions.article_id = articles.id AND interactions.interaction_type = 'save'
+            ),
+            click_count = (
+                SELECT COUNT(*) FROM interactions
+                WHERE interactions.article_id = articles.id AND interactions.interaction_type = 'click'
+            )
+        WHERE EXISTS (SELECT 1 FROM interactions WHERE interactions.article_id = articles.id)
+    """)
+
+def downgrade() -> None:
+    op.drop_index('ix_interactions_article_id', table_name='interactions')
+    op.drop_column('articles', 'click_count')
+    op.drop_column('articles', 'save_count')
+    op.drop_column('articles', 'interaction_count')
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""add composite indexes for newest-first article listing
+
+Revision ID: article_listing_indexes
+Revises: article_interaction_counts
+Create Date: 2024-03-30 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'article_listing_indexes'
+down_revision = 'article_interaction_counts'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.create_index('ix_articles_date_found_id', 'articles', ['date_found', 'id'])
+    op.create_index('ix_articles_category_date_found_id', 'articles', ['category', 'date_found', 'id'])
+    op.create_index('ix_articles_priority_date_found_id', 'articles', ['priority', 'date_found', 'id'])
+
+def downgrade() -> None:
+    op.drop_index('ix_articles_priority_date_found_id', table_name='articles')
+    op.drop_index('ix_articles_category_date_found_id', table_name='articles')
+    op.drop_index('ix_articles_date_found_id', table_name='articles')
\ No newline at end of file
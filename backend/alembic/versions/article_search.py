@@ -0,0 +1,55 @@
+"""add a trigger-maintained tsvector and GIN index for full-text article search
+
+Revision ID: article_search
+Revises: article_feed_id
+Create Date: 2024-04-13 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'article_search'
+down_revision = 'article_feed_id'
+branch_labels = None
+depends_on = None
+
+# Title weighs most, then key points, then the summary. The configuration must
+# match settings.SEARCH_LANGUAGE.
+SEARCH_VECTOR = """
+    setweight(to_tsvector('english', coalesce({row}title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(array_to_string({row}key_points, ' '), '')), 'B') ||
+    setweight(to_tsvector('english', coalesce({row}summary, '')), 'C')
+"""
+
+def upgrade() -> None:
+    # Other databases search with the in-process fallback index
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.add_column('articles', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(f"""
+        CREATE FUNCTION articles_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR.format(row='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER articles_search_vector_update
+        BEFORE INSERT OR UPDATE OF title, summary, key_points ON articles
+        FOR EACH ROW EXECUTE FUNCTION articles_search_vector_update()
+    """)
+    op.execute(f"UPDATE articles SET search_vector = {SEARCH_VECTOR.format(row='')}")
+    op.create_index('ix_articles_search_vector', 'articles', ['search_vector'], postgresql_using='gin')
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_index('ix_articles_search_vector', table_name='articles')
+    op.execute("DROP TRIGGER articles_search_vector_update ON articles")
+    op.execute("DROP FUNCTION articles_search_vector_update()")
+    op.drop_column('articles', 'search_vector')
\ No newline at end of file
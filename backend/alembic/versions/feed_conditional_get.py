@@ -0,0 +1,25 @@
+"""add conditional GET validators to feeds
+
+Revision ID: feed_conditional_get
+Revises: initial_migration
+Create Date: 2024-03-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'feed_conditional_get'
+down_revision = 'initial_migration'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column('feeds', sa.Column('etag', sa.String(), nullable=True))
+    op.add_column('feeds', sa.Column('last_modified', sa.String(), nullable=True))
+    op.add_column('feeds', sa.Column('content_hash', sa.String(), nullable=True))
+
+def downgrade() -> None:
+    op.drop_column('feeds', 'content_hash')
+    op.drop_column('feeds', 'last_modified')
+    op.drop_column('feeds', 'etag')
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""add per-user preference vectors for personalized ranking
+
+Revision ID: user_preferences
+Revises: article_clusters
+Create Date: 2024-04-27 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'user_preferences'
+down_revision = 'article_clusters'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.create_table(
+        'user_preferences',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('vector', sa.LargeBinary(), nullable=False),
+        sa.Column('last_interaction_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    # Vectors are filled lazily from the whole interaction history on first use
+    op.create_index('ix_interactions_user_id_id', 'interactions', ['user_id', 'id'])
+
+def downgrade() -> None:
+    op.drop_index('ix_interactions_user_id_id', table_name='interactions')
+    op.drop_table('user_preferences')
\ No newline at end of file
@@ -1,14 +1,16 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Generator, Optional
 from app.core.security import SECRET_KEY, ALGORITHM
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, get_async_db
 from app.models.user import User
 from datetime import datetime
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
 
 def get_db() -> Generator:
     try:
@@ -18,7 +20,7 @@ def get_db() -> Generator:
         db.close()
 
 async def get_current_user(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token: str = Depends(oauth2_scheme)
 ) -> User:
     credentials_exception = HTTPException(
@@ -35,7 +37,8 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == email).first()
+    # Awaited, so the lookup doesn't block the event loop
+    user = await db.scalar(select(User).where(User.email == email))
     if user is None:
         raise credentials_exception
     
@@ -47,6 +50,22 @@ async def get_current_user(
     
     return user
 
+async def get_optional_user(
+    db: AsyncSession = Depends(get_async_db),
+    token: Optional[str] = Depends(optional_oauth2_scheme)
+) -> Optional[User]:
+    """The signed in user, or None for requests without a valid token
+    
+    Public routes take this: a stale token left in the client's headers must
+    not turn them into a 401.
+    """
+    if token is None:
+        return None
+    try:
+        return await get_current_user(db, token)
+    except HTTPException:
+        return None
+
 async def get_current_active_superuser(
     current_user: User = Depends(get_current_user),
 ) -> User:
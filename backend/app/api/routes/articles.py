@@ -1,11 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from pydantic import TypeAdapter
+from sqlalchemy import Select, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.schemas.article import Article, ArticleCreate, ArticleUpdate, ArticleWithInteractions
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional, Tuple
+from app.schemas.article import Article, ArticleCreate, ArticleSearchHit, ArticleUpdate, ArticleWithInteractions, RelatedArticle
 from app.models.article import Article as ArticleModel
-from app.db.session import get_db
-from sqlalchemy import func
-from app.models.interaction import Interaction
+from app.models.user import User
+from app.api.dependencies import get_optional_user
+from app.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.response_cache import response_cache
+from app.db.session import SessionLocal, get_async_db, get_db
+from app.services.feed_service import update_feed_counters
+from app.services.ml_service import ml_service
+from app.services.ranking_service import rank_for_user
+from app.services.related_service import IndexNotReady, find_related
+from app.services.search_service import search_articles
 
 router = APIRouter()
 
@@ -24,59 +36,195 @@ def create_article(article: ArticleCreate, db: Session = Depends(get_db)):
     db.refresh(db_article)
     return db_article
 
+# Tables whose writes change what the read endpoints return
+ARTICLE_TABLES = ("articles", "interactions")
+_article = TypeAdapter(ArticleWithInteractions)
+_article_list = TypeAdapter(List[ArticleWithInteractions])
+_search_hits = TypeAdapter(List[ArticleSearchHit])
+_related = TypeAdapter(List[RelatedArticle])
+
+def _article_page(
+    skip: int,
+    limit: int,
+    category: Optional[str],
+    priority: Optional[str],
+    cursor: Optional[str],
+    collapse: bool
+) -> Select:
+    # Interaction counters are stored on the article, so no join is needed
+    query = select(ArticleModel)
+    
+    if category:
+        query = query.where(ArticleModel.category == category)
+    if priority:
+        query = query.where(ArticleModel.priority == priority)
+    if collapse:
+        # Only the first article of each near-duplicate cluster
+        query = query.where(or_(
+            ArticleModel.cluster_id.is_(None),
+            ArticleModel.cluster_id == ArticleModel.id
+        ))
+    
+    # id breaks ties between articles found in the same instant
+    query = query.order_by(ArticleModel.date_found.desc(), ArticleModel.id.desc())
+    
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        query = query.where(tuple_(ArticleModel.date_found, ArticleModel.id) < after)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+def _next_cursor(articles: List[ArticleModel], limit: int) -> Optional[str]:
+    if articles and len(articles) == limit:
+        return encode_cursor(articles[-1].date_found, articles[-1].id)
+    return None
+
+def list_articles(
+    db: Session,
+    skip: int = 0,
+    limit: int = 20,
+    category: Optional[str] = None,
+    priority: Optional[str] = None,
+    cursor: Optional[str] = None,
+    collapse: bool = False
+) -> Tuple[List[ArticleModel], Optional[str]]:
+    """One page of articles, newest first, and the cursor of the next page if there may be one"""
+    articles = db.scalars(_article_page(skip, limit, category, priority, cursor, collapse)).all()
+    return articles, _next_cursor(articles, limit)
+
+async def list_articles_async(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 20,
+    category: Optional[str] = None,
+    priority: Optional[str] = None,
+    cursor: Optional[str] = None,
+    collapse: bool = False
+) -> Tuple[List[ArticleModel], Optional[str]]:
+    """``list_articles`` on an async session"""
+    articles = (await db.scalars(_article_page(skip, limit, category, priority, cursor, collapse))).all()
+    return articles, _next_cursor(articles, limit)
+
+def _rank_for_user(user_id: int, *args) -> List[ArticleModel]:
+    db = SessionLocal()
+    try:
+        return rank_for_user(db, user_id, *args)
+    finally:
+        db.close()
+
 @router.get("/", response_model=List[ArticleWithInteractions])
-def read_articles(
+async def read_articles(
+    request: Request,
     skip: int = 0,
     limit: int = 20,
     category: Optional[str] = None,
     priority: Optional[str] = None,
+    cursor: Optional[str] = None,
+    collapse: bool = False,
+    sort: str = Query("newest", pattern="^(newest|for_you)$"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[User] = Depends(get_optional_user)
+):
+    """Newest articles first.
+    
+    Pass the ``X-Next-Cursor`` header of a page as ``cursor`` to get the next one;
+    that seeks straight to it through the (date_found, id) indexes, so every page
+    costs the same. ``skip`` still works but gets slower the deeper it goes.
+    
+    With ``collapse`` a story syndicated by several feeds is listed once, as the
+    first article found; the others share its ``cluster_id``.
+    
+    ``sort=for_you`` needs a signed in user and reorders the newest
+    RANKING_CANDIDATES articles by similarity to the ones the user clicked,
+    saved and shared, and away from the ones they dismissed. It pages with
+    ``skip`` only.
+    """
+    if sort == "for_you":
+        if current_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+        if cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="cursor is not supported with sort=for_you, use skip"
+            )
+        # Different for every user, so it bypasses the shared response cache.
+        # Ranking may featurize candidates and fold history, which is CPU
+        # work: run it on the threadpool with its own session, not the loop
+        return await run_in_threadpool(_rank_for_user, current_user.id, skip, limit, category, priority, collapse)
+    
+    async def build():
+        articles, next_cursor = await list_articles_async(db, skip, limit, category, priority, cursor, collapse)
+        return articles, {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    
+    return await response_cache.respond_async(request, ARTICLE_TABLES, build, _article_list)
+
+@router.get("/search", response_model=List[ArticleSearchHit])
+def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=settings.SEARCH_MAX_LIMIT),
     db: Session = Depends(get_db)
 ):
-    query = db.query(
-        ArticleModel,
-        func.count(Interaction.id).label('interaction_count'),
-        func.sum(func.case([(Interaction.interaction_type == 'save', 1)], else_=0)).label('save_count'),
-        func.sum(func.case([(Interaction.interaction_type == 'click', 1)], else_=0)).label('click_count')
-    ).outerjoin(Interaction)
+    """Articles matching every word of ``q`` in the title, key points or summary, best match first.
     
-    if category:
-        query = query.filter(ArticleModel.category == category)
-    if priority:
-        query = query.filter(ArticleModel.priority == priority)
-    
-    articles = query.group_by(ArticleModel.id).order_by(ArticleModel.date_found.desc()).offset(skip).limit(limit).all()
-    
-    return [
-        {
-            **article[0].__dict__,
-            'interaction_count': article[1] or 0,
-            'save_count': article[2] or 0,
-            'click_count': article[3] or 0
-        }
-        for article in articles
-    ]
+    Title matches rank above key point matches, which rank above summary
+    matches. Each hit has a snippet with the matched words in ``<mark>``.
+    """
+    def build():
+        return search_articles(db, q, skip, limit), {}
+    
+    return response_cache.respond(request, ARTICLE_TABLES, build, _search_hits)
 
 @router.get("/{article_id}", response_model=ArticleWithInteractions)
-def read_article(article_id: int, db: Session = Depends(get_db)):
-    article = db.query(
-        ArticleModel,
-        func.count(Interaction.id).label('interaction_count'),
-        func.sum(func.case([(Interaction.interaction_type == 'save', 1)], else_=0)).label('save_count'),
-        func.sum(func.case([(Interaction.interaction_type == 'click', 1)], else_=0)).label('click_count')
-    ).outerjoin(Interaction).filter(ArticleModel.id == article_id).group_by(ArticleModel.id).first()
-    
-    if article is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Article not found"
-        )
+async def read_article(article_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    async def build():
+        article = await db.get(ArticleModel, article_id)
+        if article is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Article not found"
+            )
+        return article, {}
     
-    return {
-        **article[0].__dict__,
-        'interaction_count': article[1] or 0,
-        'save_count': article[2] or 0,
-        'click_count': article[3] or 0
-    }
+    return await response_cache.respond_async(request, ARTICLE_TABLES, build, _article)
+
+@router.get("/{article_id}/related", response_model=List[RelatedArticle])
+def read_related_articles(
+    article_id: int,
+    request: Request,
+    limit: int = Query(10, ge=1, le=settings.RELATED_MAX_LIMIT),
+    db: Session = Depends(get_db)
+):
+    """Articles about similar things, most similar first, leaving out copies of the same story"""
+    def build():
+        article = db.query(ArticleModel).filter(ArticleModel.id == article_id).first()
+        if article is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Article not found"
+            )
+        try:
+            return find_related(db, article, limit), {}
+        except IndexNotReady as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+                headers={"Retry-After": "5"}
+            )
+    
+    return response_cache.respond(request, ARTICLE_TABLES, build, _related)
 
 @router.put("/{article_id}", response_model=Article)
 def update_article(article_id: int, article: ArticleUpdate, db: Session = Depends(get_db)):
@@ -93,6 +241,15 @@ def update_article(article_id: int, article: ArticleUpdate, db: Session = Depend
     
     db.commit()
     db.refresh(db_article)
+    
+    # Manual labels are the best training signal an online model can get;
+    # learn from them on the update thread rather than in the request
+    if "category" in update_data or "priority" in update_data:
+        ml_service.submit_partial_update(
+            [f"{db_article.title}\n{db_article.summary}"],
+            [db_article.category],
+            [db_article.priority]
+        )
     return db_article
 
 @router.delete("/{article_id}", response_model=Article)
@@ -105,5 +262,8 @@ def delete_article(article_id: int, db: Session = Depends(get_db)):
         )
     
     db.delete(db_article)
+    if db_article.feed_id is not None:
+        db.flush()
+        update_feed_counters(db, db_article.feed_id, -1)
     db.commit()
     return db_article 
\ No newline at end of file
@@ -2,10 +2,14 @@ from datetime import timedelta
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from app.core.security import create_access_token, verify_password, ACCESS_TOKEN_EXPIRE_MINUTES
-from app.api.dependencies import get_db
+from app.api.dependencies import get_current_user
+from app.db.session import get_async_db
 from app.models.user import User
+from app.schemas.user import User as UserSchema
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -20,12 +24,13 @@ class TokenPayload(BaseModel):
 
 @router.post("/token", response_model=Token)
 async def login_access_token(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """OAuth2 compatible token login, get an access token for future requests"""
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    user = await db.scalar(select(User).where(User.email == form_data.username))
+    # bcrypt is deliberately slow, keep it off the event loop
+    if not user or not await run_in_threadpool(verify_password, form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -47,7 +52,7 @@ async def login_access_token(
         "token_type": "bearer"
     }
 
-@router.post("/test-token", response_model=User)
+@router.post("/test-token", response_model=UserSchema)
 async def test_token(current_user: User = Depends(get_current_user)) -> Any:
     """Test access token"""
     return current_user 
\ No newline at end of file
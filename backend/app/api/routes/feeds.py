@@ -1,13 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.feed import Feed, FeedCreate, FeedUpdate, FeedWithStats
 from app.models.feed import Feed as FeedModel
-from app.models.article import Article
-from app.db.session import get_db
-from sqlalchemy import func
-from datetime import datetime
-import feedparser
+from app.core.response_cache import response_cache
+from app.db.session import get_async_db, get_db
+from app.services.feed_service import FeedService
 
 router = APIRouter()
 
@@ -17,26 +18,8 @@ def fetch_feed_articles(feed_id: int, db: Session):
     if not feed or not feed.is_active:
         return
     
-    parsed = feedparser.parse(str(feed.url))
-    for entry in parsed.entries:
-        # Check if article already exists
-        existing = db.query(Article).filter(Article.url == entry.link).first()
-        if existing:
-            continue
-        
-        article = Article(
-            title=entry.title,
-            url=entry.link,
-            source=feed.name,
-            summary=entry.summary if hasattr(entry, 'summary') else '',
-            date_published=datetime.strptime(entry.published, '%a, %d %b %Y %H:%M:%S %z')
-            if hasattr(entry, 'published') else datetime.utcnow(),
-            date_found=datetime.utcnow()
-        )
-        db.add(article)
-    
-    feed.last_fetched = datetime.utcnow()
-    db.commit()
+    # Same path as the scheduled fetches: validators, dedup, clustering and indexes
+    FeedService(db).fetch_feeds([feed])
 
 @router.post("/", response_model=Feed)
 def create_feed(feed: FeedCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
@@ -57,46 +40,33 @@ def create_feed(feed: FeedCreate, background_tasks: BackgroundTasks, db: Session
     
     return db_feed
 
+# Tables whose writes change what the read endpoints return; the article
+# counters live on feeds, so article writes don't invalidate these
+FEED_TABLES = ("feeds",)
+_feed = TypeAdapter(FeedWithStats)
+_feed_list = TypeAdapter(List[FeedWithStats])
+
 @router.get("/", response_model=List[FeedWithStats])
-def read_feeds(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    feeds = db.query(
-        FeedModel,
-        func.count(Article.id).label('article_count'),
-        func.max(Article.date_published).label('last_article_date')
-    ).outerjoin(Article, Article.source == FeedModel.name
-    ).group_by(FeedModel.id
-    ).offset(skip).limit(limit).all()
+async def read_feeds(request: Request, skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_db)):
+    async def build():
+        # Stats are stored on the feed, so no join with articles is needed
+        feeds = await db.scalars(select(FeedModel).order_by(FeedModel.id).offset(skip).limit(limit))
+        return feeds.all(), {}
     
-    return [
-        {
-            **feed[0].__dict__,
-            'article_count': feed[1],
-            'last_article_date': feed[2]
-        }
-        for feed in feeds
-    ]
+    return await response_cache.respond_async(request, FEED_TABLES, build, _feed_list)
 
 @router.get("/{feed_id}", response_model=FeedWithStats)
-def read_feed(feed_id: int, db: Session = Depends(get_db)):
-    feed = db.query(
-        FeedModel,
-        func.count(Article.id).label('article_count'),
-        func.max(Article.date_published).label('last_article_date')
-    ).outerjoin(Article, Article.source == FeedModel.name
-    ).filter(FeedModel.id == feed_id
-    ).group_by(FeedModel.id).first()
-    
-    if feed is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Feed not found"
-        )
+async def read_feed(feed_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    async def build():
+        feed = await db.get(FeedModel, feed_id)
+        if feed is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Feed not found"
+            )
+        return feed, {}
     
-    return {
-        **feed[0].__dict__,
-        'article_count': feed[1],
-        'last_article_date': feed[2]
-    }
+    return await response_cache.respond_async(request, FEED_TABLES, build, _feed)
 
 @router.put("/{feed_id}", response_model=Feed)
 def update_feed(feed_id: int, feed: FeedUpdate, db: Session = Depends(get_db)):
@@ -124,8 +94,11 @@ def delete_feed(feed_id: int, db: Session = Depends(get_db)):
             detail="Feed not found"
         )
     
+    # Its articles, and their interactions, go with it through ON DELETE
+    # CASCADE, unseen by the session listeners that invalidate cached responses
     db.delete(db_feed)
     db.commit()
+    response_cache.bump(("articles", "interactions"))
     return db_feed
 
 @router.post("/{feed_id}/fetch", response_model=Feed)
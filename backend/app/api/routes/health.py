@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Response, status
+from app.config import settings
+from app.core.response_cache import response_cache
+from app.services.interaction_buffer import interaction_buffer
+from app.services.ml_service import ml_service
+
+router = APIRouter()
+
+@router.get("/live")
+def liveness():
+    """The process is up and serving requests"""
+    return {"status": "ok"}
+
+@router.get("/ready")
+def readiness(response: Response):
+    """Ready once the ML model has been loaded (or found to be untrained)
+    
+    Without ML_WARM_ON_STARTUP nothing loads the model until the first request
+    needs it, so the process is ready straight away.
+    """
+    ready = ml_service.is_loaded or not settings.ML_WARM_ON_STARTUP
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {
+        "status": "ready" if ready else "loading",
+        "model_loaded": ml_service.is_loaded,
+        "model_trained": ml_service.is_trained,
+        "model_version": ml_service.model_version
+    }
+
+@router.get("/metrics")
+def metrics():
+    """Counters of the in-process caches and buffers"""
+    return {
+        "prediction_cache": ml_service.predictions.stats(),
+        "response_cache": response_cache.stats(),
+        "interaction_buffer": interaction_buffer.stats()
+    }
\ No newline at end of file
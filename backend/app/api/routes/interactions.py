@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.dependencies import get_current_user
+from app.db.session import get_async_db
+from app.models.article import Article as ArticleModel
+from app.models.interaction import Interaction as InteractionModel
+from app.models.user import User
+from app.schemas.interaction import Interaction, InteractionBatch, InteractionBatchAccepted, InteractionCreate
+from app.services.interaction_buffer import BufferFull, interaction_buffer
+from app.services.interaction_service import record_interactions
+from datetime import datetime
+
+router = APIRouter()
+
+@router.post("/", response_model=Interaction)
+async def create_interaction(
+    interaction: InteractionCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    article = await db.scalar(select(ArticleModel.id).where(ArticleModel.id == interaction.article_id))
+    if article is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Article not found"
+        )
+    
+    db_interaction = InteractionModel(**interaction.dict(), user_id=current_user.id)
+    await db.run_sync(record_interactions, [db_interaction])
+    await db.refresh(db_interaction)
+    return db_interaction
+
+@router.post("/batch", response_model=InteractionBatchAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def create_interactions_batch(
+    batch: InteractionBatch,
+    current_user: User = Depends(get_current_user)
+):
+    """Queue many interactions for a buffered bulk write.
+    
+    Accepted events are stored within INTERACTION_FLUSH_INTERVAL seconds; events
+    for articles that don't exist are dropped then. Answers 503 with Retry-After
+    when the buffer stays full, so clients should resend the same batch later.
+    """
+    now = datetime.utcnow()
+    rows = [
+        {**interaction.dict(), "user_id": current_user.id, "timestamp": now}
+        for interaction in batch.interactions
+    ]
+    try:
+        await interaction_buffer.put_many(rows)
+    except BufferFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    return {"accepted": len(rows)}
\ No newline at end of file
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List
+from app.schemas.topic import TrendingTopic
+from app.db.session import get_db
+from app.services.trending_service import parse_window, trending_topics
+
+router = APIRouter()
+
+@router.get("/trending", response_model=List[TrendingTopic])
+def read_trending_topics(
+    window: str = "24h",
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Key point terms mentioned by more articles in the last ``window`` than in the one before.
+    
+    ``window`` is a number of minutes, hours or days such as ``90m``, ``24h``
+    or ``7d``, rounded up to whole buckets. Counts come from in-memory
+    sketches, so they can run a little high but never low.
+    """
+    try:
+        span = parse_window(window)
+        trending_topics.sync(db)
+        return trending_topics.trending(span, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
\ No newline at end of file
@@ -1,5 +1,9 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from sqlalchemy.engine import make_url
+from typing import Dict, Optional
+
+# Async drivers used for the same database as the sync URL
+_ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "AI News Aggregator"
@@ -11,12 +15,110 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "ai_news"
     SQLALCHEMY_DATABASE_URL: Optional[str] = None
+    SQLALCHEMY_ASYNC_DATABASE_URL: Optional[str] = None  # defaults to the sync URL with asyncpg or aiosqlite
+    
+    # Connection pools, per engine and process (in-memory SQLite keeps its own)
+    DB_POOL_SIZE: int = 10  # connections kept open
+    DB_MAX_OVERFLOW: int = 20  # extra connections opened under load and closed when returned
+    DB_POOL_TIMEOUT: float = 30.0  # in seconds, wait for a free connection before failing
+    DB_POOL_RECYCLE: int = 1800  # in seconds, replace older connections before server or proxy timeouts do
+    DB_POOL_PRE_PING: bool = True  # check connections on checkout so dropped ones are replaced
+    
+    # Feed ingestion
+    FEED_FETCH_CONCURRENCY: int = 20  # max downloads in flight
+    FEED_FETCH_PER_HOST: int = 4  # max downloads in flight per host
+    FEED_FETCH_TIMEOUT: float = 15.0  # in seconds, per request
+    FEED_FETCH_USER_AGENT: str = "AINewsAggregator/1.0 (+feedparser)"
+    FEED_SEEN_URL_CACHE_SIZE: int = 50000  # recently stored article URLs kept in memory, 0 disables
+    FEED_SCHEDULER_MIN_INTERVAL: int = 300  # in seconds
+    FEED_SCHEDULER_MAX_INTERVAL: int = 86400  # in seconds
+    FEED_SCHEDULER_JITTER: float = 0.1  # +/- fraction applied to every delay
+    FEED_SCHEDULER_TICK: int = 60  # longest sleep between scheduler checks, in seconds
+    NEAR_DUP_THRESHOLD: float = 0.5  # estimated Jaccard similarity of word pairs that makes two articles one story
+    NEAR_DUP_PERMUTATIONS: int = 64  # MinHash signature length, changing it invalidates stored signatures
+    NEAR_DUP_BANDS: int = 16  # LSH bands, must divide the permutations
+    NEAR_DUP_INDEX_SIZE: int = 50000  # recent articles searched for near duplicates
+    
+    # Model training
+    ML_CLASSIFIER: str = "random_forest"  # "random_forest" or "online" (incremental SGD)
+    ML_VECTORIZER: str = "tfidf"  # "tfidf" (two-pass vocabulary) or "hashing"
+    ML_HASHING_FEATURES: int = 2 ** 18
+    ML_TRAINING_CHUNK_SIZE: int = 5000  # rows streamed from the database per chunk
+    ML_TRAINING_MAX_SAMPLES: Optional[int] = 200000  # most recent labeled articles used, None for all
+    ML_TRAINING_WINDOW_DAYS: Optional[int] = None  # only train on articles found in this window
+    ML_CLEAN_PROCESSES: int = 1  # processes cleaning text during training, 1 cleans in-process
+    ML_CLEAN_CACHE_SIZE: int = 4096  # recently cleaned texts memoized for prediction
+    ML_N_JOBS: int = -1  # parallel jobs for forest training, -1 uses every core
+    ML_MODEL_DIR: Optional[str] = None  # defaults to app/ml/models/saved_models
+    ML_MODEL_KEEP_VERSIONS: int = 5  # published versions kept for rollback
+    ML_VERIFY_MODEL_CHECKSUM: bool = True  # check bundle sha256 against its manifest on load
+    ML_WARM_ON_STARTUP: bool = True  # load the model in the background after startup, else on first use
+    ML_PREDICTION_CACHE_SIZE: int = 10000  # predictions kept in memory per process, 0 disables the cache
+    ML_PREDICTION_CACHE_TTL: Optional[int] = 86400  # in seconds, None keeps entries until evicted
+    ML_PREDICTION_CACHE_PATH: Optional[str] = None  # SQLite file shared by the workers on one host
+    
+    # Response caching
+    RESPONSE_CACHE_SIZE: int = 2000  # responses kept in memory per process, 0 disables the cache
+    RESPONSE_CACHE_TTL: Optional[int] = 300  # in seconds, bounds staleness between workers without a shared path
+    RESPONSE_CACHE_PATH: Optional[str] = None  # SQLite file sharing responses and write generations between workers
+    
+    # Search
+    SEARCH_LANGUAGE: str = "english"  # PostgreSQL text search configuration, must match the article_search trigger
+    SEARCH_MAX_LIMIT: int = 100  # results per search page
+    
+    # Related articles
+    RELATED_MERGE_ROWS: int = 10000  # newly ingested articles kept in the scanned tail before merging into the index
+    RELATED_MAX_LIMIT: int = 50  # related articles per request
+    RELATED_MAX_POSTINGS: int = 5000  # heaviest articles kept per feature, bounds the work of one lookup
+    RELATED_RESCORE_CANDIDATES: int = 10000  # best partial matches rescored exactly per lookup
+    
+    # Personalized ranking (sort=for_you)
+    RANKING_CANDIDATES: int = 1000  # newest articles re-ranked per request
+    RANKING_DIMENSIONS: int = 256  # hashed features per article and user, changing it refolds every preference
+    RANKING_INTERACTION_WEIGHTS: Dict[str, float] = {"click": 1.0, "save": 3.0, "share": 3.0, "dismiss": -2.0}
+    RANKING_PREFERENCE_HALF_LIFE_DAYS: float = 30.0  # older interactions count half as much per half-life
+    RANKING_RECENCY_WEIGHT: float = 0.3  # score bonus of a brand new article over an old one
+    RANKING_RECENCY_HALF_LIFE_HOURS: float = 24.0
+    
+    # Trending topics
+    TRENDING_BUCKET_MINUTES: int = 60  # width of one counting bucket
+    TRENDING_MAX_WINDOW_HOURS: int = 168  # longest window served, twice this is kept to compare against
+    TRENDING_SKETCH_WIDTH: int = 1024  # count-min counters per row, changing it discards snapshots
+    TRENDING_SKETCH_DEPTH: int = 4  # count-min rows
+    TRENDING_TERMS_PER_BUCKET: int = 100  # heaviest terms tracked per bucket
+    TRENDING_MIN_COUNT: int = 3  # articles in the window a term needs to trend
+    TRENDING_SNAPSHOT_PATH: str = "var/trending_topics.npz"  # relative to the working directory
+    TRENDING_SNAPSHOT_INTERVAL: int = 300  # in seconds
+    
+    # Interaction ingestion
+    INTERACTION_BATCH_MAX: int = 500  # events accepted per POST /interactions/batch
+    INTERACTION_BUFFER_SIZE: int = 50000  # events buffered in memory before clients are pushed back
+    INTERACTION_FLUSH_SIZE: int = 1000  # events written per transaction
+    INTERACTION_FLUSH_INTERVAL: float = 1.0  # longest time an event waits to be written, in seconds
+    INTERACTION_ENQUEUE_TIMEOUT: float = 2.0  # time a request waits for buffer room before a 503, in seconds
+    INTERACTION_FLUSH_RETRIES: int = 5  # consecutive failed writes retried while the database is unreachable, then the batch is dropped
+    INTERACTION_RETRY_BACKOFF: float = 0.5  # first wait before retrying a failed write, doubled per attempt, in seconds
+    INTERACTION_RETRY_BACKOFF_MAX: float = 30.0  # longest wait between retries, in seconds
+    
+    # Engagement-based priority
+    ENGAGEMENT_SAVE_WEIGHT: int = 2
+    ENGAGEMENT_CLICK_WEIGHT: int = 1
+    ENGAGEMENT_THRESHOLD: int = 5  # weighted interactions that promote an article to High priority
+    ENGAGEMENT_WINDOW_DAYS: int = 7  # only interactions this recent count
     
     @property
     def get_database_url(self) -> str:
         if self.SQLALCHEMY_DATABASE_URL:
             return self.SQLALCHEMY_DATABASE_URL
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
+    
+    @property
+    def get_async_database_url(self) -> str:
+        if self.SQLALCHEMY_ASYNC_DATABASE_URL:
+            return self.SQLALCHEMY_ASYNC_DATABASE_URL
+        url = make_url(self.get_database_url)
+        driver = _ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+        return url.set(drivername=driver).render_as_string(hide_password=False)
 
     class Config:
         env_file = ".env"
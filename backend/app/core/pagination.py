@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Tuple
+import base64
+import binascii
+import json
+
+def encode_cursor(date_found: datetime, id: int) -> str:
+    """Opaque cursor pointing just past the (date_found, id) of the last row served"""
+    raw = json.dumps([date_found.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_cursor; raises ValueError for anything it didn't produce"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        date_found, id = json.loads(raw)
+        date_found, id = datetime.fromisoformat(date_found), int(id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError, OverflowError) as e:
+        raise ValueError("Invalid cursor") from e
+    # The database driver would fail on ids that don't fit a BIGINT
+    if not 0 <= id < 2 ** 63:
+        raise ValueError("Invalid cursor")
+    return date_found, id
\ No newline at end of file
@@ -0,0 +1,220 @@
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from app.config import settings
+from app.core.cache import MemoryCache, SQLiteCache
+from pathlib import Path
+import hashlib
+import itertools
+import sqlite3
+import threading
+
+class MemoryGenerations:
+    """Per-table write generations for a single process"""
+
+    def __init__(self):
+        self._values: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tables: Sequence[str]) -> List[int]:
+        return [self._values.get(table, 0) for table in tables]
+
+    def bump(self, tables: Iterable[str]) -> None:
+        with self._lock:
+            for table in tables:
+                self._values[table] = self._values.get(table, 0) + 1
+
+class SQLiteGenerations:
+    """Per-table write generations in a SQLite file, shared by every worker on the host"""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS generations (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+
+    def get(self, tables: Sequence[str]) -> List[int]:
+        placeholders = ",".join("?" * len(tables))
+        with self._lock:
+            rows = dict(self._conn.execute(
+                f"SELECT name, value FROM generations WHERE name IN ({placeholders})", tuple(tables)
+            ).fetchall())
+        return [rows.get(table, 0) for table in tables]
+
+    def bump(self, tables: Iterable[str]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO generations (name, value) VALUES (?, 1) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+                [(table,) for table in tables]
+            )
+
+class ResponseCache:
+    """Serialized JSON responses keyed by URL and the write generations of the tables behind them.
+
+    Every committed write bumps the generation of the tables it touched (see the
+    session listeners below), which changes the key of every response built
+    from those tables, so stale entries are never served; they just age out.
+    Entries live in an in-process LRU and, with a shared path, in a SQLite file
+    that also holds the generations, so writes in one worker invalidate all of
+    them. Any object with ``get``/``set`` (and ``get``/``bump`` for generations)
+    can be plugged in instead.
+
+    Responses carry a strong ETag and ``If-None-Match`` is answered with 304.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        shared_path: Optional[str] = None
+    ):
+        max_entries = settings.RESPONSE_CACHE_SIZE if max_entries is None else max_entries
+        ttl = settings.RESPONSE_CACHE_TTL if ttl is None else ttl
+        shared_path = shared_path or settings.RESPONSE_CACHE_PATH
+        self.enabled = max_entries > 0
+        self.local = MemoryCache(max_entries, ttl)
+        self.shared = SQLiteCache(shared_path, ttl, max_entries=max_entries * 10) if shared_path and self.enabled else None
+        self.generations = SQLiteGenerations(shared_path) if shared_path else MemoryGenerations()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+
+    def key(self, request: Request, tables: Sequence[str]) -> str:
+        query = sorted(request.query_params.multi_items())
+        generations = self.generations.get(tables)
+        raw = f"{request.url.path}?{query}|{list(zip(tables, generations))}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self.local.get(key)
+        if entry is None and self.shared is not None:
+            entry = self.shared.get(key)
+            if entry is not None:
+                self.local.set(key, entry)
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        self.local.set(key, entry)
+        if self.shared is not None:
+            self.shared.set(key, entry)
+
+    def bump(self, tables: Iterable[str]) -> None:
+        self.generations.bump(sorted(tables))
+
+    def respond(
+        self,
+        request: Request,
+        tables: Sequence[str],
+        build: Callable[[], Tuple[Any, Dict[str, str]]],
+        adapter: TypeAdapter
+    ) -> Response:
+        """Serve the cached response for this request, or build, serialize and cache it
+
+        ``build`` returns the data to serialize with ``adapter`` and any extra
+        headers to send with it; exceptions it raises are not cached.
+        """
+        key, entry = self._lookup(request, tables)
+        if entry is None:
+            entry = self._store(key, *build(), adapter)
+        return self._response(request, entry)
+
+    async def respond_async(
+        self,
+        request: Request,
+        tables: Sequence[str],
+        build: Callable[[], Awaitable[Tuple[Any, Dict[str, str]]]],
+        adapter: TypeAdapter
+    ) -> Response:
+        """``respond`` for async routes, whose ``build`` is a coroutine function"""
+        key, entry = self._lookup(request, tables)
+        if entry is None:
+            entry = self._store(key, *(await build()), adapter)
+        return self._response(request, entry)
+
+    def _lookup(self, request: Request, tables: Sequence[str]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        key = self.key(request, tables) if self.enabled else None
+        entry = self.get(key) if key else None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return key, entry
+
+    def _store(self, key: Optional[str], data: Any, headers: Dict[str, str], adapter: TypeAdapter) -> Dict[str, Any]:
+        body = adapter.dump_json(adapter.validate_python(data, from_attributes=True)).decode()
+        entry = {
+            "body": body,
+            "etag": f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"',
+            "headers": headers
+        }
+        if key:
+            self.set(key, entry)
+        return entry
+
+    def _response(self, request: Request, entry: Dict[str, Any]) -> Response:
+        # no-cache lets clients keep the body but makes them revalidate every time
+        headers = {**entry["headers"], "ETag": entry["etag"], "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), entry["etag"]):
+            with self._lock:
+                self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry["body"], media_type="application/json", headers=headers)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "shared": self.shared is not None,
+            "entries": len(self.local),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    return "*" in candidates or etag in [tag[2:] if tag.startswith("W/") else tag for tag in candidates]
+
+response_cache = ResponseCache()
+
+# Track the tables each session writes to and bump their generations once the
+# transaction commits. Listening on the Session class covers every session,
+# including background tasks and bulk statements run through Session.execute.
+_TOUCHED = "response_cache_tables"
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session, flush_context):
+    tables = session.info.setdefault(_TOUCHED, set())
+    for instance in itertools.chain(session.new, session.dirty, session.deleted):
+        table = getattr(instance, "__tablename__", None)
+        if table:
+            tables.add(table)
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_tables(state):
+    if state.is_insert or state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        if table is not None:
+            state.session.info.setdefault(_TOUCHED, set()).add(table.name)
+
+@event.listens_for(Session, "after_commit")
+def _bump_generations(session):
+    tables = session.info.pop(_TOUCHED, None)
+    if tables:
+        response_cache.bump(tables)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_tables(session):
+    session.info.pop(_TOUCHED, None)
\ No newline at end of file
@@ -0,0 +1,141 @@
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+from app.config import settings
+import heapq
+import itertools
+import random
+import time
+
+class FeedState:
+    """Scheduling state for one feed"""
+    __slots__ = ("base_interval", "interval", "failures", "due")
+
+    def __init__(self, base_interval: float, interval: float):
+        self.base_interval = base_interval
+        self.interval = interval
+        self.failures = 0
+        self.due = 0.0
+
+class FeedScheduler:
+    """Min-heap of feeds keyed by the time they are next due.
+
+    Each feed starts at its ``update_frequency``. After every fetch the interval
+    shrinks when the feed published something new and grows when it didn't,
+    clamped to [min_interval, max_interval]. Failures back off exponentially
+    without touching the learned interval, and every delay is jittered so feeds
+    added together drift apart instead of firing in lockstep.
+
+    ``clock`` returns the current time in epoch seconds; pass a fake to drive the
+    scheduler deterministically.
+    """
+
+    SPEEDUP = 0.5  # interval multiplier when a fetch found new entries
+    SLOWDOWN = 1.5  # interval multiplier when it found nothing
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.time,
+        rng: Optional[random.Random] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        jitter: Optional[float] = None
+    ):
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self.min_interval = min_interval or settings.FEED_SCHEDULER_MIN_INTERVAL
+        self.max_interval = max_interval or settings.FEED_SCHEDULER_MAX_INTERVAL
+        self.jitter = settings.FEED_SCHEDULER_JITTER if jitter is None else jitter
+        self._heap: List[tuple] = []
+        self._states: Dict[int, FeedState] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, feed_id: int) -> bool:
+        return feed_id in self._states
+
+    def add(self, feed_id: int, base_interval: float, last_fetched: Optional[datetime] = None) -> None:
+        """Start tracking a feed, due one interval after its last fetch (or soon if never fetched)"""
+        base = self._clamp(base_interval)
+        self._states[feed_id] = FeedState(base, base)
+        now = self.clock()
+        if last_fetched is None:
+            # Spread brand new feeds over a fraction of their interval
+            due = now + self.rng.uniform(0, base * self.jitter)
+        else:
+            last = last_fetched.replace(tzinfo=timezone.utc).timestamp()
+            due = max(now, last + self._jittered(base))
+        self._push(feed_id, due)
+
+    def remove(self, feed_id: int) -> None:
+        # Heap entries for removed feeds are discarded lazily in pop_due
+        self._states.pop(feed_id, None)
+
+    def sync(self, feeds: Iterable) -> None:
+        """Track exactly the given feeds: add new ones, drop missing ones, pick up new frequencies"""
+        seen = set()
+        for feed in feeds:
+            seen.add(feed.id)
+            base = feed.update_frequency or settings.FEED_SCHEDULER_MIN_INTERVAL
+            state = self._states.get(feed.id)
+            if state is None:
+                self.add(feed.id, base, feed.last_fetched)
+            elif self._clamp(base) != state.base_interval:
+                state.base_interval = state.interval = self._clamp(base)
+        for feed_id in list(self._states):
+            if feed_id not in seen:
+                self.remove(feed_id)
+
+    def pop_due(self) -> List[int]:
+        """Remove and return the ids of every feed whose due time has passed"""
+        now = self.clock()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, feed_id = heapq.heappop(self._heap)
+            state = self._states.get(feed_id)
+            if state is None or state.due != when:
+                continue  # removed or rescheduled since this entry was pushed
+            due.append(feed_id)
+        return due
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Seconds until the earliest feed is due, or None when nothing is scheduled"""
+        while self._heap:
+            when, _, feed_id = self._heap[0]
+            state = self._states.get(feed_id)
+            if state is not None and state.due == when:
+                return max(0.0, when - self.clock())
+            heapq.heappop(self._heap)
+        return None
+
+    def record_result(self, feed_id: int, new_entries: Optional[int]) -> None:
+        """Reschedule a fetched feed; ``new_entries`` is None when the fetch failed"""
+        state = self._states.get(feed_id)
+        if state is None:
+            return
+
+        if new_entries is None:
+            state.failures += 1
+            delay = min(self.max_interval, state.interval * 2 ** state.failures)
+        else:
+            state.failures = 0
+            factor = self.SPEEDUP if new_entries > 0 else self.SLOWDOWN
+            state.interval = self._clamp(state.interval * factor)
+            delay = state.interval
+
+        self._push(feed_id, self.clock() + self._jittered(delay))
+
+    def interval(self, feed_id: int) -> float:
+        """Current learned interval of a feed, in seconds"""
+        return self._states[feed_id].interval
+
+    def _push(self, feed_id: int, due: float) -> None:
+        self._states[feed_id].due = due
+        heapq.heappush(self._heap, (due, next(self._counter), feed_id))
+
+    def _jittered(self, delay: float) -> float:
+        return delay * (1 + self.rng.uniform(-self.jitter, self.jitter))
+
+    def _clamp(self, interval: float) -> float:
+        return float(min(self.max_interval, max(self.min_interval, interval)))
\ No newline at end of file
@@ -1,49 +1,136 @@
-from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
+from typing import List
+from app.config import settings
+from app.core.scheduler import FeedScheduler
 from app.db.session import SessionLocal
-from app.services.feed_service import FeedService
+from app.ml.training import train_new_version
+from app.models.feed import Feed
+from app.services.feed_service import FeedService, reconcile_feed_counts
+from app.services.interaction_service import reconcile_interaction_counts
 from app.services.ml_service import ml_service
+from app.services.related_service import related_articles
+from app.services.trending_service import trending_topics
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 import asyncio
 import logging
+import multiprocessing
 
 logger = logging.getLogger(__name__)
 
+def run_due_feeds(scheduler: FeedScheduler) -> None:
+    """Fetch every feed the scheduler says is due and feed the outcomes back into it"""
+    db = SessionLocal()
+    due_ids: List[int] = []
+    try:
+        feeds = db.query(Feed).filter(Feed.is_active == True).all()
+        scheduler.sync(feeds)
+        due_ids = scheduler.pop_due()
+        if not due_ids:
+            return
+        
+        due = set(due_ids)
+        stats = FeedService(db).fetch_feeds([feed for feed in feeds if feed.id in due])
+        for feed_id in due_ids:
+            scheduler.record_result(feed_id, stats["per_feed"].get(feed_id))
+        
+        skipped = stats["not_modified"] + stats["unchanged"]
+        logger.info(
+            f"Fetched {stats['feeds']} due feeds: {stats['new_articles']} new articles, "
+            f"{skipped} unchanged, {stats['failed']} failed, "
+            f"{stats['bytes_downloaded']} bytes downloaded"
+        )
+    except Exception:
+        # Put the popped feeds back on the heap with error backoff
+        for feed_id in due_ids:
+            scheduler.record_result(feed_id, None)
+        raise
+    finally:
+        db.close()
+
 async def periodic_feed_updates():
-    """Periodically update all active feeds"""
+    """Fetch each active feed when it is due according to its adaptive schedule"""
+    scheduler = FeedScheduler()
     while True:
         try:
-            db = SessionLocal()
-            feed_service = FeedService(db)
-            feed_service.fetch_all_feeds()
-            logger.info("Completed periodic feed update")
+            # Keep the whole cycle (including DB writes) off the event loop
+            await asyncio.to_thread(run_due_feeds, scheduler)
         except Exception as e:
             logger.error(f"Error in periodic feed update: {e}")
-        finally:
-            db.close()
         
-        # Wait for 1 hour before next update
-        await asyncio.sleep(3600)
+        # Wake up when the next feed is due, but check regularly for new feeds
+        wait = scheduler.seconds_until_next()
+        if wait is None or wait > settings.FEED_SCHEDULER_TICK:
+            wait = settings.FEED_SCHEDULER_TICK
+        await asyncio.sleep(wait)
+
+def update_from_interactions() -> None:
+    db = SessionLocal()
+    try:
+        ml_service.update_from_interactions(db)
+    finally:
+        db.close()
+
+def rebuild_related_index() -> None:
+    db = SessionLocal()
+    try:
+        related_articles.rebuild(db)
+    finally:
+        db.close()
+
+def reconcile_counters() -> None:
+    db = SessionLocal()
+    try:
+        reconcile_interaction_counts(db)
+        reconcile_feed_counts(db)
+    finally:
+        db.close()
 
 async def periodic_model_training():
     """Periodically retrain the ML model based on recent interactions"""
+    loop = asyncio.get_running_loop()
+    # Spawned rather than forked so the worker doesn't inherit the event loop,
+    # DB connections or the live model
+    training_pool = ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        while True:
+            try:
+                # Repair any drift in the article and feed counters
+                await asyncio.to_thread(reconcile_counters)
+                # Update model based on interactions
+                await asyncio.to_thread(update_from_interactions)
+                # Retrain in a separate process so the CPU-bound fit never blocks
+                # the event loop, then hot swap the published version in
+                version = await loop.run_in_executor(training_pool, train_new_version)
+                await asyncio.to_thread(ml_service.reload, version)
+                # Vectors from the old vectorizer don't compare with new ones
+                await asyncio.to_thread(rebuild_related_index)
+                logger.info(f"Completed periodic model training, now serving {version}")
+            except Exception as e:
+                logger.error(f"Error in periodic model training: {e}")
+            
+            # Wait for 24 hours before next training
+            await asyncio.sleep(86400)
+    finally:
+        # Cancelled on shutdown: don't leave the worker process behind
+        training_pool.shutdown(wait=False, cancel_futures=True)
+
+async def periodic_trending_snapshots():
+    """Save the trending topic counts regularly so a restart picks up where they were"""
     while True:
+        await asyncio.sleep(settings.TRENDING_SNAPSHOT_INTERVAL)
         try:
-            db = SessionLocal()
-            # Update model based on interactions
-            ml_service.update_from_interactions(db)
-            # Retrain model with all data
-            ml_service.train_model(db)
-            logger.info("Completed periodic model training")
+            await asyncio.to_thread(trending_topics.save)
         except Exception as e:
-            logger.error(f"Error in periodic model training: {e}")
-        finally:
-            db.close()
-        
-        # Wait for 24 hours before next training
-        await asyncio.sleep(86400)
+            logger.error(f"Error saving the trending topics snapshot: {e}")
 
-def start_background_tasks(background_tasks: BackgroundTasks):
-    """Start all background tasks"""
-    background_tasks.add_task(periodic_feed_updates)
-    background_tasks.add_task(periodic_model_training) 
\ No newline at end of file
+def start_background_tasks() -> List[asyncio.Task]:
+    """Start all background tasks on the running event loop, returning them for cancellation on shutdown"""
+    return [
+        asyncio.create_task(periodic_feed_updates()),
+        asyncio.create_task(periodic_model_training()),
+        asyncio.create_task(periodic_trending_snapshots())
+    ]
\ No newline at end of file
@@ -4,6 +4,7 @@ from app.models.user import User
 from app.models.article import Article
 from app.models.feed import Feed
 from app.models.interaction import Interaction
+from app.models.user_preference import UserPreference
 
 def init_db(db: Session) -> None:
     # Create a default admin user
@@ -1,13 +1,44 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from typing import Any, AsyncGenerator, Dict
 from app.config import settings
 
-engine = create_engine(settings.get_database_url)
+def pool_options(url: str) -> Dict[str, Any]:
+    """Connection pool settings for an engine on ``url``"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        # One shared in-memory database, pooled by SQLAlchemy's SQLite defaults
+        return {}
+    options: Dict[str, Any] = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING
+    }
+    if parsed.get_driver_name() == "aiosqlite":
+        # Which otherwise opens a connection, and a thread, per session
+        options["poolclass"] = AsyncAdaptedQueuePool
+    return options
+
+engine = create_engine(settings.get_database_url, **pool_options(settings.get_database_url))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# The same database for async routes. Loaded attributes stay valid after a
+# commit because async code can't lazily reload them.
+async_engine = create_async_engine(settings.get_async_database_url, **pool_options(settings.get_async_database_url))
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
@@ -1,7 +1,13 @@
-from fastapi import FastAPI, BackgroundTasks
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import users, articles, feeds, auth
+from app.api.routes import users, articles, feeds, auth, health, interactions, topics
+from app.config import settings
 from app.core.tasks import start_background_tasks
+from app.db.session import async_engine
+from app.services.interaction_buffer import interaction_buffer
+from app.services.ml_service import ml_service
+from app.services.trending_service import trending_topics
+import asyncio
 import logging
 
 # Configure logging
@@ -33,6 +39,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
@@ -40,12 +47,31 @@ app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/users", tags=["Users"])
 app.include_router(articles.router, prefix="/articles", tags=["Articles"])
 app.include_router(feeds.router, prefix="/feeds", tags=["Feeds"])
+app.include_router(interactions.router, prefix="/interactions", tags=["Interactions"])
+app.include_router(topics.router, prefix="/topics", tags=["Topics"])
+app.include_router(health.router, prefix="/health", tags=["Health"])
 
 @app.on_event("startup")
 async def startup_event():
     """Start background tasks on application startup"""
-    background_tasks = BackgroundTasks()
-    start_background_tasks(background_tasks)
+    # Kept on the app so shutdown can stop them
+    app.state.background_tasks = start_background_tasks()
+    interaction_buffer.start()
+    
+    if settings.ML_WARM_ON_STARTUP:
+        # Load the model in a thread after startup instead of at import time;
+        # /health/ready reports when it is done
+        app.state.ml_warm_up = asyncio.create_task(asyncio.to_thread(ml_service.warm_up))
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write out buffered interactions and trending counts before the process exits"""
+    for task in app.state.background_tasks:
+        task.cancel()
+    await asyncio.gather(*app.state.background_tasks, return_exceptions=True)
+    await interaction_buffer.stop()
+    await asyncio.to_thread(trending_topics.save)
+    await async_engine.dispose()
 
 @app.get("/")
 def root():
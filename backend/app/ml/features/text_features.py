@@ -1,34 +1,92 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from typing import List, Dict, Any
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.utils import murmurhash3_32
+from scipy import sparse
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Iterable, List, Dict, Any, Optional
+from app.config import settings
 import numpy as np
 import re
 
+# Patterns compiled once; the removal order matches the original cleaner:
+# URLs first, then special characters and digits (the last two commute)
+_URLS = re.compile(r'http\S+|www\S+|https\S+')
+_SPECIAL = re.compile(r'[^\w\s]')
+_DIGITS = re.compile(r'\d+')
+# The ASCII characters either of those two patterns removes, for bytes.translate
+_ASCII_JUNK = bytes(c for c in range(128) if _SPECIAL.match(chr(c)) or _DIGITS.match(chr(c)))
+
+def clean_text(text: str) -> str:
+    """Lowercase, remove URLs, special characters and digits, and collapse whitespace"""
+    text = text.lower()
+    # Substring checks are far cheaper than scanning every text with the regex
+    if 'http' in text or 'www' in text:
+        text = _URLS.sub('', text)
+    if text.isascii():
+        text = text.encode('ascii').translate(None, _ASCII_JUNK).decode('ascii')
+    else:
+        text = _DIGITS.sub('', _SPECIAL.sub('', text))
+    return ' '.join(text.split())
+
+# Prediction cleans the same text several times (cache key, features, key terms)
+_clean_text_cached = lru_cache(maxsize=settings.ML_CLEAN_CACHE_SIZE)(clean_text)
+
+def clean_texts(texts: List[str], pool: Optional[Executor] = None) -> List[str]:
+    """Clean a batch of texts, spread over ``pool`` when one is given"""
+    if pool is None or len(texts) < 1000:
+        return [clean_text(text) for text in texts]
+    return list(pool.map(clean_text, texts, chunksize=500))
+
 class TextFeatureExtractor:
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(
+    def __init__(self, mode: Optional[str] = None):
+        """``mode`` is "tfidf" (learned vocabulary) or "hashing" (stateless hashed features)"""
+        mode = mode or settings.ML_VECTORIZER
+        if mode == "hashing":
+            self.vectorizer = make_pipeline(
+                HashingVectorizer(
+                    n_features=settings.ML_HASHING_FEATURES,
+                    stop_words='english',
+                    ngram_range=(1, 2),
+                    alternate_sign=False,
+                    norm=None,
+                    dtype=np.float32
+                ),
+                TfidfTransformer()
+            )
+        elif mode == "tfidf":
+            self.vectorizer = self._tfidf_vectorizer()
+        else:
+            raise ValueError(f"Unknown vectorizer mode: {mode}")
+        self.is_fitted = False
+    
+    @staticmethod
+    def _tfidf_vectorizer(**params) -> TfidfVectorizer:
+        return TfidfVectorizer(
             max_features=1000,
             stop_words='english',
             ngram_range=(1, 2),
-            min_df=2
+            min_df=2,
+            dtype=np.float32,
+            **params
         )
-        self.is_fitted = False
+    
+    @property
+    def mode(self) -> str:
+        # Derived from the vectorizer so it survives save/load
+        return "hashing" if isinstance(self.vectorizer, Pipeline) else "tfidf"
     
     def clean_text(self, text: str) -> str:
-        """Clean and preprocess text"""
-        # Convert to lowercase
-        text = text.lower()
-        # Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-        # Remove special characters and digits
-        text = re.sub(r'[^\w\s]', '', text)
-        text = re.sub(r'\d+', '', text)
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        return text
+        """Clean and preprocess text, memoizing recently seen texts"""
+        return _clean_text_cached(text)
     
-    def extract_features(self, texts: List[str], fit: bool = False) -> np.ndarray:
-        """Extract TF-IDF features from texts"""
-        cleaned_texts = [self.clean_text(text) for text in texts]
+    def extract_features(self, texts: List[str], fit: bool = False) -> sparse.csr_matrix:
+        """Extract TF-IDF features from texts as a float32 CSR matrix"""
+        if fit:
+            cleaned_texts = clean_texts(texts)
+        else:
+            cleaned_texts = [self.clean_text(text) for text in texts]
         
         if fit:
             features = self.vectorizer.fit_transform(cleaned_texts)
@@ -38,12 +96,79 @@ class TextFeatureExtractor:
                 raise ValueError("Vectorizer must be fitted before transform")
             features = self.vectorizer.transform(cleaned_texts)
         
-        return features.toarray()
+        # Vectorizers pickled before the switch to float32 still emit float64
+        return features.astype(np.float32, copy=False).tocsr()
+    
+    def fit_transform_chunks(self, chunks: Callable[[], Iterable[List[str]]]) -> sparse.csr_matrix:
+        """Fit on texts streamed in chunks and return their features.
+        
+        ``chunks`` is called once per pass and must yield the same texts each time.
+        Only one chunk of raw text is held at a time: the TF-IDF vocabulary is
+        chosen from term counts in a first pass and the second pass transforms
+        chunk by chunk, so the only corpus-sized object is the sparse result.
+        Hashing mode needs a single pass. With ML_CLEAN_PROCESSES above 1 text
+        cleaning is spread over a process pool for the duration of the fit.
+        """
+        pool = None
+        if settings.ML_CLEAN_PROCESSES > 1:
+            pool = ProcessPoolExecutor(max_workers=settings.ML_CLEAN_PROCESSES)
+        try:
+            if self.mode == "hashing":
+                hashing, tfidf = (step for _, step in self.vectorizer.steps)
+                counts = sparse.vstack([
+                    hashing.transform(clean_texts(chunk, pool))
+                    for chunk in chunks()
+                ], format='csr')
+                features = tfidf.fit_transform(counts)
+            else:
+                self.vectorizer = self._fit_vocabulary(chunks, pool)
+                features = sparse.vstack([
+                    self.vectorizer.transform(clean_texts(chunk, pool))
+                    for chunk in chunks()
+                ], format='csr')
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        self.is_fitted = True
+        return features.astype(np.float32, copy=False)
+    
+    def _fit_vocabulary(
+        self,
+        chunks: Callable[[], Iterable[List[str]]],
+        pool: Optional[Executor] = None
+    ) -> TfidfVectorizer:
+        """Pick the vocabulary and IDF weights the way TfidfVectorizer.fit would, one chunk at a time"""
+        analyzer = self.vectorizer.build_analyzer()
+        term_counts: Counter = Counter()
+        doc_counts: Counter = Counter()
+        n_docs = 0
+        for chunk in chunks():
+            for text in clean_texts(chunk, pool):
+                terms = analyzer(text)
+                term_counts.update(terms)
+                doc_counts.update(set(terms))
+                n_docs += 1
+        
+        min_df = self.vectorizer.min_df
+        kept = [term for term, df in doc_counts.items() if df >= min_df]
+        if not kept:
+            raise ValueError("After pruning, no terms remain. Try a lower min_df.")
+        kept.sort(key=lambda term: (-term_counts[term], term))
+        vocabulary = sorted(kept[:self.vectorizer.max_features])
+        
+        vectorizer = self._tfidf_vectorizer(vocabulary={term: i for i, term in enumerate(vocabulary)})
+        # Smoothed IDF, identical to TfidfTransformer's default
+        df = np.array([doc_counts[term] for term in vocabulary], dtype=np.float64)
+        vectorizer.idf_ = np.log((1 + n_docs) / (1 + df)) + 1
+        return vectorizer
     
     def get_feature_names(self) -> List[str]:
         """Get feature names (vocabulary)"""
         if not self.is_fitted:
             raise ValueError("Vectorizer must be fitted before getting feature names")
+        if self.mode == "hashing":
+            raise ValueError("Hashed features have no vocabulary")
         return self.vectorizer.get_feature_names_out()
     
     def get_top_terms(self, text: str, n: int = 5) -> List[Dict[str, Any]]:
@@ -54,16 +179,51 @@ class TextFeatureExtractor:
         # Extract features for the text
         features = self.extract_features([text])
         
-        # Get feature names
-        feature_names = self.get_feature_names()
+        return self.top_terms_from_features(features, n, texts=[text])[0]
+    
+    def top_terms_from_features(
+        self,
+        features: sparse.csr_matrix,
+        n: int = 5,
+        texts: Optional[List[str]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Get the top n terms of every row of an already extracted feature matrix
         
-        # Get indices of top n scores
-        top_indices = np.argsort(features[0])[-n:][::-1]
+        Hashing mode has no vocabulary to look indices up in, so it needs the
+        original ``texts`` to map hashed indices back to terms.
+        """
+        if not self.is_fitted:
+            raise ValueError("Vectorizer must be fitted before getting top terms")
         
-        return [
-            {
-                "term": feature_names[idx],
-                "score": float(features[0][idx])
-            }
-            for idx in top_indices
-        ] 
\ No newline at end of file
+        if self.mode == "hashing":
+            if texts is None:
+                raise ValueError("Texts are required to name hashed features")
+            row_names = [self._hashed_term_names(text) for text in texts]
+        else:
+            # Get feature names
+            feature_names = self.get_feature_names()
+            row_names = [feature_names] * features.shape[0]
+        
+        top_terms = []
+        for row in range(features.shape[0]):
+            # Only the nonzero entries of the row can be top terms
+            start, end = features.indptr[row], features.indptr[row + 1]
+            scores = features.data[start:end]
+            top = np.argsort(scores)[-n:][::-1]
+            top_terms.append([
+                {
+                    "term": row_names[row][features.indices[start + idx]],
+                    "score": float(scores[idx])
+                }
+                for idx in top
+            ])
+        return top_terms
+    
+    def _hashed_term_names(self, text: str) -> Dict[int, str]:
+        """Map each hashed feature index of a text back to the term that produced it"""
+        hashing = self.vectorizer.steps[0][1]
+        n_features = hashing.n_features
+        return {
+            abs(murmurhash3_32(term, positive=False)) % n_features: term
+            for term in hashing.build_analyzer()(self.clean_text(text))
+        }
\ No newline at end of file
@@ -1,13 +1,25 @@
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import LabelEncoder
 from app.ml.features.text_features import TextFeatureExtractor
-from typing import List, Dict, Any, Optional
+from app.config import settings
+from app.ml.registry import MANIFEST_FILE
+from datetime import datetime
+from typing import Callable, Iterable, List, Dict, Any, Optional, Tuple
 import numpy as np
+import hashlib
 import joblib
+import json
+import os
+import sklearn
 from pathlib import Path
 
+BUNDLE_FORMAT = 1
+BUNDLE_FILE = "model.joblib"
+
 class ArticleClassifier:
-    def __init__(self, model_dir: Optional[Path] = None):
+    KIND = "random_forest"
+    
+    def __init__(self, model_dir: Optional[Path] = None, n_jobs: Optional[int] = None):
         self.text_features = TextFeatureExtractor()
         self.category_classifier = RandomForestClassifier(
             n_estimators=100,
@@ -20,6 +32,9 @@ class ArticleClassifier:
             random_state=42
         )
         self.category_encoder = LabelEncoder()
+        self.n_jobs = n_jobs  # parallelism of forest training; prediction stays single threaded
+        self.manifest: Optional[Dict[str, Any]] = None
+        self.revision: Optional[str] = None  # names the exact weights in use, set by MLService
         self.is_fitted = False
         self.model_dir = model_dir or Path(__file__).parent / "saved_models"
         self.model_dir.mkdir(parents=True, exist_ok=True)
@@ -28,6 +43,36 @@ class ArticleClassifier:
         """Train the classifiers"""
         # Extract text features
         features = self.text_features.extract_features(texts, fit=True)
+        self._fit_classifiers(features, categories, priorities)
+    
+    def fit_stream(self, batches: Callable[[], Iterable[Tuple[List[str], List[str], List[str]]]]) -> None:
+        """Train from (texts, categories, priorities) batches without holding all texts in memory
+        
+        ``batches`` is called once per pass over the data and must yield the same
+        rows in the same order each time.
+        """
+        categories: List[str] = []
+        priorities: List[str] = []
+        
+        def texts() -> Iterable[List[str]]:
+            # Labels are collected on every pass but only the last one is kept,
+            # so they line up with the rows of the returned feature matrix
+            categories.clear()
+            priorities.clear()
+            for batch_texts, batch_categories, batch_priorities in batches():
+                categories.extend(batch_categories)
+                priorities.extend(batch_priorities)
+                yield batch_texts
+        
+        features = self.text_features.fit_transform_chunks(texts)
+        if features.shape[0] == 0:
+            raise ValueError("No training data")
+        self._fit_classifiers(features, categories, priorities)
+    
+    def _fit_classifiers(self, features, categories: List[str], priorities: List[str]) -> None:
+        forests = (self.category_classifier, self.priority_classifier)
+        for forest in forests:
+            forest.set_params(n_jobs=self.n_jobs)
         
         # Fit category classifier
         encoded_categories = self.category_encoder.fit_transform(categories)
@@ -36,48 +81,119 @@ class ArticleClassifier:
         # Fit priority classifier
         self.priority_classifier.fit(features, [1 if p == "High" else 0 for p in priorities])
         
+        # Small prediction batches are faster without a worker pool
+        for forest in forests:
+            forest.set_params(n_jobs=None)
+        
         self.is_fitted = True
     
     def predict(self, text: str) -> Dict[str, Any]:
         """Predict category and priority for a new article"""
+        return self.predict_batch([text])[0]
+    
+    def predict_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Predict category and priority for many articles with one pass over each model"""
         if not self.is_fitted:
             raise ValueError("Model must be fitted before prediction")
+        if not texts:
+            return []
         
         # Extract features
-        features = self.text_features.extract_features([text])
+        features = self.text_features.extract_features(texts)
         
         # Predict category
-        category_proba = self.category_classifier.predict_proba(features)[0]
-        category_idx = np.argmax(category_proba)
-        category = self.category_encoder.inverse_transform([category_idx])[0]
+        category_proba = self.category_classifier.predict_proba(features)
+        category_idx = np.argmax(category_proba, axis=1)
+        categories = self.category_encoder.inverse_transform(category_idx)
         
         # Predict priority
-        priority_proba = self.priority_classifier.predict_proba(features)[0]
-        priority = "High" if priority_proba[1] > 0.7 else "Low"
-        
-        # Get key terms
-        key_terms = self.text_features.get_top_terms(text)
-        
-        return {
-            "category": category,
-            "category_confidence": float(category_proba[category_idx]),
-            "priority": priority,
-            "priority_confidence": float(priority_proba[1]),
-            "key_terms": key_terms
-        }
+        priority_proba = self.priority_classifier.predict_proba(features)[:, 1]
+        
+        # Get key terms from the same feature rows
+        key_terms = self.text_features.top_terms_from_features(features, texts=texts)
+        
+        return [
+            {
+                "category": categories[i],
+                "category_confidence": float(category_proba[i, category_idx[i]]),
+                "priority": "High" if priority_proba[i] > 0.7 else "Low",
+                "priority_confidence": float(priority_proba[i]),
+                "key_terms": key_terms[i]
+            }
+            for i in range(len(texts))
+        ]
     
     def save(self) -> None:
-        """Save the model to disk"""
+        """Save the model to disk as a single bundle plus a manifest"""
         if not self.is_fitted:
             raise ValueError("Model must be fitted before saving")
         
-        joblib.dump(self.category_classifier, self.model_dir / "category_classifier.pkl")
-        joblib.dump(self.priority_classifier, self.model_dir / "priority_classifier.pkl")
-        joblib.dump(self.category_encoder, self.model_dir / "category_encoder.pkl")
-        joblib.dump(self.text_features.vectorizer, self.model_dir / "vectorizer.pkl")
+        bundle_path = self.model_dir / BUNDLE_FILE
+        tmp_path = self.model_dir / f".{BUNDLE_FILE}.tmp"
+        # Uncompressed so numpy arrays can be memory-mapped on load
+        joblib.dump(
+            {
+                "format": BUNDLE_FORMAT,
+                "category_classifier": self.category_classifier,
+                "priority_classifier": self.priority_classifier,
+                "category_encoder": self.category_encoder,
+                "vectorizer": self.text_features.vectorizer
+            },
+            tmp_path
+        )
+        os.replace(tmp_path, bundle_path)
+        
+        self.manifest = {
+            "format": BUNDLE_FORMAT,
+            "classifier": self.KIND,
+            "created_at": datetime.utcnow().isoformat(),
+            "sklearn_version": sklearn.__version__,
+            "vectorizer": self.text_features.mode,
+            "categories": [str(c) for c in self.category_encoder.classes_],
+            "files": {
+                BUNDLE_FILE: {
+                    "sha256": _sha256(bundle_path),
+                    "bytes": bundle_path.stat().st_size
+                }
+            }
+        }
+        # The manifest is written last: a directory without one is incomplete
+        tmp_path = self.model_dir / f".{MANIFEST_FILE}.tmp"
+        tmp_path.write_text(json.dumps(self.manifest, indent=2))
+        os.replace(tmp_path, self.model_dir / MANIFEST_FILE)
+    
+    def load(self, mmap: bool = True) -> None:
+        """Load the model from disk
+        
+        Bundles are verified against their manifest checksum and, with ``mmap``,
+        their arrays are memory-mapped read-only so every worker process
+        loading the same bundle shares the same physical pages.
+        """
+        manifest_path = self.model_dir / MANIFEST_FILE
+        if not manifest_path.exists():
+            self._load_legacy()
+            return
+        
+        manifest = json.loads(manifest_path.read_text())
+        if manifest.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"Unsupported model bundle format: {manifest.get('format')}")
+        
+        bundle_path = self.model_dir / BUNDLE_FILE
+        if settings.ML_VERIFY_MODEL_CHECKSUM:
+            if _sha256(bundle_path) != manifest["files"][BUNDLE_FILE]["sha256"]:
+                raise ValueError(f"Checksum mismatch for model bundle {bundle_path}")
+        
+        bundle = joblib.load(bundle_path, mmap_mode="r" if mmap else None)
+        self.category_classifier = bundle["category_classifier"]
+        self.priority_classifier = bundle["priority_classifier"]
+        self.category_encoder = bundle["category_encoder"]
+        self.text_features.vectorizer = bundle["vectorizer"]
+        self.text_features.is_fitted = True
+        self.manifest = manifest
+        self.is_fitted = True
     
-    def load(self) -> None:
-        """Load the model from disk"""
+    def _load_legacy(self) -> None:
+        """Load the four separate pickles written before the bundle format"""
         try:
             self.category_classifier = joblib.load(self.model_dir / "category_classifier.pkl")
             self.priority_classifier = joblib.load(self.model_dir / "priority_classifier.pkl")
@@ -86,4 +202,31 @@ class ArticleClassifier:
             self.text_features.is_fitted = True
             self.is_fitted = True
         except FileNotFoundError:
-            raise ValueError("No saved model found. Train the model first.") 
\ No newline at end of file
+            raise ValueError("No saved model found. Train the model first.")
+
+def create_classifier(kind: Optional[str] = None, **kwargs) -> ArticleClassifier:
+    """Instantiate the classifier implementation configured by ML_CLASSIFIER (or ``kind``)"""
+    kind = kind or settings.ML_CLASSIFIER
+    if kind == ArticleClassifier.KIND:
+        return ArticleClassifier(**kwargs)
+    if kind == "online":
+        from app.ml.models.online_classifier import OnlineArticleClassifier
+        return OnlineArticleClassifier(**kwargs)
+    raise ValueError(f"Unknown classifier: {kind}")
+
+def load_classifier(model_dir: Path) -> ArticleClassifier:
+    """Load a saved model with the implementation recorded in its manifest"""
+    manifest_path = model_dir / MANIFEST_FILE
+    kind = ArticleClassifier.KIND
+    if manifest_path.exists():
+        kind = json.loads(manifest_path.read_text()).get("classifier", kind)
+    classifier = create_classifier(kind, model_dir=model_dir)
+    classifier.load()
+    return classifier
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
\ No newline at end of file
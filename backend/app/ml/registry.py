@@ -0,0 +1,84 @@
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from app.config import settings
+import os
+import shutil
+import uuid
+
+DEFAULT_MODEL_ROOT = Path(__file__).parent / "models" / "saved_models"
+# Written last by a model's save, so only complete versions have one
+MANIFEST_FILE = "manifest.json"
+
+class ModelRegistry:
+    """Versioned model directories with an atomically switched ``CURRENT`` pointer.
+
+    Every training run writes into a fresh ``versions/<version>`` directory and
+    only becomes visible once ``publish`` renames the pointer file over the old
+    one, so readers either see the previous complete model or the new one.
+    The newest ``keep`` versions are retained for rollback. Directories
+    without a manifest, left by failed or killed runs, are never listed.
+    """
+
+    def __init__(self, root: Optional[Path] = None, keep: Optional[int] = None):
+        self.root = Path(root or settings.ML_MODEL_DIR or DEFAULT_MODEL_ROOT)
+        self.keep = keep or settings.ML_MODEL_KEEP_VERSIONS
+        self.versions_dir = self.root / "versions"
+        self.pointer = self.root / "CURRENT"
+
+    def create_version(self) -> str:
+        """Create an empty directory for a new model version and return its name"""
+        # Timestamp first so versions sort chronologically by name
+        version = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}"
+        self.path(version).mkdir(parents=True)
+        return version
+
+    def discard(self, version: str) -> None:
+        """Remove the directory of a version whose training failed"""
+        shutil.rmtree(self.path(version), ignore_errors=True)
+
+    def path(self, version: str) -> Path:
+        return self.versions_dir / version
+
+    def is_complete(self, version: str) -> bool:
+        return (self.path(version) / MANIFEST_FILE).exists()
+
+    def versions(self) -> List[str]:
+        """All complete versions, oldest first"""
+        if not self.versions_dir.exists():
+            return []
+        return sorted(p.name for p in self.versions_dir.iterdir() if p.is_dir() and self.is_complete(p.name))
+
+    def current_version(self) -> Optional[str]:
+        try:
+            version = self.pointer.read_text().strip()
+        except FileNotFoundError:
+            return None
+        return version if version and self.path(version).exists() else None
+
+    def publish(self, version: str) -> None:
+        """Make a fully written version current, then prune old versions"""
+        if not self.is_complete(version):
+            raise ValueError(f"Unknown or incomplete model version: {version}")
+        tmp = self.root / f".CURRENT.{uuid.uuid4().hex}"
+        tmp.write_text(version)
+        os.replace(tmp, self.pointer)
+        self.prune()
+
+    def rollback(self, version: Optional[str] = None) -> str:
+        """Point CURRENT at ``version``, or at the version before the current one"""
+        if version is None:
+            versions = self.versions()
+            current = self.current_version()
+            older = versions[:versions.index(current)] if current in versions else []
+            if not older:
+                raise ValueError("No older model version to roll back to")
+            version = older[-1]
+        self.publish(version)
+        return version
+
+    def prune(self) -> None:
+        current = self.current_version()
+        for version in self.versions()[:-self.keep]:
+            if version != current:
+                self.discard(version)
\ No newline at end of file
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.ml.registry import ModelRegistry
+from app.models.article import Article
+
+if TYPE_CHECKING:
+    from app.ml.models.article_classifier import ArticleClassifier
+
+def training_query(since: Optional[datetime] = None) -> Select:
+    """Labeled articles to train on, newest first, within the configured window and sample cap"""
+    query = select(
+        Article.title, Article.summary, Article.category, Article.priority
+    ).where(
+        Article.category.isnot(None),
+        Article.priority.isnot(None)
+    )
+    if since is not None:
+        query = query.where(Article.date_found >= since)
+    
+    query = query.order_by(Article.date_found.desc(), Article.id.desc())
+    if settings.ML_TRAINING_MAX_SAMPLES:
+        query = query.limit(settings.ML_TRAINING_MAX_SAMPLES)
+    return query
+
+def training_batches(
+    db: Session, since: Optional[datetime] = None
+) -> Iterator[Tuple[List[str], List[str], List[str]]]:
+    """Yield (texts, categories, priorities) chunks from a server-side cursor"""
+    result = db.execute(
+        training_query(since).execution_options(yield_per=settings.ML_TRAINING_CHUNK_SIZE)
+    )
+    for rows in result.partitions():
+        yield (
+            [f"{row.title}\n{row.summary}" for row in rows],
+            [row.category for row in rows],
+            [row.priority for row in rows]
+        )
+
+def train_classifier(db: Session, model_dir: Path) -> "ArticleClassifier":
+    """Fit a new classifier on the labeled articles and save it to ``model_dir``"""
+    from app.ml.models.article_classifier import create_classifier
+    
+    since = None
+    if settings.ML_TRAINING_WINDOW_DAYS:
+        since = datetime.utcnow() - timedelta(days=settings.ML_TRAINING_WINDOW_DAYS)
+    
+    if db.execute(training_query(since).limit(1)).first() is None:
+        raise ValueError("No labeled articles available for training")
+    
+    classifier = create_classifier(model_dir=model_dir, n_jobs=settings.ML_N_JOBS)
+    # Stream labeled rows in chunks instead of loading every Article object
+    classifier.fit_stream(lambda: training_batches(db, since))
+    classifier.save()
+    return classifier
+
+def train_new_version() -> str:
+    """Train and publish a new model version; the entry point for worker processes
+    
+    Opens its own database session so it can run in a separate process, and
+    returns the published version name for the parent to load.
+    """
+    from app.db.session import SessionLocal
+    
+    registry = ModelRegistry()
+    version = registry.create_version()
+    db = SessionLocal()
+    try:
+        train_classifier(db, registry.path(version))
+    except BaseException:
+        registry.discard(version)
+        raise
+    finally:
+        db.close()
+    registry.publish(version)
+    return version
\ No newline at end of file
@@ -1,15 +1,34 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ARRAY
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ARRAY, ForeignKey, Index, LargeBinary, Table
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
 
+# Articles saved by users (created by the initial migration)
+user_articles = Table(
+    "user_articles",
+    Base.metadata,
+    Column("user_id", Integer, ForeignKey("users.id"), primary_key=True),
+    Column("article_id", Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+)
+
 class Article(Base):
     __tablename__ = "articles"
+    __table_args__ = (
+        # Newest-first listing and cursor seeks, unfiltered and per filter
+        Index("ix_articles_date_found_id", "date_found", "id"),
+        Index("ix_articles_category_date_found_id", "category", "date_found", "id"),
+        Index("ix_articles_priority_date_found_id", "priority", "date_found", "id"),
+        # Per-feed lookups, counts and latest publication date
+        Index("ix_articles_feed_id_date_published", "feed_id", "date_published"),
+        # Full-text search also uses search_vector, a GIN-indexed tsvector kept
+        # by a trigger on PostgreSQL only and left unmapped (see search_service)
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     url = Column(String, unique=True, index=True)
     source = Column(String)
+    feed_id = Column(Integer, ForeignKey("feeds.id", ondelete="CASCADE"), nullable=True)  # None for articles added by hand
     summary = Column(Text)
     category = Column(String)
     priority = Column(String)
@@ -19,6 +38,17 @@ class Article(Base):
     date_found = Column(DateTime, default=datetime.utcnow)
     is_archived = Column(Boolean, default=False)
     
+    # Near-duplicate clustering, see near_dup. cluster_id is the id of the
+    # first article of the story, so it equals id for that article.
+    minhash = Column(LargeBinary, nullable=True)
+    cluster_id = Column(Integer, nullable=True, index=True)
+    
+    # Denormalized from interactions, kept current by interaction_service
+    interaction_count = Column(Integer, nullable=False, default=0, server_default="0")
+    save_count = Column(Integer, nullable=False, default=0, server_default="0")
+    click_count = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Relationships
     users = relationship("User", secondary="user_articles", back_populates="articles")
-    interactions = relationship("Interaction", back_populates="article") 
\ No newline at end of file
+    feed = relationship("Feed", back_populates="articles")
+    interactions = relationship("Interaction", back_populates="article", passive_deletes=True) 
\ No newline at end of file
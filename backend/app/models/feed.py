@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
 
@@ -12,4 +13,17 @@ class Feed(Base):
     is_active = Column(Boolean, default=True)
     last_fetched = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    update_frequency = Column(Integer, default=3600)  # in seconds 
\ No newline at end of file
+    update_frequency = Column(Integer, default=3600)  # in seconds
+    
+    # Conditional GET validators from the last successful fetch
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    content_hash = Column(String, nullable=True)  # sha256 of the last body parsed 
+    
+    # Denormalized from articles, kept current at ingestion
+    article_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_article_date = Column(DateTime, nullable=True)
+    
+    # Relationships. Deleting a feed deletes its articles through the
+    # ON DELETE CASCADE foreign key, without loading them first
+    articles = relationship("Article", back_populates="feed", passive_deletes=True)
\ No newline at end of file
@@ -1,14 +1,18 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
 
 class Interaction(Base):
     __tablename__ = "interactions"
+    __table_args__ = (
+        # A user's interactions since the last one folded into their preferences
+        Index("ix_interactions_user_id_id", "user_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
-    article_id = Column(Integer, ForeignKey("articles.id"))
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), index=True)
     interaction_type = Column(String)  # click, save, dismiss, share
     timestamp = Column(DateTime, default=datetime.utcnow)
     additional_data = Column(JSON, nullable=True)
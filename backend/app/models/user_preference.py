@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, LargeBinary
+from app.db.base import Base
+
+class UserPreference(Base):
+    __tablename__ = "user_preferences"
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    # float32 preference vector over the hashed article features, see ranking_service
+    vector = Column(LargeBinary, nullable=False)
+    # Interactions up to this id are folded into the vector
+    last_interaction_id = Column(Integer, nullable=False, default=0)
+    # Time of the newest folded interaction, the vector's decay reference
+    updated_at = Column(DateTime, nullable=True)
\ No newline at end of file
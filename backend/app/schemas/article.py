@@ -23,6 +23,7 @@ class ArticleInDBBase(ArticleBase):
     date_published: Optional[datetime]
     date_found: datetime
     is_archived: bool
+    cluster_id: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -33,4 +34,13 @@ class Article(ArticleInDBBase):
 class ArticleWithInteractions(Article):
     interaction_count: int
     save_count: int
-    click_count: int 
\ No newline at end of file
+    click_count: int 
+
+class ArticleSearchHit(BaseModel):
+    article: ArticleWithInteractions
+    rank: float
+    snippet: Optional[str] = None  # matched words wrapped in <mark>
+
+class RelatedArticle(BaseModel):
+    article: ArticleWithInteractions
+    similarity: float  # cosine similarity of the TF-IDF vectors
\ No newline at end of file
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from app.config import settings
+
+class InteractionBase(BaseModel):
+    article_id: int
+    interaction_type: str  # click, save, dismiss, share
+    additional_data: Optional[Dict[str, Any]] = None
+
+class InteractionCreate(InteractionBase):
+    pass
+
+class InteractionBatch(BaseModel):
+    interactions: List[InteractionCreate] = Field(..., min_length=1, max_length=settings.INTERACTION_BATCH_MAX)
+
+class InteractionBatchAccepted(BaseModel):
+    accepted: int
+
+class Interaction(InteractionBase):
+    id: int
+    user_id: int
+    timestamp: datetime
+
+    class Config:
+        from_attributes = True
\ No newline at end of file
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+class TrendingTopic(BaseModel):
+    term: str
+    count: int  # articles mentioning the term in the window, estimated
+    previous_count: int  # the same in the window before it
+    score: float  # rise over the previous window in standard deviations
\ No newline at end of file
@@ -0,0 +1,146 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+from app.config import settings
+import asyncio
+import hashlib
+import httpx
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class FetchResult:
+    """Outcome of downloading a single feed"""
+    feed_id: int
+    url: str
+    status_code: Optional[int] = None
+    content: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    content_hash: Optional[str] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and self.status_code < 400
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+def is_unchanged(feed, result: FetchResult) -> bool:
+    """Whether a fetch can be skipped: a 304, or a body identical to the last one parsed"""
+    if result.not_modified:
+        return True
+    return result.content_hash is not None and result.content_hash == feed.content_hash
+
+def store_validators(feed, result: FetchResult) -> None:
+    """Remember the validators of a processed response for the next conditional GET"""
+    if result.not_modified:
+        return
+    feed.etag = result.headers.get("etag")
+    feed.last_modified = result.headers.get("last-modified")
+    feed.content_hash = result.content_hash
+
+class FeedFetcher:
+    """Download many feeds concurrently over one shared HTTP connection pool.
+
+    At most ``concurrency`` downloads are in flight overall and at most ``per_host``
+    against any single host, so one slow publisher can only stall its own feeds.
+    Every request is capped at ``timeout`` seconds end to end.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        per_host: Optional[int] = None,
+        timeout: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.concurrency = concurrency or settings.FEED_FETCH_CONCURRENCY
+        self.per_host = per_host or settings.FEED_FETCH_PER_HOST
+        self.timeout = timeout or settings.FEED_FETCH_TIMEOUT
+        self.transport = transport
+
+    def fetch(self, feeds: Iterable) -> List[FetchResult]:
+        """Blocking wrapper around fetch_many for callers without an event loop"""
+        return asyncio.run(self.fetch_many(feeds))
+
+    async def fetch_many(self, feeds: Iterable) -> List[FetchResult]:
+        """Download all feeds, returning one result per feed in input order"""
+        # Read ORM attributes up front so no lazy loads happen inside the loop
+        targets = [
+            (feed.id, str(feed.url), self._conditional_headers(feed))
+            for feed in feeds
+        ]
+        if not targets:
+            return []
+
+        workers = asyncio.Semaphore(self.concurrency)
+        hosts: Dict[str, asyncio.Semaphore] = {}
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency
+        )
+
+        async with httpx.AsyncClient(
+            limits=limits,
+            timeout=httpx.Timeout(self.timeout),
+            follow_redirects=True,
+            headers={"User-Agent": settings.FEED_FETCH_USER_AGENT},
+            transport=self.transport
+        ) as client:
+            return await asyncio.gather(*(
+                self._fetch_one(client, workers, hosts, feed_id, url, headers)
+                for feed_id, url, headers in targets
+            ))
+
+    @staticmethod
+    def _conditional_headers(feed) -> Dict[str, str]:
+        headers = {}
+        if getattr(feed, "etag", None):
+            headers["If-None-Match"] = feed.etag
+        if getattr(feed, "last_modified", None):
+            headers["If-Modified-Since"] = feed.last_modified
+        return headers
+
+    async def _fetch_one(
+        self,
+        client: httpx.AsyncClient,
+        workers: asyncio.Semaphore,
+        hosts: Dict[str, asyncio.Semaphore],
+        feed_id: int,
+        url: str,
+        headers: Dict[str, str]
+    ) -> FetchResult:
+        result = FetchResult(feed_id=feed_id, url=url)
+        host = urlsplit(url).netloc.lower()
+        host_limit = hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+
+        # Take the host slot first so feeds queued behind a busy host don't
+        # occupy global worker slots while they wait
+        async with host_limit, workers:
+            started = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(
+                    client.get(url, headers=headers),
+                    timeout=self.timeout
+                )
+                result.status_code = response.status_code
+                result.headers = dict(response.headers.items())
+                result.content = response.content
+                if response.status_code == 200:
+                    result.content_hash = hashlib.sha256(result.content).hexdigest()
+                if response.status_code >= 400:
+                    result.error = f"HTTP {response.status_code}"
+            except asyncio.TimeoutError:
+                result.error = f"timed out after {self.timeout}s"
+            except httpx.HTTPError as e:
+                result.error = str(e) or e.__class__.__name__
+            result.elapsed = time.perf_counter() - started
+
+        if result.error:
+            logger.warning(f"Failed to fetch feed {feed_id} ({url}): {result.error}")
+        return result
\ No newline at end of file
@@ -1,56 +1,208 @@
 from datetime import datetime
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
 from app.models.feed import Feed
 from app.models.article import Article
+from app.services.feed_fetcher import FeedFetcher, FetchResult, is_unchanged, store_validators
 from app.services.ml_service import ml_service
+from app.services.near_dup import near_duplicates, signature, start_clusters
+from app.services.related_service import related_articles
+from app.services.trending_service import trending_topics
+from app.services.url_dedup import filter_new_entries, recent_urls
 import feedparser
+import logging
+
+logger = logging.getLogger(__name__)
+
+def update_feed_counters(db: Session, feed_id: int, added: int) -> None:
+    """Adjust a feed's stored article count by ``added`` and refresh its latest article date
+    
+    Both are computed in SQL, the date from the (feed_id, date_published) index,
+    so this costs one UPDATE however many articles the feed has.
+    """
+    db.query(Feed).filter(Feed.id == feed_id).update({
+        Feed.article_count: Feed.article_count + added,
+        Feed.last_article_date: select(func.max(Article.date_published))
+            .where(Article.feed_id == feed_id)
+            .scalar_subquery()
+    }, synchronize_session=False)
+
+def reconcile_feed_counts(db: Session) -> int:
+    """Recompute every feed's counters from its articles, returning how many were fixed"""
+    counts = (
+        select(
+            Article.feed_id,
+            func.count(Article.id).label("article_count"),
+            func.max(Article.date_published).label("last_article_date")
+        )
+        .where(Article.feed_id.is_not(None))
+        .group_by(Article.feed_id)
+        .subquery()
+    )
+    expected_count = func.coalesce(counts.c.article_count, 0)
+    drifted = db.execute(
+        select(Feed.id, expected_count, counts.c.last_article_date)
+        .outerjoin(counts, counts.c.feed_id == Feed.id)
+        .where(or_(
+            Feed.article_count != expected_count,
+            Feed.last_article_date.is_distinct_from(counts.c.last_article_date)
+        ))
+    ).all()
+    
+    if drifted:
+        db.execute(update(Feed), [
+            {"id": id, "article_count": count, "last_article_date": last}
+            for id, count, last in drifted
+        ])
+        db.commit()
+        logger.warning(f"Reconciled article counters of {len(drifted)} feeds")
+    return len(drifted)
 
 class FeedService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, fetcher: Optional[FeedFetcher] = None):
         self.db = db
+        self.fetcher = fetcher or FeedFetcher()
     
-    def fetch_all_feeds(self) -> None:
+    def fetch_all_feeds(self) -> Dict[str, Any]:
         """Fetch all active feeds and process new articles"""
         feeds = self.db.query(Feed).filter(Feed.is_active == True).all()
-        for feed in feeds:
-            self._process_feed(feed)
+        return self.fetch_feeds(feeds)
     
-    def _process_feed(self, feed: Feed) -> None:
-        """Process a single feed and extract articles"""
-        parsed = feedparser.parse(str(feed.url))
-        for entry in parsed.entries:
-            # Check if article already exists
-            existing = self.db.query(Article).filter(Article.url == entry.link).first()
-            if existing:
+    def fetch_feeds(self, feeds: List[Feed]) -> Dict[str, Any]:
+        """Download the given feeds concurrently, then process them one by one
+        
+        Besides the cycle counters, ``per_feed`` maps each feed id to the number
+        of new articles it produced, or None if the fetch failed.
+        """
+        stats = {
+            "feeds": len(feeds),
+            "fetched": 0,
+            "not_modified": 0,  # 304 responses, nothing downloaded
+            "unchanged": 0,  # body identical to the last one, parsing skipped
+            "failed": 0,
+            "new_articles": 0,
+            "bytes_downloaded": 0,
+            "per_feed": {}
+        }
+        results = self.fetcher.fetch(feeds)
+        
+        for feed, result in zip(feeds, results):
+            stats["per_feed"][feed.id] = None
+            if not result.ok:
+                stats["failed"] += 1
                 continue
             
+            stats["bytes_downloaded"] += len(result.content)
+            if is_unchanged(feed, result):
+                stats["not_modified" if result.not_modified else "unchanged"] += 1
+                stats["per_feed"][feed.id] = 0
+                feed.last_fetched = datetime.utcnow()
+                # Same body under a new ETag or Last-Modified: send those next
+                # time or the server keeps answering 200 with the full body
+                store_validators(feed, result)
+                self.db.commit()
+                continue
+            
+            try:
+                added = self._process_feed(feed, result)
+                stats["new_articles"] += added
+                stats["per_feed"][feed.id] = added
+                stats["fetched"] += 1
+            except Exception as e:
+                self.db.rollback()
+                stats["failed"] += 1
+                logger.error(f"Error processing feed {feed.id} ({feed.url}): {e}")
+        
+        return stats
+    
+    def _process_feed(self, feed: Feed, result: FetchResult) -> int:
+        """Process a downloaded feed and extract articles, returning the number added"""
+        parsed = feedparser.parse(
+            result.content,
+            response_headers={**result.headers, "content-location": result.url}
+        )
+        new_entries = filter_new_entries(self.db, parsed.entries)
+        
+        # Syndicated copies of a stored story join its cluster and reuse its
+        # classification instead of running the model again, as do copies of
+        # a story new in this batch
+        signatures = [signature(entry.title, getattr(entry, 'summary', '')) for entry in new_entries]
+        near_duplicates.sync(self.db)
+        clusters, firsts = near_duplicates.find_batch(signatures)
+        cluster_ids = {cluster for cluster in clusters if cluster is not None}
+        leaders = {
+            leader.id: leader
+            for leader in self.db.query(Article).filter(Article.id.in_(cluster_ids))
+        } if cluster_ids else {}
+        
+        # Classify the remaining new entries of the feed in one batch
+        positions = [
+            position for position, (cluster, first) in enumerate(zip(clusters, firsts))
+            if cluster not in leaders and first is None
+        ]
+        classifications = dict(zip(positions, ml_service.classify_batch([
+            (new_entries[position].title, getattr(new_entries[position], 'summary', ''))
+            for position in positions
+        ])))
+        
+        articles = []
+        for position, (entry, value, cluster, first) in enumerate(zip(new_entries, signatures, clusters, firsts)):
             # Extract article content
             title = entry.title
             summary = entry.summary if hasattr(entry, 'summary') else ''
             
-            # Classify article using ML service
-            classification = ml_service.classify_article(title, summary)
+            leader = leaders.get(cluster)
+            if leader is None:
+                classification = classifications[position if first is None else first]
+                category = classification["category"]
+                priority = classification["priority"]
+                key_points = [term["term"] for term in classification["key_terms"]]
+            else:
+                category, priority, key_points = leader.category, leader.priority, leader.key_points
             
             # Create new article
             article = Article(
                 title=title,
                 url=entry.link,
                 source=feed.name,
+                feed_id=feed.id,
                 summary=summary,
-                category=classification["category"],
-                priority=classification["priority"],
-                key_points=[term["term"] for term in classification["key_terms"]],
+                category=category,
+                priority=priority,
+                key_points=key_points,
                 date_published=datetime.strptime(entry.published, '%a, %d %b %Y %H:%M:%S %z')
                 if hasattr(entry, 'published') else datetime.utcnow(),
-                date_found=datetime.utcnow()
+                date_found=datetime.utcnow(),
+                minhash=value.tobytes() if value is not None else None,
+                cluster_id=leader.id if leader else None
             )
             
             self.db.add(article)
+            articles.append(article)
         
         # Update feed metadata
         feed.last_fetched = datetime.utcnow()
+        store_validators(feed, result)
         self.db.add(feed)
+        if new_entries:
+            self.db.flush()
+            start_clusters(articles, firsts)
+            update_feed_counters(self.db, feed.id, len(new_entries))
+        # Read before the commit expires them
+        ids = [article.id for article in articles]
+        texts = [f"{article.title}\n{article.summary}" for article in articles]
+        cluster_ids = [article.cluster_id for article in articles]
         self.db.commit()
+        recent_urls.add_many(entry.link for entry in new_entries)
+        # Index the new stories now so the next feed's copies join them
+        for id, value, cluster_id in zip(ids, signatures, cluster_ids):
+            if value is not None:
+                near_duplicates.add(id, value, cluster_id)
+        related_articles.add(ids, texts)
+        if new_entries:
+            trending_topics.sync(self.db)
+        return len(new_entries)
     
     def get_feed_stats(self, feed_id: int) -> dict:
         """Get statistics for a feed"""
@@ -58,21 +210,22 @@ class FeedService:
         if not feed:
             return None
         
-        articles = self.db.query(Article).filter(Article.source == feed.name).all()
+        # One pass over the feed's index entries, grouped in the database
+        rows = self.db.query(
+            Article.category,
+            Article.priority,
+            func.count(Article.id)
+        ).filter(Article.feed_id == feed_id).group_by(Article.category, Article.priority).all()
         
         stats = {
-            "total_articles": len(articles),
+            "total_articles": 0,
             "categories": {},
             "priorities": {"High": 0, "Low": 0}
         }
         
-        for article in articles:
-            # Count categories
-            if article.category not in stats["categories"]:
-                stats["categories"][article.category] = 0
-            stats["categories"][article.category] += 1
-            
-            # Count priorities
-            stats["priorities"][article.priority] += 1
+        for category, priority, count in rows:
+            stats["total_articles"] += count
+            stats["categories"][category] = stats["categories"].get(category, 0) + count
+            stats["priorities"][priority] = stats["priorities"].get(priority, 0) + count
         
-        return stats 
\ No newline at end of file
+        return stats
\ No newline at end of file
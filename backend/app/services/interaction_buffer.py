@@ -0,0 +1,161 @@
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from typing import Any, Callable, Dict, List, Optional
+from app.config import settings
+from app.db.session import SessionLocal
+from app.services.interaction_service import insert_interactions
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class BufferFull(Exception):
+    """The buffer had no room for a batch within the enqueue timeout"""
+
+class InteractionBuffer:
+    """Write-behind buffer that turns many small interaction posts into few bulk inserts.
+
+    Requests append rows in the event loop and return immediately. A flusher task
+    writes up to ``flush_size`` rows per transaction in a worker thread, as soon
+    as that many are waiting or ``flush_interval`` seconds after the last flush.
+    At most ``max_pending`` rows wait at a time: callers beyond that wait up to
+    ``enqueue_timeout`` seconds for room and then get BufferFull, so a slow
+    database pushes back on clients instead of growing memory. A write that
+    fails because the database is unreachable is put back at the head and
+    retried with exponential backoff up to ``retries`` times in a row; a batch
+    the database rejects is dropped. ``stop`` writes out everything still
+    buffered.
+    """
+
+    def __init__(
+        self,
+        max_pending: Optional[int] = None,
+        flush_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        enqueue_timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        session_factory: Callable = SessionLocal
+    ):
+        self.max_pending = max_pending or settings.INTERACTION_BUFFER_SIZE
+        self.flush_size = flush_size or settings.INTERACTION_FLUSH_SIZE
+        self.flush_interval = flush_interval or settings.INTERACTION_FLUSH_INTERVAL
+        self.enqueue_timeout = settings.INTERACTION_ENQUEUE_TIMEOUT if enqueue_timeout is None else enqueue_timeout
+        self.retries = settings.INTERACTION_FLUSH_RETRIES if retries is None else retries
+        self.retry_backoff = settings.INTERACTION_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.session_factory = session_factory
+        self.stored = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.retried = 0
+        self._failures = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._ready: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def start(self) -> None:
+        """Start the flusher on the running event loop"""
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._closing = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop accepting rows and write out everything buffered"""
+        if self._task is None:
+            return
+        self._closing = True
+        self._ready.set()
+        await self._task
+        self._task = None
+
+    async def put_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Buffer rows all or nothing, waiting for room up to the enqueue timeout"""
+        if self._task is None or self._closing:
+            raise BufferFull("Interaction buffer is not running")
+        if len(rows) > self.max_pending:
+            raise ValueError(f"Batch of {len(rows)} exceeds the buffer size of {self.max_pending}")
+
+        deadline = time.monotonic() + self.enqueue_timeout
+        while self.max_pending - len(self._pending) < len(rows):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise BufferFull("Interaction buffer is full")
+            self._space.clear()
+            try:
+                await asyncio.wait_for(self._space.wait(), remaining)
+            except asyncio.TimeoutError:
+                raise BufferFull("Interaction buffer is full")
+
+        self._pending.extend(rows)
+        if len(self._pending) >= self.flush_size:
+            self._ready.set()
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._ready.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._ready.clear()
+            await self._flush()
+        await self._flush()
+
+    async def _flush(self) -> None:
+        while self._pending:
+            batch = self._pending[:self.flush_size]
+            del self._pending[:self.flush_size]
+            self._space.set()
+            try:
+                stored = await asyncio.to_thread(self._write, batch)
+            except Exception as e:
+                if _is_transient(e) and self._failures < self.retries:
+                    # Accepted with a 202 already: keep the rows, in order,
+                    # until the database is back
+                    self._pending[:0] = batch
+                    self._failures += 1
+                    self.retried += 1
+                    delay = min(self.retry_backoff * 2 ** (self._failures - 1), settings.INTERACTION_RETRY_BACKOFF_MAX)
+                    logger.warning(f"Failed to write {len(batch)} interactions, retrying in {delay:.1f}s: {e}")
+                    await asyncio.sleep(delay)
+                    continue
+                # Rejected by the database, or it stayed down through every
+                # retry: don't block the batches behind this one
+                self._failures = 0
+                self.dropped += len(batch)
+                logger.error(f"Dropped {len(batch)} interactions after a failed flush: {e}")
+                continue
+            self._failures = 0
+            self.stored += stored
+            self.dropped += len(batch) - stored
+            self.flushes += 1
+
+    def _write(self, batch: List[Dict[str, Any]]) -> int:
+        db = self.session_factory()
+        try:
+            return insert_interactions(db, batch)
+        finally:
+            db.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self.pending,
+            "stored": self.stored,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "retried": self.retried
+        }
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a write failed on the connection rather than on the data"""
+    if isinstance(error, (OperationalError, InterfaceError)):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+interaction_buffer = InteractionBuffer()
\ No newline at end of file
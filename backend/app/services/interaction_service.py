@@ -0,0 +1,117 @@
+from collections import defaultdict
+from sqlalchemy import bindparam, case, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, List, Tuple
+from app.models.article import Article
+from app.models.interaction import Interaction
+import logging
+
+logger = logging.getLogger(__name__)
+
+def counter_deltas(interactions: Iterable[Tuple[int, str]]) -> Dict[int, Dict[str, int]]:
+    """Per-article increments of the denormalized counters for new (article_id, interaction_type) pairs"""
+    deltas: Dict[int, Dict[str, int]] = defaultdict(
+        lambda: {"interaction_count": 0, "save_count": 0, "click_count": 0}
+    )
+    for article_id, interaction_type in interactions:
+        delta = deltas[article_id]
+        delta["interaction_count"] += 1
+        if interaction_type == "save":
+            delta["save_count"] += 1
+        elif interaction_type == "click":
+            delta["click_count"] += 1
+    return dict(deltas)
+
+def apply_counter_deltas(db: Session, deltas: Dict[int, Dict[str, int]]) -> None:
+    """Increment article counters in the database with one executemany UPDATE"""
+    if not deltas:
+        return
+    # Increment in SQL so concurrent writers don't overwrite each other, in a
+    # fixed lock order so concurrent batches don't deadlock. This is a Core
+    # statement because an ORM update given a parameter list turns into a bulk
+    # update by primary key, which would overwrite instead of increment.
+    articles = Article.__table__
+    db.execute(
+        update(articles)
+        .where(articles.c.id == bindparam("article_id"))
+        .values(
+            interaction_count=articles.c.interaction_count + bindparam("interactions"),
+            save_count=articles.c.save_count + bindparam("saves"),
+            click_count=articles.c.click_count + bindparam("clicks")
+        ),
+        [
+            {
+                "article_id": article_id,
+                "interactions": delta["interaction_count"],
+                "saves": delta["save_count"],
+                "clicks": delta["click_count"]
+            }
+            for article_id, delta in sorted(deltas.items())
+        ]
+    )
+
+def record_interactions(db: Session, interactions: List[Interaction]) -> List[Interaction]:
+    """Store interactions and bump their articles' counters in the same transaction"""
+    db.add_all(interactions)
+    apply_counter_deltas(db, counter_deltas(
+        (interaction.article_id, interaction.interaction_type) for interaction in interactions
+    ))
+    db.commit()
+    return interactions
+
+def insert_interactions(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """Bulk insert interaction rows and bump counters in one transaction, returning rows stored
+
+    Rows for articles that no longer exist are dropped instead of failing the
+    whole batch on the foreign key.
+    """
+    article_ids = {row["article_id"] for row in rows}
+    existing = set(db.scalars(select(Article.id).where(Article.id.in_(article_ids))))
+    rows = [row for row in rows if row["article_id"] in existing]
+    if rows:
+        db.execute(insert(Interaction), rows)
+        apply_counter_deltas(db, counter_deltas(
+            (row["article_id"], row["interaction_type"]) for row in rows
+        ))
+    db.commit()
+    return len(rows)
+
+def reconcile_interaction_counts(db: Session) -> int:
+    """Recompute every article's counters from the interactions table, returning how many were fixed
+
+    The incremental updates should keep the counters exact; this repairs drift
+    from writes that bypassed record_interactions or were rolled back halfway.
+    """
+    counts = (
+        select(
+            Interaction.article_id,
+            func.count(Interaction.id).label("interaction_count"),
+            func.sum(case((Interaction.interaction_type == "save", 1), else_=0)).label("save_count"),
+            func.sum(case((Interaction.interaction_type == "click", 1), else_=0)).label("click_count")
+        )
+        .group_by(Interaction.article_id)
+        .subquery()
+    )
+    expected = [
+        func.coalesce(counts.c.interaction_count, 0),
+        func.coalesce(counts.c.save_count, 0),
+        func.coalesce(counts.c.click_count, 0)
+    ]
+    drifted = db.execute(
+        select(Article.id, *expected)
+        .outerjoin(counts, counts.c.article_id == Article.id)
+        .where(or_(
+            Article.interaction_count != expected[0],
+            Article.save_count != expected[1],
+            Article.click_count != expected[2]
+        ))
+    ).all()
+
+    if drifted:
+        db.execute(update(Article), [
+            {"id": id, "interaction_count": total, "save_count": saves, "click_count": clicks}
+            for id, total, saves, clicks in drifted
+        ])
+        db.commit()
+        logger.warning(f"Reconciled interaction counters of {len(drifted)} articles")
+    return len(drifted)
\ No newline at end of file
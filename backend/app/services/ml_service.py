@@ -1,92 +1,227 @@
-from app.ml.models.article_classifier import ArticleClassifier
+from app.config import settings
+from app.ml.registry import ModelRegistry
+from app.services.prediction_cache import PredictionCache
 from app.models.article import Article
 from app.models.interaction import Interaction
+from sqlalchemy import case, func, or_, select, update
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+import copy
+import logging
+import threading
+import uuid
+
+if TYPE_CHECKING:
+    from app.ml.models.article_classifier import ArticleClassifier
+
+logger = logging.getLogger(__name__)
 
 class MLService:
+    """Article classification with a model that is loaded on first use.
+    
+    Creating the service neither imports scikit-learn nor reads the model, so
+    processes that never classify anything don't pay for either. The model is
+    loaded by the first prediction or ahead of time by ``warm_up``.
+    """
+    
     def __init__(self):
-        self.classifier = ArticleClassifier()
+        self.registry = ModelRegistry()
+        self.predictions = PredictionCache()
+        self.model_version: Optional[str] = None
+        self._classifier: Optional["ArticleClassifier"] = None
+        self._load_lock = threading.Lock()
+        # Held while publishing a model and for the whole of a partial update
+        self._model_lock = threading.Lock()
+        # One thread applies queued partial updates, in order
+        self._updates = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ml-partial-update")
+    
+    @property
+    def is_loaded(self) -> bool:
+        return self._classifier is not None
+    
+    @property
+    def is_trained(self) -> bool:
+        return self._classifier is not None and self._classifier.is_fitted
+    
+    @property
+    def classifier(self) -> "ArticleClassifier":
+        """The live classifier, loaded from disk on first access"""
+        classifier = self._classifier
+        if classifier is None:
+            classifier = self.warm_up()
+        return classifier
+    
+    def warm_up(self) -> "ArticleClassifier":
+        """Load the model unless it is loaded already; safe to call from several threads"""
+        with self._load_lock:
+            if self._classifier is None:
+                self._load_initial()
+            return self._classifier
+    
+    def _load_initial(self) -> None:
+        from app.ml.models.article_classifier import ArticleClassifier
+        
         try:
-            self.classifier.load()
+            self.reload()
         except ValueError:
-            # Model not trained yet
-            pass
+            # No published version yet, fall back to the unversioned model files
+            classifier = ArticleClassifier()
+            try:
+                classifier.load()
+            except ValueError:
+                # Model not trained yet
+                pass
+            classifier.revision = "legacy"
+            self._classifier = classifier
     
     def classify_article(self, title: str, summary: str) -> Dict[str, Any]:
         """Classify a new article"""
+        return self.classify_batch([(title, summary)])[0]
+    
+    def classify_batch(self, articles: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Classify many (title, summary) pairs, running the model only on texts not cached yet"""
         # Combine title and summary for classification
-        text = f"{title}\n{summary}"
+        texts = [f"{title}\n{summary}" for title, summary in articles]
         
-        try:
-            return self.classifier.predict(text)
-        except ValueError:
+        classifier = self.classifier
+        if not classifier.is_fitted:
             # Return default classification if model is not trained
-            return {
-                "category": "Uncategorized",
-                "category_confidence": 0.0,
-                "priority": "Low",
-                "priority_confidence": 0.0,
-                "key_terms": []
-            }
-    
-    def train_model(self, db: Session) -> None:
-        """Train the model using historical data"""
-        # Get articles with interactions
-        articles = db.query(Article).filter(
-            Article.category.isnot(None),
-            Article.priority.isnot(None)
-        ).all()
+            return [self._default_classification() for _ in texts]
         
-        if not articles:
-            raise ValueError("No labeled articles available for training")
+        # The revision changes with every swap and online update, so entries
+        # made by an older model are never served
+        clean_text = classifier.text_features.clean_text
+        keys = [self.predictions.key(clean_text(text), classifier.revision) for text in texts]
+        results = self.predictions.get_many(list(dict.fromkeys(keys)))
         
-        texts = [f"{article.title}\n{article.summary}" for article in articles]
-        categories = [article.category for article in articles]
-        priorities = [article.priority for article in articles]
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in results:
+                missing.setdefault(key, text)
+        if missing:
+            predicted = dict(zip(missing, classifier.predict_batch(list(missing.values()))))
+            self.predictions.set_many(predicted)
+            results.update(predicted)
         
-        # Train the model
-        self.classifier.fit(texts, categories, priorities)
+        # Hand out copies so callers can't alter cached entries
+        return [dict(results[key]) for key in keys]
+    
+    @staticmethod
+    def _default_classification() -> Dict[str, Any]:
+        return {
+            "category": "Uncategorized",
+            "category_confidence": 0.0,
+            "priority": "Low",
+            "priority_confidence": 0.0,
+            "key_terms": []
+        }
+    
+    def reload(self, version: Optional[str] = None) -> None:
+        """Load a published model version (the current one by default) and switch to it"""
+        from app.ml.models.article_classifier import load_classifier
         
-        # Save the model
-        self.classifier.save()
-    
-    def update_from_interactions(self, db: Session) -> None:
-        """Update article classifications based on user interactions"""
-        # Get recent interactions
-        recent_interactions = db.query(Interaction).filter(
-            Interaction.timestamp >= datetime.utcnow() - timedelta(days=7)
-        ).all()
+        version = version or self.registry.current_version()
+        if version is None:
+            raise ValueError("No published model version")
+        self._swap(load_classifier(self.registry.path(version)), version)
+    
+    def rollback(self, version: Optional[str] = None) -> str:
+        """Switch back to an older model version (the previous one by default)"""
+        version = self.registry.rollback(version)
+        self.reload(version)
+        return version
+    
+    def partial_update(self, texts: List[str], categories: List[str], priorities: List[str]) -> int:
+        """Absorb newly labeled articles into an online model, returning the rows used
         
-        if not recent_interactions:
-            return
+        A no-op unless ML_CLASSIFIER is "online". Updates live in memory until the
+        next full retrain, which relearns them from the labels stored on articles.
+        """
+        if settings.ML_CLASSIFIER != "online" or not texts:
+            return 0
+        version = self.model_version
+        classifier = self.classifier
+        if not classifier.is_fitted or not hasattr(classifier, "partial_fit"):
+            return 0
         
-        # Group interactions by article
-        article_interactions: Dict[int, List[Interaction]] = {}
-        for interaction in recent_interactions:
-            if interaction.article_id not in article_interactions:
-                article_interactions[interaction.article_id] = []
-            article_interactions[interaction.article_id].append(interaction)
+        # Serialized with other updates and swaps so none overwrites another
+        with self._model_lock:
+            if self.model_version != version:
+                # A new version was swapped in meanwhile; it was trained on
+                # the stored labels, these included
+                return 0
+            # The live model, with any update that got the lock first
+            classifier = self._classifier
+            # Update a copy so concurrent predictions never see half-updated weights
+            updated = copy.deepcopy(classifier)
+            used = updated.partial_fit(texts, categories, priorities)
+            if used:
+                updated.revision = f"{classifier.revision}+{uuid.uuid4().hex[:12]}"
+                self._classifier = updated
+        return used
+    
+    def submit_partial_update(self, texts: List[str], categories: List[str], priorities: List[str]) -> Optional[Future]:
+        """Queue a partial_update on the update thread instead of running it in the caller"""
+        if settings.ML_CLASSIFIER != "online" or not texts:
+            return None
+        future = self._updates.submit(self.partial_update, texts, categories, priorities)
+        future.add_done_callback(_log_update_failure)
+        return future
+    
+    def _swap(self, classifier: "ArticleClassifier", version: str) -> None:
+        # A single reference assignment: in-flight predictions keep using the
+        # classifier they already hold, new ones see the fully loaded model
+        classifier.revision = version
+        with self._model_lock:
+            self._classifier = classifier
+            self.model_version = version
+        logger.info(f"Switched to model version {version}")
+    
+    def update_from_interactions(self, db: Session) -> int:
+        """Promote articles with high recent engagement to High priority, returning how many changed
         
-        # Update article priorities based on interaction patterns
-        for article_id, interactions in article_interactions.items():
-            article = db.query(Article).filter(Article.id == article_id).first()
-            if not article:
-                continue
-            
-            # Calculate engagement score
-            engagement_score = sum(
-                2 if i.interaction_type == "save" else
-                1 if i.interaction_type == "click" else
-                0 for i in interactions
+        Runs in a constant number of round trips: one aggregate query picks the
+        articles to promote and one bulk UPDATE promotes them.
+        """
+        # Weighted engagement per article over the recent window
+        engagement = func.sum(case(
+            (Interaction.interaction_type == "save", settings.ENGAGEMENT_SAVE_WEIGHT),
+            (Interaction.interaction_type == "click", settings.ENGAGEMENT_CLICK_WEIGHT),
+            else_=0
+        ))
+        engaged = (
+            select(Interaction.article_id)
+            .where(Interaction.timestamp >= datetime.utcnow() - timedelta(days=settings.ENGAGEMENT_WINDOW_DAYS))
+            .group_by(Interaction.article_id)
+            .having(engagement >= settings.ENGAGEMENT_THRESHOLD)
+        )
+        promoted = db.execute(
+            select(Article.id, Article.title, Article.summary, Article.category)
+            .where(Article.id.in_(engaged))
+            .where(or_(Article.priority.is_(None), Article.priority != "High"))
+        ).all()
+        
+        if promoted:
+            db.execute(
+                update(Article)
+                .where(Article.id.in_([row.id for row in promoted]))
+                .values(priority="High")
+                .execution_options(synchronize_session=False)
             )
-            
-            # Update priority if engagement is high
-            if engagement_score >= 5 and article.priority != "High":
-                article.priority = "High"
-                db.add(article)
+            db.commit()
         
-        db.commit()
+        # Let an online model learn from the new labels right away
+        self.partial_update(
+            [f"{row.title}\n{row.summary}" for row in promoted],
+            [row.category for row in promoted],
+            ["High"] * len(promoted)
+        )
+        return len(promoted)
+
+def _log_update_failure(future: Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Partial model update failed: {future.exception()}")
 
 ml_service = MLService() 
\ No newline at end of file
@@ -0,0 +1,166 @@
+from collections import deque
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import Deque, Dict, List, Optional, Sequence, Set, Tuple
+from app.config import settings
+from app.models.article import Article
+import numpy as np
+import re
+import threading
+import zlib
+
+_TAGS = re.compile(r"<[^>]+>")
+
+# Fixed seed: signatures are stored, so every process must permute the same way
+_PERMUTATIONS = np.random.default_rng(0x5EED).integers(
+    1, 2 ** 63, size=(2, settings.NEAR_DUP_PERMUTATIONS), dtype=np.uint64
+)
+_MULTIPLIERS = _PERMUTATIONS[0] | np.uint64(1)
+_OFFSETS = _PERMUTATIONS[1]
+
+def shingles(title: Optional[str], summary: Optional[str]) -> Set[int]:
+    """Hashes of the word pairs of an article's cleaned title and summary"""
+    # Deferred: the text features module imports scikit-learn
+    from app.ml.features.text_features import clean_text
+    words = clean_text(_TAGS.sub(" ", f"{title or ''}\n{summary or ''}")).split()
+    pairs = zip(words, words[1:]) if len(words) > 1 else ((word, "") for word in words)
+    return {zlib.crc32(f"{first} {second}".encode()) for first, second in pairs}
+
+def signature(title: Optional[str], summary: Optional[str]) -> Optional[np.ndarray]:
+    """MinHash signature of an article's shingles, None if it has no words
+
+    The share of positions two signatures agree on estimates the Jaccard
+    similarity of the two shingle sets. Articles without words have nothing to
+    compare and are never clustered.
+    """
+    hashes = np.fromiter(shingles(title, summary), dtype=np.uint64)
+    if not len(hashes):
+        return None
+    # Multiply-shift hashing with wraparound, one column per permutation
+    with np.errstate(over="ignore"):
+        permuted = hashes[:, None] * _MULTIPLIERS + _OFFSETS
+    return (permuted >> np.uint64(32)).astype(np.uint32).min(axis=0)
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.count_nonzero(a == b)) / len(a)
+
+class NearDuplicateIndex:
+    """MinHash LSH over the signatures of recent articles.
+
+    Signatures are cut into ``bands`` bands; two articles become candidates
+    when any band matches exactly, which for 16 bands of 4 rows happens almost
+    always above a Jaccard similarity of 0.7 and rarely below 0.3. Candidates
+    are then checked against ``threshold`` on the full signature, so a lookup
+    only looks at a handful of articles however many are indexed. The oldest
+    entries are evicted beyond ``capacity``.
+    """
+
+    def __init__(self, threshold: float, bands: int, capacity: int):
+        if settings.NEAR_DUP_PERMUTATIONS % bands:
+            raise ValueError(f"{bands} bands don't divide {settings.NEAR_DUP_PERMUTATIONS} permutations")
+        self.threshold = threshold
+        self.rows = settings.NEAR_DUP_PERMUTATIONS // bands
+        self.capacity = capacity
+        self.max_id = 0
+        self._tables: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+        self._entries: Dict[int, Tuple[np.ndarray, int]] = {}
+        self._order: Deque[int] = deque()
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _keys(self, value: np.ndarray) -> List[bytes]:
+        return [value[start:start + self.rows].tobytes() for start in range(0, len(value), self.rows)]
+
+    def find(self, value: np.ndarray) -> Optional[int]:
+        """Cluster id of the most similar indexed article at or above the threshold, if any"""
+        best = None
+        with self._lock:
+            candidates = set()
+            for table, key in zip(self._tables, self._keys(value)):
+                candidates.update(table.get(key, ()))
+            for article_id in candidates:
+                other, cluster_id = self._entries[article_id]
+                score = similarity(value, other)
+                if score >= self.threshold and (best is None or score > best[0]):
+                    best = (score, cluster_id)
+        return best[1] if best else None
+
+    def find_batch(self, values: Sequence[Optional[np.ndarray]]) -> Tuple[List[Optional[int]], List[Optional[int]]]:
+        """``find`` for a batch of new articles that also matches them with each other
+
+        Returns the indexed cluster id of each value and, for values matching no
+        indexed article, the position of the first earlier value in the batch
+        of the same story. Both are None for values without a signature.
+        """
+        batch = NearDuplicateIndex(self.threshold, len(self._tables), max(len(values), 1))
+        clusters, firsts = [], []
+        for position, value in enumerate(values):
+            cluster = first = None
+            if value is not None:
+                cluster = self.find(value)
+                if cluster is None:
+                    first = batch.find(value)
+                    if first is None:
+                        batch.add(position, value, position)
+            clusters.append(cluster)
+            firsts.append(first)
+        return clusters, firsts
+
+    def add(self, article_id: int, value: np.ndarray, cluster_id: int) -> None:
+        with self._lock:
+            if article_id in self._entries:
+                return
+            for table, key in zip(self._tables, self._keys(value)):
+                table.setdefault(key, []).append(article_id)
+            self._entries[article_id] = (value, cluster_id)
+            self._order.append(article_id)
+            while len(self._order) > self.capacity:
+                self._evict(self._order.popleft())
+
+    def _evict(self, article_id: int) -> None:
+        value, _ = self._entries.pop(article_id)
+        for table, key in zip(self._tables, self._keys(value)):
+            bucket = table[key]
+            bucket.remove(article_id)
+            if not bucket:
+                del table[key]
+
+    def sync(self, db: Session) -> None:
+        """Index the articles stored since the last sync, by any process"""
+        with self._sync_lock:
+            self._sync(db)
+
+    def _sync(self, db: Session) -> None:
+        query = (
+            select(Article.id, Article.minhash, Article.cluster_id)
+            .where(Article.minhash.is_not(None), Article.id > self.max_id)
+        )
+        if self.max_id == 0:
+            # First sync: only the most recent articles fit
+            rows = db.execute(query.order_by(Article.id.desc()).limit(self.capacity)).all()[::-1]
+        else:
+            rows = db.execute(query.order_by(Article.id)).all()
+        for article_id, value, cluster_id in rows:
+            self.add(article_id, np.frombuffer(value, dtype=np.uint32), cluster_id or article_id)
+        if rows:
+            self.max_id = rows[-1][0]
+
+def start_clusters(articles: Sequence[Article], firsts: Optional[Sequence[Optional[int]]] = None) -> None:
+    """Put flushed articles that matched no stored story in a new cluster
+
+    That is the cluster of the first article of their story in the batch, by
+    position in ``firsts`` as returned by ``find_batch``, or their own.
+    """
+    firsts = firsts or [None] * len(articles)
+    for article, first in zip(articles, firsts):
+        if article.cluster_id is None:
+            article.cluster_id = article.id if first is None else articles[first].id
+
+near_duplicates = NearDuplicateIndex(
+    settings.NEAR_DUP_THRESHOLD,
+    settings.NEAR_DUP_BANDS,
+    settings.NEAR_DUP_INDEX_SIZE
+)
\ No newline at end of file
@@ -0,0 +1,83 @@
+from typing import Any, Dict, List, Optional
+from app.config import settings
+from app.core.cache import MemoryCache, SQLiteCache
+import hashlib
+import threading
+
+class PredictionCache:
+    """Classification results keyed by a hash of the cleaned text and the model that made them.
+
+    Lookups go to the in-process LRU first and then to the optional shared SQLite
+    file, whose hits are copied into the LRU. Because the model version is part of
+    the key, swapping in a new model makes every old entry unreachable; they age
+    out of the LRU and expire from the shared file on their own.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        shared_path: Optional[str] = None
+    ):
+        max_entries = settings.ML_PREDICTION_CACHE_SIZE if max_entries is None else max_entries
+        ttl = settings.ML_PREDICTION_CACHE_TTL if ttl is None else ttl
+        shared_path = shared_path or settings.ML_PREDICTION_CACHE_PATH
+        self.enabled = max_entries > 0
+        self.local = MemoryCache(max_entries, ttl)
+        self.shared = SQLiteCache(shared_path, ttl, max_entries=max_entries * 10) if shared_path and self.enabled else None
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(cleaned_text: str, model_version: str) -> str:
+        return hashlib.sha256(f"{model_version}\0{cleaned_text}".encode()).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Cached predictions for whichever of the keys are known"""
+        if not self.enabled:
+            return {}
+        found = {}
+        for key in keys:
+            value = self.local.get(key)
+            if value is not None:
+                found[key] = value
+        local_hits = len(found)
+
+        missing = [key for key in keys if key not in found]
+        if self.shared is not None and missing:
+            for key, value in self.shared.get_many(missing).items():
+                self.local.set(key, value)
+                found[key] = value
+
+        with self._lock:
+            self.hits += len(found)
+            self.shared_hits += len(found) - local_hits
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Dict[str, Dict[str, Any]]) -> None:
+        if not self.enabled:
+            return
+        for key, value in items.items():
+            self.local.set(key, value)
+        if self.shared is not None:
+            self.shared.set_many(items)
+
+    def clear(self) -> None:
+        self.local.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "shared": self.shared is not None,
+            "entries": len(self.local),
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
\ No newline at end of file
@@ -0,0 +1,203 @@
+from datetime import datetime
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from app.config import settings
+from app.core.cache import MemoryCache
+from app.models.article import Article
+from app.models.interaction import Interaction
+from app.models.user_preference import UserPreference
+from app.services.search_service import analyze
+import numpy as np
+import zlib
+
+# What an article's feature vector is made of, in argument order of article_features
+_FEATURE_COLUMNS = (Article.category, Article.feed_id, Article.title, Article.key_points)
+
+# Article dates are naive UTC
+_EPOCH = datetime(1970, 1, 1)
+
+def article_features(
+    category: Optional[str],
+    feed_id: Optional[int],
+    title: Optional[str],
+    key_points: Optional[Sequence[str]]
+) -> np.ndarray:
+    """Unit-length hashed bag of an article's category, feed and title and key point terms
+
+    Every token lands in one of RANKING_DIMENSIONS slots with a sign taken
+    from another bit of its hash, so collisions cancel out on average instead
+    of piling up.
+    """
+    tokens = set(analyze(title)) | set(analyze(" ".join(key_points or [])))
+    if category:
+        tokens.add(f"category:{category}")
+    if feed_id is not None:
+        tokens.add(f"feed:{feed_id}")
+    vector = np.zeros(settings.RANKING_DIMENSIONS, dtype=np.float32)
+    for token in tokens:
+        hashed = zlib.crc32(token.encode())
+        vector[hashed % settings.RANKING_DIMENSIONS] += 1.0 if hashed & 0x80000000 else -1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+def fold_interactions(
+    vector: np.ndarray,
+    updated_at: Optional[datetime],
+    interactions: Iterable[Tuple[str, Optional[datetime], np.ndarray]]
+) -> Tuple[np.ndarray, Optional[datetime]]:
+    """Add (interaction type, timestamp, article features) to a preference vector
+
+    The vector decays by half every RANKING_PREFERENCE_HALF_LIFE_DAYS between
+    interactions, so recent tastes outweigh old ones. Returns the new vector
+    and the time it is as of.
+    """
+    vector = vector.copy()
+    half_life = settings.RANKING_PREFERENCE_HALF_LIFE_DAYS * 86400
+    for interaction_type, timestamp, features in interactions:
+        if timestamp is not None:
+            if updated_at is not None and timestamp > updated_at:
+                vector *= 0.5 ** ((timestamp - updated_at).total_seconds() / half_life)
+            if updated_at is None or timestamp > updated_at:
+                updated_at = timestamp
+        vector += settings.RANKING_INTERACTION_WEIGHTS.get(interaction_type, 0.0) * features
+    return vector, updated_at
+
+def load_preferences(db: Session, user_id: int) -> np.ndarray:
+    """The user's preference vector, with interactions stored since the last call folded in and saved"""
+    preference = db.get(UserPreference, user_id)
+    vector, updated_at, last_id = np.zeros(settings.RANKING_DIMENSIONS, dtype=np.float32), None, 0
+    if preference is not None and len(preference.vector) == settings.RANKING_DIMENSIONS * 4:
+        vector = np.frombuffer(preference.vector, dtype=np.float32)
+        updated_at, last_id = preference.updated_at, preference.last_interaction_id
+
+    # Interactions whose article is gone still move the id forward
+    rows = db.execute(
+        select(
+            Interaction.id,
+            Interaction.interaction_type,
+            Interaction.timestamp,
+            Article.id.label("article_id"),
+            *_FEATURE_COLUMNS
+        )
+        .outerjoin(Article, Article.id == Interaction.article_id)
+        .where(Interaction.user_id == user_id, Interaction.id > last_id)
+        .order_by(Interaction.id)
+    ).all()
+    if not rows:
+        return vector
+
+    vector, updated_at = fold_interactions(vector, updated_at, (
+        (row.interaction_type, row.timestamp, article_features(*row[4:]))
+        for row in rows if row.article_id is not None
+    ))
+    if preference is None:
+        preference = UserPreference(user_id=user_id)
+        db.add(preference)
+    preference.vector = vector.tobytes()
+    preference.last_interaction_id = rows[-1].id
+    preference.updated_at = updated_at
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request created the row first; it folded the same interactions
+        db.rollback()
+    return vector
+
+class Candidates(NamedTuple):
+    ids: np.ndarray
+    found: np.ndarray  # date_found as POSIX seconds
+    matrix: np.ndarray  # article_features rows, one per id
+
+    def scores(self, preferences: np.ndarray, now: float) -> np.ndarray:
+        """Cosine affinity with the preferences plus a bonus that halves every RANKING_RECENCY_HALF_LIFE_HOURS"""
+        age_hours = np.maximum(now - self.found, 0) / 3600
+        scores = settings.RANKING_RECENCY_WEIGHT * 0.5 ** (age_hours / settings.RANKING_RECENCY_HALF_LIFE_HOURS)
+        norm = np.linalg.norm(preferences)
+        if norm:
+            scores += self.matrix @ (preferences / norm)
+        return scores
+
+    def rank(self, preferences: np.ndarray, now: float) -> np.ndarray:
+        """Positions from best to worst; candidates are newest first, so ties go to the newer one"""
+        return np.argsort(-self.scores(preferences, now), kind="stable")
+
+class CandidateCache:
+    """Feature matrices of the newest articles, one per listing filter.
+
+    Every lookup reads the current candidate ids, which the (date_found, id)
+    indexes make cheap, and only loads and featurizes articles that weren't
+    candidates last time.
+    """
+
+    def __init__(self, size: int, max_lists: int = 64):
+        self.size = size
+        self._lists = MemoryCache(max_lists)
+
+    def get(self, db: Session, category: Optional[str], priority: Optional[str], collapse: bool) -> Candidates:
+        query = select(Article.id)
+        if category:
+            query = query.where(Article.category == category)
+        if priority:
+            query = query.where(Article.priority == priority)
+        if collapse:
+            query = query.where(or_(Article.cluster_id.is_(None), Article.cluster_id == Article.id))
+        ids = np.array(
+            db.scalars(query.order_by(Article.date_found.desc(), Article.id.desc()).limit(self.size)).all(),
+            dtype=np.int64
+        )
+
+        key = repr((category, priority, collapse))
+        cached: Optional[Candidates] = self._lists.get(key)
+        if cached is not None and np.array_equal(cached.ids, ids):
+            return cached
+
+        known: Dict[int, Tuple[float, np.ndarray]] = {}
+        if cached is not None:
+            known = {int(id): (found, row) for id, found, row in zip(cached.ids, cached.found, cached.matrix)}
+        missing = [int(id) for id in ids if int(id) not in known]
+        if missing:
+            rows = db.execute(
+                select(Article.id, Article.date_found, *_FEATURE_COLUMNS).where(Article.id.in_(missing))
+            )
+            for row in rows:
+                found = (row.date_found - _EPOCH).total_seconds() if row.date_found else 0.0
+                known[row.id] = (found, article_features(*row[2:]))
+        # Articles deleted in between are ranked as empty and dropped when the page loads
+        empty = (0.0, np.zeros(settings.RANKING_DIMENSIONS, dtype=np.float32))
+        entries = [known.get(int(id), empty) for id in ids]
+        candidates = Candidates(
+            ids,
+            np.array([found for found, _ in entries], dtype=np.float64),
+            np.array([row for _, row in entries], dtype=np.float32).reshape(len(ids), -1)
+        )
+        self._lists.set(key, candidates)
+        return candidates
+
+candidate_cache = CandidateCache(settings.RANKING_CANDIDATES)
+
+def rank_for_user(
+    db: Session,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 20,
+    category: Optional[str] = None,
+    priority: Optional[str] = None,
+    collapse: bool = False
+) -> List[Article]:
+    """One page of the newest RANKING_CANDIDATES articles, ordered by what the user engaged with before
+
+    Users without interactions get the newest articles first.
+    """
+    preferences = load_preferences(db, user_id)
+    candidates = candidate_cache.get(db, category, priority, collapse)
+    now = (datetime.utcnow() - _EPOCH).total_seconds()
+    page = candidates.ids[candidates.rank(preferences, now)[skip:skip + limit]]
+    if not len(page):
+        return []
+    articles = {
+        article.id: article
+        for article in db.query(Article).filter(Article.id.in_(page.tolist()))
+    }
+    return [articles[id] for id in page.tolist() if id in articles]
\ No newline at end of file
@@ -0,0 +1,296 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from app.config import settings
+from app.db.session import SessionLocal
+from app.models.article import Article
+from app.services.ml_service import ml_service
+import logging
+import numpy as np
+import threading
+
+if TYPE_CHECKING:
+    from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+class IndexNotReady(Exception):
+    """The related article index is still being built"""
+
+class RelatedHit(NamedTuple):
+    article: Article
+    similarity: float
+
+def find_related(db: Session, article: Article, limit: int = 10) -> List[RelatedHit]:
+    """The articles most similar to ``article`` by cosine similarity of their TF-IDF vectors.
+
+    Other articles of the same near-duplicate cluster are left out: they are
+    the same story, not related ones. Raises IndexNotReady until the index has
+    been built.
+    """
+    related_articles.sync(db)
+    # Over-fetch so dropping cluster members and deleted articles still fills the page
+    ranked = related_articles.related(article.id, limit * 2 + 5)
+    if not ranked:
+        return []
+    articles = {
+        other.id: other
+        for other in db.query(Article).filter(Article.id.in_([id for id, _ in ranked]))
+    }
+    hits = []
+    for id, score in ranked:
+        other = articles.get(id)
+        if other is None or (article.cluster_id is not None and other.cluster_id == article.cluster_id):
+            continue
+        hits.append(RelatedHit(other, score))
+        if len(hits) == limit:
+            break
+    return hits
+
+def vectorize(features, texts: List[str]) -> "sparse.csr_matrix":
+    """Unit-length TF-IDF rows of texts, so dot products are cosine similarities"""
+    # Deferred like scikit-learn in ml_service, so importing the app stays light
+    from scipy import sparse
+    vectors = features.extract_features(texts)
+    norms = np.sqrt(np.asarray(vectors.multiply(vectors).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.csr_matrix(sparse.diags(1 / norms).astype(np.float32) @ vectors)
+
+def _impact_ordered(vectors: "sparse.csr_matrix", limit: int) -> "sparse.csc_matrix":
+    """Column-major copy of ``vectors`` keeping each column's ``limit`` largest weights, largest first"""
+    from scipy import sparse
+    columns = vectors.tocsc()
+    columns.sum_duplicates()
+    lengths = np.diff(columns.indptr)
+    column = np.repeat(np.arange(columns.shape[1]), lengths)
+    order = np.lexsort((-columns.data, column))
+    rank = np.arange(len(order)) - np.repeat(columns.indptr[:-1], lengths)
+    keep = order[rank < limit]
+    indptr = np.zeros(columns.shape[1] + 1, dtype=np.int64)
+    np.cumsum(np.minimum(lengths, limit), out=indptr[1:])
+    # Built from raw arrays so scipy keeps the weight order within each column
+    return sparse.csc_matrix((columns.data[keep], columns.indices[keep], indptr), shape=columns.shape)
+
+class RelatedIndex:
+    """Nearest-neighbor index over the unit-length TF-IDF vectors of all articles.
+
+    Vectors are kept twice: row-major to look up an article's own vector and
+    column-major, which gives every feature a posting list of the articles
+    using it. Posting lists keep only their RELATED_MAX_POSTINGS heaviest
+    entries, so a query walks a bounded number of postings however common its
+    features are, and never looks at articles sharing none of them. The
+    RELATED_RESCORE_CANDIDATES best candidates by these partial scores are
+    then rescored exactly from the row-major vectors. Results are exact until
+    posting lists get cut. New articles go to a small row-major tail that is
+    scanned in full and merged into the main matrices once it reaches
+    RELATED_MERGE_ROWS rows.
+
+    Vectors only compare within one vectorizer, so the index keeps the feature
+    extractor it was built with for later additions and is rebuilt, in the
+    background while the old one keeps serving, when a new model is published.
+    """
+
+    def __init__(
+        self,
+        merge_rows: Optional[int] = None,
+        max_postings: Optional[int] = None,
+        rescore: Optional[int] = None
+    ):
+        self.merge_rows = merge_rows or settings.RELATED_MERGE_ROWS
+        self.max_postings = max_postings or settings.RELATED_MAX_POSTINGS
+        self.rescore = rescore or settings.RELATED_RESCORE_CANDIDATES
+        self.version: Optional[str] = None
+        self.max_id = 0
+        self._features = None
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._positions: Dict[int, int] = {}
+        self._rows: Optional[sparse.csr_matrix] = None
+        self._postings: Optional[sparse.csc_matrix] = None
+        # Per-lookup score accumulator, zeroed again after every use
+        self._scratch = np.zeros(0, dtype=np.float32)
+        self._tail_ids: List[int] = []
+        self._tail: Optional[sparse.csr_matrix] = None
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._features is not None
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def rebuild(self, db: Session, chunk_size: int = 5000) -> None:
+        """Vectorize every article with the live model and swap the result in"""
+        from scipy import sparse
+        with self._rebuild_lock:
+            classifier = ml_service.classifier
+            if not classifier.is_fitted:
+                return
+            features, version = classifier.text_features, ml_service.model_version
+
+            ids: List[int] = []
+            blocks: List[sparse.csr_matrix] = []
+            last_id = 0
+            while True:
+                rows = db.execute(
+                    select(Article.id, Article.title, Article.summary)
+                    .where(Article.id > last_id)
+                    .order_by(Article.id)
+                    .limit(chunk_size)
+                ).all()
+                if not rows:
+                    break
+                ids.extend(row.id for row in rows)
+                blocks.append(vectorize(features, [f"{row.title}\n{row.summary}" for row in rows]))
+                last_id = rows[-1].id
+
+            self.build(features, version, ids, sparse.vstack(blocks, format="csr") if blocks else None)
+            logger.info(f"Built the related article index over {len(ids)} articles with model {version}")
+
+    def build(self, features, version: Optional[str], ids: List[int], vectors: Optional["sparse.csr_matrix"]) -> None:
+        """Replace the index with unit-length ``vectors`` of articles ``ids`` (in id order) made by ``features``"""
+        with self._lock:
+            self._features, self.version = features, version
+            self.max_id = ids[-1] if ids else 0
+            self._ids = np.array(ids, dtype=np.int64)
+            self._positions = {id: position for position, id in enumerate(ids)}
+            self._set_rows(vectors)
+            self._tail_ids, self._tail = [], None
+
+    def sync(self, db: Session) -> None:
+        """Add articles stored since the last sync by any process
+
+        The first call starts building the index in the background, which reads
+        and vectorizes every article, and raises IndexNotReady until it is done.
+        """
+        if not self.ready:
+            self._rebuild_in_background()
+            raise IndexNotReady("Related articles are being indexed, try again shortly")
+        if self.version != ml_service.model_version:
+            self._rebuild_in_background()
+
+        latest = db.scalar(select(func.max(Article.id))) or 0
+        if latest > self.max_id:
+            rows = db.execute(
+                select(Article.id, Article.title, Article.summary)
+                .where(Article.id > self.max_id)
+                .order_by(Article.id)
+            ).all()
+            self.add([row.id for row in rows], [f"{row.title}\n{row.summary}" for row in rows])
+            with self._lock:
+                self.max_id = max(self.max_id, latest)
+
+    def _rebuild_in_background(self) -> None:
+        if self._rebuild_lock.locked():
+            return
+
+        def run():
+            db = SessionLocal()
+            try:
+                self.rebuild(db)
+            except Exception as e:
+                logger.error(f"Failed to rebuild the related article index: {e}")
+            finally:
+                db.close()
+
+        threading.Thread(target=run, name="related-index-rebuild", daemon=True).start()
+
+    def add(self, ids: Sequence[int], texts: Sequence[str]) -> None:
+        """Index new articles; a no-op before the first build, which will include them"""
+        from scipy import sparse
+        features = self._features
+        if features is None:
+            return
+        new = [(id, text) for id, text in zip(ids, texts) if id not in self._positions]
+        if not new:
+            return
+        vectors = vectorize(features, [text for _, text in new])
+        with self._lock:
+            if features is not self._features:
+                # Rebuilt meanwhile, with a different vectorizer
+                return
+            # Another thread may have added some of them meanwhile
+            keep = [offset for offset, (id, _) in enumerate(new) if id not in self._positions]
+            if not keep:
+                return
+            for offset in keep:
+                self._positions[new[offset][0]] = len(self._ids) + len(self._tail_ids)
+                self._tail_ids.append(new[offset][0])
+            blocks = ([self._tail] if self._tail is not None else []) + [vectors[keep]]
+            self._tail = sparse.vstack(blocks, format="csr")
+            if len(self._tail_ids) >= self.merge_rows:
+                self._merge()
+
+    def _set_rows(self, vectors: Optional["sparse.csr_matrix"]) -> None:
+        self._rows = vectors
+        self._postings = _impact_ordered(vectors, self.max_postings) if vectors is not None else None
+        self._scratch = np.zeros(vectors.shape[0] if vectors is not None else 0, dtype=np.float32)
+
+    def _merge(self) -> None:
+        from scipy import sparse
+        blocks = ([self._rows] if self._rows is not None else []) + [self._tail]
+        self._set_rows(sparse.vstack(blocks, format="csr"))
+        self._ids = np.concatenate([self._ids, np.array(self._tail_ids, dtype=np.int64)])
+        self._tail_ids, self._tail = [], None
+
+    def _vector(self, position: int) -> "sparse.csr_matrix":
+        if position < len(self._ids):
+            return self._rows[position]
+        return self._tail[position - len(self._ids)]
+
+    def related(self, article_id: int, k: int) -> List[Tuple[int, float]]:
+        """(article id, cosine similarity) of the k nearest articles, most similar first"""
+        with self._lock:
+            position = self._positions.get(article_id)
+            if position is None or k <= 0:
+                return []
+            query = self._vector(position)
+            ids = self._ids
+            candidates, scores = [], []
+            if self._postings is not None:
+                top, top_scores = self._top_indexed(query, position, k)
+                candidates.append(ids[top])
+                scores.append(top_scores)
+            if self._tail is not None:
+                tail_scores = np.asarray(self._tail[:, query.indices] @ query.data).ravel()
+                tail_ids = np.array(self._tail_ids, dtype=np.int64)
+                keep = tail_ids != article_id
+                candidates.append(tail_ids[keep])
+                scores.append(tail_scores[keep])
+        if not candidates:
+            return []
+
+        candidates, scores = np.concatenate(candidates), np.concatenate(scores)
+        order = np.lexsort((candidates, -scores))[:k]
+        return [(int(candidates[i]), float(scores[i])) for i in order if scores[i] > 0]
+
+    def _top_indexed(self, query: "sparse.csr_matrix", position: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions and scores of the k best main-matrix articles other than ``position``"""
+        postings, scratch = self._postings, self._scratch
+        walked = []
+        for feature, weight in zip(query.indices, query.data):
+            start, end = postings.indptr[feature], postings.indptr[feature + 1]
+            rows = postings.indices[start:end]
+            # Positions are unique within one posting list, so fancy += is safe
+            scratch[rows] += weight * postings.data[start:end]
+            walked.append(rows)
+        if not walked:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        candidates = np.concatenate(walked)
+        partial = scratch[candidates]
+        scratch[candidates] = 0
+
+        # Cut posting lists underestimate some scores, so a wide margin of the
+        # best candidates is rescored exactly from the full vectors
+        if len(candidates) > self.rescore:
+            candidates = candidates[np.argpartition(-partial, self.rescore - 1)[:self.rescore]]
+        candidates = np.unique(candidates)
+        candidates = candidates[candidates != position]
+        scores = np.asarray(self._rows[candidates][:, query.indices] @ query.data).ravel()
+        if len(candidates) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            return candidates[top], scores[top]
+        return candidates, scores
+
+related_articles = RelatedIndex()
\ No newline at end of file
@@ -0,0 +1,302 @@
+from array import array
+from collections import Counter
+from sqlalchemy import event, func, inspect, literal_column, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from app.config import settings
+from app.models.article import Article
+import logging
+import math
+import numpy as np
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+class SearchHit(NamedTuple):
+    article: Article
+    rank: float
+    snippet: Optional[str]
+
+# Maintained by a trigger on PostgreSQL (see the article_search migration) and
+# deliberately not mapped, so ordinary article loads never fetch it
+search_vector = literal_column("articles.search_vector", TSVECTOR)
+
+_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MinWords=15, MaxWords=35"
+
+def search_articles(db: Session, q: str, skip: int = 0, limit: int = 20) -> List[SearchHit]:
+    """Articles matching every word of ``q``, best match first, with a highlighted snippet.
+
+    PostgreSQL ranks with the GIN-indexed tsvector and understands web search
+    syntax ("quoted phrases", -exclusions, or). Other databases fall back to
+    the in-process inverted index, which only matches plain words.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return _search_postgres(db, q, skip, limit)
+    return _search_fallback(db, q, skip, limit)
+
+def _search_postgres(db: Session, q: str, skip: int, limit: int) -> List[SearchHit]:
+    query = func.websearch_to_tsquery(settings.SEARCH_LANGUAGE, q)
+    # Normalization 32 maps the rank into [0, 1)
+    rank = func.ts_rank_cd(search_vector, query, 32)
+    page = (
+        select(Article.id, rank.label("rank"))
+        .where(search_vector.op("@@")(query))
+        .order_by(rank.desc(), Article.id.desc())
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+    )
+    # Headlines are expensive, so only build them for the page
+    snippet = func.ts_headline(
+        settings.SEARCH_LANGUAGE,
+        func.coalesce(Article.summary, Article.title),
+        query,
+        _HEADLINE_OPTIONS
+    )
+    rows = (
+        db.query(Article, page.c.rank, snippet)
+        .join(page, page.c.id == Article.id)
+        .order_by(page.c.rank.desc(), Article.id.desc())
+        .all()
+    )
+    return [SearchHit(article, rank, snippet) for article, rank, snippet in rows]
+
+def _search_fallback(db: Session, q: str, skip: int, limit: int) -> List[SearchHit]:
+    search_index.sync(db)
+    terms = analyze(q)
+    ranked = search_index.search(terms, skip + limit)[skip:]
+    if not ranked:
+        return []
+    articles = {
+        article.id: article
+        for article in db.query(Article).filter(Article.id.in_([id for id, _ in ranked]))
+    }
+    # Articles deleted by another process are still in this one's index
+    return [
+        SearchHit(articles[id], rank, highlight(articles[id], set(terms)))
+        for id, rank in ranked if id in articles
+    ]
+
+_WORD = re.compile(r"[a-z0-9]+")
+_WORD_IN_TOKEN = re.compile(r"[A-Za-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in into is it its of on or that the their "
+    "this to was were will with".split()
+)
+
+def _stem(word: str) -> str:
+    # Light suffix stripping, enough for plurals and simple verb forms to match
+    for suffix in ("ing", "ed", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3 and not word.endswith("ss"):
+            return word[:-len(suffix)]
+    return word
+
+def analyze(text: Optional[str]) -> List[str]:
+    """Index terms of a text, in order"""
+    if not text:
+        return []
+    return [_stem(word) for word in _WORD.findall(text.lower()) if word not in _STOPWORDS]
+
+def highlight(article: Article, terms: set, words: int = 35) -> Optional[str]:
+    """A window of the summary (or title) around the first matching word, matches in <mark>"""
+    for text in (article.summary, article.title):
+        if not text:
+            continue
+        tokens = text.split()
+        first = next(
+            (i for i, token in enumerate(tokens) if terms.intersection(analyze(token))),
+            None
+        )
+        if first is None:
+            continue
+        start = max(0, min(first - words // 3, len(tokens) - words))
+        return " ".join(
+            _WORD_IN_TOKEN.sub(lambda m: _mark(m.group(0), terms), token)
+            for token in tokens[start:start + words]
+        )
+    return article.title
+
+def _mark(word: str, terms: set) -> str:
+    return f"<mark>{word}</mark>" if _stem(word.lower()) in terms else word
+
+# Relative weights of the fields, as setweight A/B/C do with ts_rank's defaults
+_FIELD_WEIGHTS = (("title", 1.0), ("key_points", 0.4), ("summary", 0.2))
+
+class SearchIndex:
+    """In-process inverted index over article text, for databases without full-text search.
+
+    Every version of a document gets a new slot; postings map a term to the
+    slots containing it and the term's field-weighted frequency there, in slot
+    order, so they are append only. Updating or deleting an article just marks
+    its old slot dead. Matches are ranked with BM25 on the weighted frequencies.
+
+    The index is built on first use and then kept current by tailing new
+    article ids and by the session listeners below, which see ORM updates and
+    deletes made in this process.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self.built = False
+        self.max_id = 0
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._ids = np.zeros(1024, dtype=np.int64)
+        self._lengths = np.zeros(1024, dtype=np.float32)
+        self._alive = np.zeros(1024, dtype=bool)
+        self._size = 0
+        self._slots: Dict[int, int] = {}
+        self._total_length = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, article_id: int) -> bool:
+        return article_id in self._slots
+
+    def sync(self, db: Session, chunk_size: int = 5000) -> None:
+        """Index every article with an id above the highest one indexed so far"""
+        with self._lock:
+            latest = db.scalar(select(func.max(Article.id))) or 0
+            while self.max_id < latest:
+                rows = db.execute(
+                    select(Article.id, Article.title, Article.summary, Article.key_points)
+                    .where(Article.id > self.max_id)
+                    .order_by(Article.id)
+                    .limit(chunk_size)
+                ).all()
+                if not rows:
+                    break
+                for row in rows:
+                    self._add(*row)
+                self.max_id = rows[-1].id
+            if not self.built:
+                logger.info(f"Built the fallback search index over {len(self._slots)} articles")
+            self.built = True
+
+    def add(self, article_id: int, title: Optional[str], summary: Optional[str], key_points: Optional[Sequence[str]]) -> None:
+        with self._lock:
+            self._add(article_id, title, summary, key_points)
+
+    def remove(self, article_id: int) -> None:
+        with self._lock:
+            self._remove(article_id)
+
+    def _add(self, article_id, title, summary, key_points) -> None:
+        self._remove(article_id)
+        fields = {"title": title, "key_points": " ".join(key_points or []), "summary": summary}
+        frequencies: Counter = Counter()
+        length = 0
+        for field, weight in _FIELD_WEIGHTS:
+            terms = analyze(fields[field])
+            length += len(terms)
+            for term in terms:
+                frequencies[term] += weight
+
+        slot = self._size
+        if slot == len(self._ids):
+            self._ids = np.concatenate([self._ids, np.zeros_like(self._ids)])
+            self._lengths = np.concatenate([self._lengths, np.zeros_like(self._lengths)])
+            self._alive = np.concatenate([self._alive, np.zeros_like(self._alive)])
+        self._size += 1
+        self._ids[slot] = article_id
+        self._lengths[slot] = length
+        self._alive[slot] = True
+        self._slots[article_id] = slot
+        self._total_length += length
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = (array("i"), array("f"))
+            postings[0].append(slot)
+            postings[1].append(frequency)
+
+    def _remove(self, article_id: int) -> None:
+        slot = self._slots.pop(article_id, None)
+        if slot is not None:
+            self._alive[slot] = False
+            self._total_length -= float(self._lengths[slot])
+
+    def search(self, terms: Iterable[str], top: int) -> List[Tuple[int, float]]:
+        """(article id, score) of the ``top`` best articles containing every term"""
+        terms = set(terms)
+        if not terms or top <= 0:
+            return []
+        with self._lock:
+            postings = []
+            for term in terms:
+                if term not in self._postings:
+                    return []
+                slots, frequencies = self._postings[term]
+                # Copies, so the arrays can keep growing while these are alive
+                postings.append((np.array(slots, dtype=np.int32), np.array(frequencies, dtype=np.float32)))
+            alive = self._alive[:self._size].copy()
+            lengths = self._lengths[:self._size].copy()
+            ids = self._ids[:self._size].copy()
+            documents = len(self._slots)
+            average_length = self._total_length / documents if documents else 0.0
+
+        # Intersect starting from the rarest term
+        postings.sort(key=lambda p: len(p[0]))
+        matches = postings[0][0]
+        for slots, _ in postings[1:]:
+            matches = np.intersect1d(matches, slots, assume_unique=True)
+        matches = matches[alive[matches]]
+        if not len(matches):
+            return []
+
+        norm = self.K1 * (1 - self.B + self.B * lengths[matches] / max(average_length, 1e-9))
+        scores = np.zeros(len(matches), dtype=np.float64)
+        for slots, frequencies in postings:
+            df = int(np.count_nonzero(alive[slots]))
+            idf = math.log(1 + (documents - df + 0.5) / (df + 0.5))
+            tf = frequencies[np.searchsorted(slots, matches)]
+            scores += idf * tf * (self.K1 + 1) / (tf + norm)
+
+        matched_ids = ids[matches]
+        if len(matches) > top:
+            # Keep everything tied with the last place so the order stays stable
+            threshold = np.partition(scores, len(scores) - top)[len(scores) - top]
+            keep = scores >= threshold
+            scores, matched_ids = scores[keep], matched_ids[keep]
+        order = np.lexsort((-matched_ids, -scores))[:top]
+        return [(int(matched_ids[i]), float(scores[i])) for i in order]
+
+search_index = SearchIndex()
+
+# Keep a built index current with ORM writes made in this process. New
+# articles are picked up by sync anyway; these catch edits and deletes.
+_CHANGES = "search_index_changes"
+_TEXT_FIELDS = ("title", "summary", "key_points")
+
+@event.listens_for(Session, "after_flush")
+def _record_article_changes(session, flush_context):
+    if not search_index.built:
+        return
+    changes = session.info.setdefault(_CHANGES, {})
+    for instance in session.deleted:
+        if isinstance(instance, Article):
+            changes[instance.id] = None
+    for instance in session.dirty:
+        if isinstance(instance, Article) and any(
+            inspect(instance).attrs[field].history.has_changes() for field in _TEXT_FIELDS
+        ):
+            changes[instance.id] = (instance.title, instance.summary, instance.key_points)
+
+@event.listens_for(Session, "after_commit")
+def _apply_article_changes(session):
+    changes = session.info.pop(_CHANGES, None)
+    for article_id, fields in (changes or {}).items():
+        if fields is None:
+            search_index.remove(article_id)
+        elif article_id in search_index:
+            search_index.add(article_id, *fields)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_article_changes(session):
+    session.info.pop(_CHANGES, None)
\ No newline at end of file
@@ -0,0 +1,243 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+from app.config import settings
+from app.models.article import Article
+import functools
+import hashlib
+import json
+import logging
+import math
+import numpy as np
+import os
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+_EPOCH = datetime(1970, 1, 1)
+_WINDOW = re.compile(r"^(\d+)([mhd])$")
+_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+
+class TrendingTopic(NamedTuple):
+    term: str
+    count: int
+    previous_count: int
+    score: float
+
+def parse_window(window: str) -> timedelta:
+    """A window like "90m", "24h" or "7d" as a timedelta"""
+    match = _WINDOW.match(window.strip().lower())
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(f"Invalid window {window!r}, expected a number of minutes, hours or days like 24h")
+    return timedelta(**{_UNITS[match.group(2)]: int(match.group(1))})
+
+@functools.lru_cache(maxsize=65536)
+def _columns(term: str, depth: int, width: int) -> tuple:
+    # One independent hash per sketch row. Not crc32 with a seed per row: CRCs
+    # are linear, so terms colliding in one row would collide in all of them
+    digest = hashlib.blake2b(term.encode(), digest_size=4 * depth).digest()
+    return tuple(int.from_bytes(digest[4 * row:4 * row + 4], "little") % width for row in range(depth))
+
+class _Bucket:
+    """Article counts per term for one time bucket: a count-min sketch and its heaviest terms"""
+
+    __slots__ = ("sketch", "top", "floor")
+
+    def __init__(self, sketch: np.ndarray, top: Optional[Dict[str, int]] = None):
+        self.sketch = sketch
+        self.top = top or {}
+        self.floor = min(self.top.values()) if self.top else 0
+
+    def add(self, term: str, capacity: int) -> None:
+        columns = _columns(term, *self.sketch.shape)
+        rows = range(len(columns))
+        # Conservative update: only raise the counters that are at the
+        # minimum, which keeps the others from drifting up with collisions
+        counters = self.sketch[rows, columns]
+        estimate = int(counters.min()) + 1
+        self.sketch[rows, columns] = np.maximum(counters, estimate)
+        if term in self.top or len(self.top) < capacity:
+            self.top[term] = estimate
+        elif estimate > self.floor:
+            # Counts only grow, so the smallest tracked one makes room
+            del self.top[min(self.top, key=self.top.get)]
+            self.top[term] = estimate
+            self.floor = min(self.top.values())
+
+class TrendingTopics:
+    """Sliding-window counts of the articles mentioning each key point term.
+
+    Time is cut into buckets of TRENDING_BUCKET_MINUTES by ``date_found``.
+    Each bucket counts terms in a count-min sketch, whose estimates never
+    undercount and overcount by little, and remembers its heaviest terms as
+    candidates. A window sums the sketches of its buckets and ranks the
+    candidates by how far their count rose above the window before it, so
+    memory is fixed by the settings however many distinct terms show up.
+
+    The counts follow new article ids like the other in-process indexes and
+    are saved to a snapshot so a restart only reads articles stored since.
+    """
+
+    def __init__(
+        self,
+        bucket_minutes: Optional[int] = None,
+        max_window_hours: Optional[int] = None,
+        width: Optional[int] = None,
+        depth: Optional[int] = None,
+        terms_per_bucket: Optional[int] = None,
+        snapshot_path: Optional[str] = None
+    ):
+        self.bucket_seconds = (bucket_minutes or settings.TRENDING_BUCKET_MINUTES) * 60
+        max_window = (max_window_hours or settings.TRENDING_MAX_WINDOW_HOURS) * 3600
+        self.max_window_buckets = math.ceil(max_window / self.bucket_seconds)
+        self.width = width or settings.TRENDING_SKETCH_WIDTH
+        self.depth = depth or settings.TRENDING_SKETCH_DEPTH
+        self.terms_per_bucket = terms_per_bucket or settings.TRENDING_TERMS_PER_BUCKET
+        self.snapshot_path = Path(snapshot_path or settings.TRENDING_SNAPSHOT_PATH)
+        self.loaded = False
+        self.max_id = 0
+        self._buckets: Dict[int, _Bucket] = {}
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def _index(self, moment: datetime) -> int:
+        return int((moment - _EPOCH).total_seconds() // self.bucket_seconds)
+
+    def _cutoff(self, current: int) -> int:
+        # Kept: the longest window and the one before it
+        return current - 2 * self.max_window_buckets
+
+    def add(self, found: datetime, terms: Iterable[str]) -> None:
+        """Count an article found at ``found`` once for each distinct term"""
+        terms = {term.strip().lower() for term in terms if term and term.strip()}
+        index = self._index(found)
+        with self._lock:
+            current = max(self._buckets, default=index)
+            if not terms or index <= self._cutoff(current):
+                return
+            bucket = self._buckets.get(index)
+            if bucket is None:
+                bucket = self._buckets[index] = _Bucket(np.zeros((self.depth, self.width), dtype=np.int32))
+                cutoff = self._cutoff(max(current, index))
+                for old in [old for old in self._buckets if old <= cutoff]:
+                    del self._buckets[old]
+            for term in terms:
+                bucket.add(term, self.terms_per_bucket)
+
+    def trending(self, window: timedelta, limit: int = 20, now: Optional[datetime] = None) -> List[TrendingTopic]:
+        """The terms whose article count rose the most in the last ``window`` over the one before"""
+        span = math.ceil(window.total_seconds() / self.bucket_seconds)
+        if span > self.max_window_buckets:
+            raise ValueError(f"Window longer than the {settings.TRENDING_MAX_WINDOW_HOURS}h kept")
+        current = self._index(now or datetime.utcnow())
+        with self._lock:
+            recent = [b for i, b in self._buckets.items() if current - span < i <= current]
+            previous = [b for i, b in self._buckets.items() if current - 2 * span < i <= current - span]
+            candidates = sorted({term for bucket in recent for term in bucket.top})
+            if not candidates:
+                return []
+            counts = self._estimate(recent, candidates)
+            previous_counts = self._estimate(previous, candidates)
+
+        # Rise over the previous window in units of its standard deviation,
+        # were the counts Poisson
+        scores = (counts - previous_counts) / np.sqrt(previous_counts + 1)
+        keep = np.flatnonzero(counts >= settings.TRENDING_MIN_COUNT)
+        order = keep[np.lexsort((-counts[keep], -scores[keep]))][:limit]
+        return [
+            TrendingTopic(candidates[i], int(counts[i]), int(previous_counts[i]), round(float(scores[i]), 3))
+            for i in order
+        ]
+
+    def _estimate(self, buckets: Sequence[_Bucket], terms: Sequence[str]) -> np.ndarray:
+        if not buckets:
+            return np.zeros(len(terms), dtype=np.int64)
+        total = np.sum([bucket.sketch for bucket in buckets], axis=0, dtype=np.int64)
+        columns = np.array([_columns(term, self.depth, self.width) for term in terms])
+        return total[np.arange(self.depth), columns].min(axis=1)
+
+    def sync(self, db: Session, chunk_size: int = 5000) -> None:
+        """Count the articles stored since the last sync, by any process
+
+        The first sync restores the snapshot, or without one counts the
+        articles found within the kept span.
+        """
+        with self._sync_lock:
+            query = select(Article.id, Article.date_found, Article.key_points).where(Article.key_points.is_not(None))
+            if not self.loaded:
+                self.loaded = True
+                if not self.load():
+                    since = datetime.utcnow() - timedelta(seconds=2 * self.max_window_buckets * self.bucket_seconds)
+                    query = query.where(Article.date_found >= since)
+            while True:
+                rows = db.execute(
+                    query.where(Article.id > self.max_id).order_by(Article.id).limit(chunk_size)
+                ).all()
+                for row in rows:
+                    if row.date_found is not None:
+                        self.add(row.date_found, row.key_points)
+                if not rows:
+                    break
+                self.max_id = rows[-1].id
+
+    def save(self) -> None:
+        """Write the counts to the snapshot file, atomically"""
+        if not self.loaded:
+            # Nothing counted yet; keep the snapshot there is
+            return
+        with self._lock:
+            indexes = sorted(self._buckets)
+            sketches = np.array([self._buckets[i].sketch for i in indexes], dtype=np.int32)
+            tops = [self._buckets[i].top for i in indexes]
+            max_id = self.max_id
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_name(f".{self.snapshot_path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                meta=np.array(json.dumps({
+                    "format": SNAPSHOT_FORMAT,
+                    "bucket_seconds": self.bucket_seconds,
+                    "max_id": max_id
+                })),
+                indexes=np.array(indexes, dtype=np.int64),
+                sketches=sketches.reshape(len(indexes), self.depth, self.width),
+                tops=np.array(json.dumps(tops))
+            )
+        os.replace(tmp_path, self.snapshot_path)
+
+    def load(self) -> bool:
+        """Replace the counts with the snapshot's, if there is a compatible one"""
+        if not self.snapshot_path.exists():
+            return False
+        try:
+            with np.load(self.snapshot_path) as snapshot:
+                meta = json.loads(str(snapshot["meta"]))
+                indexes, sketches = snapshot["indexes"], snapshot["sketches"]
+                tops = json.loads(str(snapshot["tops"]))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable trending topics snapshot {self.snapshot_path}: {e}")
+            return False
+        if (
+            meta.get("format") != SNAPSHOT_FORMAT
+            or meta.get("bucket_seconds") != self.bucket_seconds
+            or sketches.shape[1:] != (self.depth, self.width)
+        ):
+            logger.warning(f"Ignoring trending topics snapshot {self.snapshot_path} made with other settings")
+            return False
+
+        with self._lock:
+            self._buckets = {
+                int(index): _Bucket(sketch.copy(), top)
+                for index, sketch, top in zip(indexes, sketches, tops)
+            }
+            self.max_id = meta["max_id"]
+        logger.info(f"Restored trending topics up to article {self.max_id} from {self.snapshot_path}")
+        return True
+
+trending_topics = TrendingTopics()
\ No newline at end of file
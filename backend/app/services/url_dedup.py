@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from sqlalchemy.orm import Session
+from typing import Iterable, List
+from app.config import settings
+from app.models.article import Article
+import threading
+
+class RecentUrlCache:
+    """Thread-safe LRU set of article URLs known to be stored already"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._urls: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            if url not in self._urls:
+                return False
+            self._urls.move_to_end(url)
+            return True
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        if self.capacity <= 0:
+            return
+        with self._lock:
+            for url in urls:
+                self._urls[url] = None
+                self._urls.move_to_end(url)
+            while len(self._urls) > self.capacity:
+                self._urls.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._urls.clear()
+
+recent_urls = RecentUrlCache(settings.FEED_SEEN_URL_CACHE_SIZE)
+
+def filter_new_entries(db: Session, entries: Iterable) -> List:
+    """Return the feed entries whose URL is not stored yet, in feed order.
+
+    Entries are checked against the in-process cache first; whatever is left is
+    resolved with a single ``url IN (...)`` query, so a feed costs at most one
+    round trip however many entries it has.
+    """
+    candidates = {}
+    for entry in entries:
+        url = getattr(entry, 'link', None)
+        if url and url not in candidates and url not in recent_urls:
+            candidates[url] = entry
+    
+    if not candidates:
+        return []
+    
+    existing = {
+        url for (url,) in
+        db.query(Article.url).filter(Article.url.in_(list(candidates))).all()
+    }
+    recent_urls.add_many(existing)
+    return [entry for url, entry in candidates.items() if url not in existing]
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""Article list latency: join-and-aggregate counts against stored counters.
+
+Builds a SQLite database with --articles articles and --interactions
+interactions (1M by default, reused from --db on later runs), then times a
+page of ``GET /articles`` both ways:
+
+* ``join``     the previous query, LEFT OUTER JOIN interactions with COUNT and
+  SUM(CASE ...) grouped by article
+* ``counters`` list_articles as it is now, reading the denormalized columns
+
+It also times reconcile_interaction_counts over the whole table and a single
+record_interactions write, checks that both list variants agree, and compares
+deep pages fetched with ``skip`` against the same pages fetched by cursor.
+
+    cd backend && python -m benchmarks.bench_article_list --interactions 1000000
+"""
+from benchmarks.db import session, sqlite_engine
+from datetime import datetime, timedelta
+from pathlib import Path
+from sqlalchemy import case, func, insert
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+TYPES = ["click"] * 6 + ["save"] * 2 + ["dismiss", "share"]
+
+def populate(db, articles: int, interactions: int, seed: int = 42) -> None:
+    from app.models.article import Article
+    from app.models.interaction import Interaction
+    from app.models.user import User
+
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    db.execute(insert(User), [{"id": 1, "email": "bench@example.com", "hashed_password": "x"}])
+    db.execute(insert(Article), [
+        {
+            "id": i,
+            "title": f"Article {i}",
+            "url": f"https://example.com/{i}",
+            "source": "bench",
+            "category": rng.choice(["Models/Agents", "Tools", "Research"]),
+            "priority": "Low",
+            "date_found": now - timedelta(minutes=i)
+        }
+        for i in range(1, articles + 1)
+    ])
+    chunk = 100000
+    for start in range(0, interactions, chunk):
+        db.execute(insert(Interaction), [
+            {
+                "user_id": 1,
+                # Recent articles get most of the traffic
+                "article_id": min(articles, int(rng.paretovariate(1.2))),
+                "interaction_type": rng.choice(TYPES),
+                "timestamp": now
+            }
+            for _ in range(min(chunk, interactions - start))
+        ])
+    db.commit()
+
+def join_query(db, category, skip: int, limit: int):
+    """The list query before the counters were stored on articles"""
+    from app.models.article import Article
+    from app.models.interaction import Interaction
+
+    query = db.query(
+        Article,
+        func.count(Interaction.id).label('interaction_count'),
+        func.sum(case((Interaction.interaction_type == 'save', 1), else_=0)).label('save_count'),
+        func.sum(case((Interaction.interaction_type == 'click', 1), else_=0)).label('click_count')
+    ).outerjoin(Interaction)
+    if category:
+        query = query.filter(Article.category == category)
+    rows = query.group_by(Article.id).order_by(Article.date_found.desc()).offset(skip).limit(limit).all()
+    return [(a.id, n or 0, s or 0, c or 0) for a, n, s, c in rows]
+
+def timed(fn, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=20000)
+    parser.add_argument("--interactions", type=int, default=1000000)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 50, 300], help="depths for skip vs cursor")
+    parser.add_argument("--db", type=Path, help="database file, reused if it exists")
+    args = parser.parse_args()
+
+    from app.api.routes.articles import list_articles
+    from app.core.pagination import encode_cursor
+    from app.models.interaction import Interaction
+    from app.services.interaction_service import reconcile_interaction_counts, record_interactions
+
+    path = args.db or Path(tempfile.mkdtemp()) / "bench.db"
+    fresh = not path.exists()
+    db = session(sqlite_engine(str(path)))
+    if fresh:
+        started = time.perf_counter()
+        populate(db, args.articles, args.interactions)
+        print(f"populated in {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    fixed = reconcile_interaction_counts(db)
+    print(f"reconcile: {fixed} articles updated in {time.perf_counter() - started:.2f}s")
+
+    print(f"{'page':<24}{'join ms':>10}{'counters ms':>13}{'speedup':>9}")
+    for label, category, skip in [
+        ("first page", None, 0),
+        ("first page, category", "Tools", 0),
+        ("page 50", None, 1000),
+    ]:
+        def counters():
+            articles, _ = list_articles(db, skip=skip, limit=20, category=category)
+            return [(a.id, a.interaction_count, a.save_count, a.click_count) for a in articles]
+
+        assert join_query(db, category, skip, 20) == counters(), label
+        before = timed(lambda: join_query(db, category, skip, 20), args.runs)
+        after = timed(counters, args.runs)
+        print(f"{label:<24}{before:>10.1f}{after:>13.1f}{before / after:>8.0f}x")
+
+    print(f"{'page':<24}{'skip ms':>10}{'cursor ms':>13}")
+    for page in args.pages:
+        for category in [None, "Tools"]:
+            skip = (page - 1) * 20
+            def by_skip():
+                return list_articles(db, skip=skip, limit=20, category=category)[0]
+            cursor = None
+            if skip:
+                previous, _ = list_articles(db, skip=skip - 20, limit=20, category=category)
+                cursor = encode_cursor(previous[-1].date_found, previous[-1].id)
+            def by_cursor():
+                return list_articles(db, limit=20, category=category, cursor=cursor)[0]
+
+            assert [a.id for a in by_skip()] == [a.id for a in by_cursor()]
+            label = f"page {page}" + (f", {category}" if category else "")
+            print(f"{label:<24}{timed(by_skip, args.runs):>10.2f}{timed(by_cursor, args.runs):>13.2f}")
+
+    def write():
+        record_interactions(db, [Interaction(user_id=1, article_id=1, interaction_type="click")])
+    print(f"record_interactions: {timed(write, args.runs):.2f} ms per write")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""Benchmark per-article classification cost at different batch sizes.
+
+Trains an ArticleClassifier on a synthetic corpus, then classifies the same
+articles one call at a time (the old ingestion path) and through predict_batch.
+
+    cd backend && python -m benchmarks.bench_classify_batch
+"""
+from benchmarks.corpus import synthetic_articles
+from app.ml.models.article_classifier import ArticleClassifier
+from pathlib import Path
+import argparse
+import tempfile
+import time
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--train", type=int, default=3000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    args = parser.parse_args()
+
+    corpus = synthetic_articles(args.train)
+    texts = [f"{title}\n{summary}" for title, summary, _, _ in corpus]
+    classifier = ArticleClassifier(model_dir=Path(tempfile.mkdtemp()))
+    classifier.fit(texts, [c[2] for c in corpus], [c[3] for c in corpus])
+
+    print(f"{'batch':>6}{'single ms/article':>20}{'batch ms/article':>20}{'speedup':>10}")
+    for size in args.sizes:
+        batch = texts[:size]
+
+        started = time.perf_counter()
+        singles = [classifier.predict(text) for text in batch]
+        single = (time.perf_counter() - started) / size
+
+        started = time.perf_counter()
+        batched = classifier.predict_batch(batch)
+        batch_cost = (time.perf_counter() - started) / size
+
+        assert [r["category"] for r in singles] == [r["category"] for r in batched]
+        print(f"{size:>6}{single * 1000:>20.3f}{batch_cost * 1000:>20.3f}{single / batch_cost:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""Text cleaning: the precompiled cleaner against the original four-step one.
+
+Runs both implementations over a fixture corpus (synthetic articles plus
+hand-written edge cases: URLs glued to punctuation, unicode letters and digits,
+underscores, tabs and newlines) and exits non-zero unless every output is
+byte-for-byte identical. Then times them per text and, with --processes, the
+pooled batch path used during training.
+
+    cd backend && python -m benchmarks.bench_clean_text --articles 50000 --processes 4
+"""
+from benchmarks.corpus import synthetic_articles
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import random
+import re
+import sys
+import time
+
+EDGE_CASES = [
+    "",
+    "   ",
+    "Hello, World!",
+    "GPT-4o beats 3 of 5 benchmarks (see https://openai.com/blog?x=1).",
+    "visit www.example.com/path,then http://a.b/c!done",
+    "(https://x.y/z)trailing and http:// bare and https:",
+    "Mixed\tTABS\nand\r\nnewlines   everywhere",
+    "snake_case_names and __dunder__ stay",
+    "Unicode: Café naïve résumé 東京 ١٢٣ ½ ² Ⅻ",
+    "numbers123inside and 2024-05-01 dates 3.14",
+    "shttp://embedded httpwww and wwwhttp://both",
+    "emoji 🚀🤖 and symbols © ® ™ € £",
+    "ALL CAPS HEADLINE: THE AI SPRING!!!",
+    "İstanbul ǅ ß ﬁ \u212a",  # lower() that changes length or leaves ASCII
+    "ctrl\x00chars\x1cfile\x1dsep\x7fdel\x0bvt\x0cff",
+]
+
+def clean_text_original(text: str) -> str:
+    """The implementation clean_text replaced, kept verbatim for comparison"""
+    text = text.lower()
+    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'[^\w\s]', '', text)
+    text = re.sub(r'\d+', '', text)
+    text = ' '.join(text.split())
+    return text
+
+def fixture_corpus(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    texts = [f"{title}\n{summary}" for title, summary, _, _ in synthetic_articles(n, seed=seed)]
+    # Splice edge cases into random articles as well as testing them alone
+    for i in range(0, len(texts), 10):
+        case = rng.choice(EDGE_CASES)
+        cut = rng.randint(0, len(texts[i]))
+        texts[i] = texts[i][:cut] + case + texts[i][cut:]
+    return EDGE_CASES + texts
+
+def timed(fn, *args) -> tuple:
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=20000)
+    parser.add_argument("--processes", type=int, default=0, help="also time the pooled batch path")
+    args = parser.parse_args()
+
+    from app.ml.features.text_features import clean_text, clean_texts
+
+    texts = fixture_corpus(args.articles)
+    old, old_time = timed(lambda: [clean_text_original(t) for t in texts])
+    new, new_time = timed(lambda: [clean_text(t) for t in texts])
+
+    mismatches = [i for i, (a, b) in enumerate(zip(old, new)) if a.encode() != b.encode()]
+    print(f"{len(texts)} texts, {len(mismatches)} mismatches")
+    for i in mismatches[:5]:
+        print(f"  {texts[i]!r}\n    old {old[i]!r}\n    new {new[i]!r}")
+
+    per_text = lambda seconds: seconds / len(texts) * 1e6
+    print(f"{'original':<22}{per_text(old_time):>8.1f} us/text")
+    print(f"{'compiled':<22}{per_text(new_time):>8.1f} us/text  ({old_time / new_time:.2f}x)")
+
+    if args.processes > 1:
+        with ProcessPoolExecutor(max_workers=args.processes) as pool:
+            clean_texts(texts[:1000], pool)  # start the workers outside the timing
+            pooled, pooled_time = timed(clean_texts, texts, pool)
+        assert pooled == new
+        label = f"pool of {args.processes}"
+        print(f"{label:<22}{per_text(pooled_time):>8.1f} us/text  ({old_time / pooled_time:.2f}x)")
+
+    if mismatches:
+        sys.exit("FAIL: cleaned output differs from the original implementation")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""Benchmark concurrent feed downloads against a local stub HTTP server.
+
+Serves N synthetic RSS feeds, each delayed by a fixed latency, spread across
+several loopback addresses so the per-host limit behaves like it would against
+real publishers. Compares the old serial ``feedparser.parse(url)`` loop with
+FeedFetcher at increasing concurrency.
+
+    cd backend && python -m benchmarks.bench_feed_fetcher --feeds 200 --delay 0.1
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from app.services.feed_fetcher import FeedFetcher
+import argparse
+import feedparser
+import multiprocessing
+import time
+
+def make_feed(feed_no: int, entries: int = 20) -> bytes:
+    items = "".join(
+        f"<item><title>Feed {feed_no} story {i}</title>"
+        f"<link>http://example.com/{feed_no}/{i}</link>"
+        f"<description>Synthetic entry {i} about language models and agents.</description>"
+        f"<pubDate>Mon, 04 Mar 2024 10:{i % 60:02d}:00 +0000</pubDate></item>"
+        for i in range(entries)
+    )
+    return (
+        f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {feed_no}</title>'
+        f"<link>http://example.com/{feed_no}</link><description>stub</description>"
+        f"{items}</channel></rss>"
+    ).encode()
+
+def serve(delay: float, ready) -> None:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            body = make_feed(int(self.path.rsplit("/", 1)[-1]))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer.request_queue_size = 1024
+    server = ThreadingHTTPServer(("", 0), Handler)
+    server.daemon_threads = True
+    ready.send(server.server_address[1])
+    server.serve_forever()
+
+def start_server(delay: float):
+    """Run the stub server in its own process so it doesn't share our GIL"""
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=serve, args=(delay, child), daemon=True)
+    process.start()
+    return process, parent.recv()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--feeds", type=int, default=200)
+    parser.add_argument("--hosts", type=int, default=16)
+    parser.add_argument("--delay", type=float, default=0.1, help="server latency per request (s)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 25, 50, 100])
+    parser.add_argument("--skip-serial", action="store_true")
+    args = parser.parse_args()
+
+    server, port = start_server(args.delay)
+    feeds = [
+        SimpleNamespace(id=i, url=f"http://127.0.0.{i % args.hosts + 1}:{port}/feed/{i}")
+        for i in range(args.feeds)
+    ]
+
+    print(f"{args.feeds} feeds on {args.hosts} hosts, {args.delay * 1000:.0f} ms server latency")
+    print(f"{'mode':<24}{'fetch (s)':>10}{'parse (s)':>10}{'feeds/s':>10}{'entries':>10}")
+
+    if not args.skip_serial:
+        started = time.perf_counter()
+        entries = sum(len(feedparser.parse(feed.url).entries) for feed in feeds)
+        wall = time.perf_counter() - started
+        print(f"{'serial feedparser':<24}{wall:>10.2f}{'-':>10}{args.feeds / wall:>10.1f}{entries:>10}")
+
+    for concurrency in args.concurrency:
+        fetcher = FeedFetcher(concurrency=concurrency, per_host=concurrency, timeout=30)
+        started = time.perf_counter()
+        results = fetcher.fetch(feeds)
+        fetched = time.perf_counter()
+        entries = sum(len(feedparser.parse(r.content).entries) for r in results if r.ok)
+        parsed = time.perf_counter()
+        failed = sum(not r.ok for r in results)
+        label = f"async c={concurrency}" + (f" ({failed} failed)" if failed else "")
+        print(
+            f"{label:<24}{fetched - started:>10.2f}{parsed - fetched:>10.2f}"
+            f"{args.feeds / (parsed - started):>10.1f}{entries:>10}"
+        )
+
+    server.terminate()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""Feed list and feed stats latency as the article table grows.
+
+Fills a SQLite database with --feeds feeds and grows the article table through
+--sizes, timing at each size:
+
+* ``join``     the previous feed list, articles outer joined on source = name
+  and grouped per feed
+* ``stored``   the feed list as it is now, reading the counters on feeds
+* ``stats``    FeedService.get_feed_stats before (load every article of the
+  feed) and now (one GROUP BY on the feed_id index)
+
+    cd backend && python -m benchmarks.bench_feed_list --sizes 10000 100000 500000
+"""
+from benchmarks.db import session, sqlite_engine
+from datetime import datetime, timedelta
+from pathlib import Path
+from sqlalchemy import func, insert
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+def grow(db, feeds: int, start: int, stop: int, rng: random.Random) -> None:
+    from app.models.article import Article
+
+    now = datetime.utcnow()
+    chunk = 50000
+    for first in range(start, stop, chunk):
+        rows = []
+        for i in range(first, min(stop, first + chunk)):
+            feed_id = rng.randint(1, feeds)
+            rows.append({
+                "id": i + 1,
+                "title": f"Article {i}",
+                "url": f"https://example.com/{i}",
+                "source": f"Feed {feed_id}",
+                "feed_id": feed_id,
+                "category": rng.choice(["Models/Agents", "Tools", "Research"]),
+                "priority": rng.choice(["High", "Low"]),
+                "date_published": now - timedelta(minutes=i),
+                "date_found": now
+            })
+        db.execute(insert(Article), rows)
+    db.commit()
+
+def join_list(db):
+    from app.models.article import Article
+    from app.models.feed import Feed
+
+    return db.query(
+        Feed,
+        func.count(Article.id).label('article_count'),
+        func.max(Article.date_published).label('last_article_date')
+    ).outerjoin(Article, Article.source == Feed.name).group_by(Feed.id).offset(0).limit(100).all()
+
+def stored_list(db):
+    from app.models.feed import Feed
+
+    return db.query(Feed).order_by(Feed.id).offset(0).limit(100).all()
+
+def stats_before(db, feed_id: int) -> dict:
+    from app.models.article import Article
+    from app.models.feed import Feed
+
+    feed = db.query(Feed).filter(Feed.id == feed_id).first()
+    articles = db.query(Article).filter(Article.source == feed.name).all()
+    stats = {"total_articles": len(articles), "categories": {}, "priorities": {"High": 0, "Low": 0}}
+    for article in articles:
+        stats["categories"][article.category] = stats["categories"].get(article.category, 0) + 1
+        stats["priorities"][article.priority] += 1
+    return stats
+
+def timed(fn, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--feeds", type=int, default=50)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 500000])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    from app.models.feed import Feed
+    from app.services.feed_service import FeedService, reconcile_feed_counts
+
+    db = session(sqlite_engine(str(Path(tempfile.mkdtemp()) / "bench.db")))
+    db.execute(insert(Feed), [
+        {"id": i, "name": f"Feed {i}", "url": f"https://feed{i}.example.com/rss", "is_active": True}
+        for i in range(1, args.feeds + 1)
+    ])
+    rng = random.Random(42)
+    service = FeedService(db)
+
+    print(f"{'articles':>10}{'join ms':>10}{'stored ms':>11}{'stats before':>14}{'stats now':>11}")
+    size = 0
+    for target in args.sizes:
+        grow(db, args.feeds, size, target, rng)
+        size = target
+        # Counters are maintained at ingestion; the bulk load bypassed that
+        reconcile_feed_counts(db)
+        db.expire_all()
+
+        joined = {feed.id: count for feed, count, _ in join_list(db)}
+        assert joined == {feed.id: feed.article_count for feed in stored_list(db)}
+        assert stats_before(db, 1) == service.get_feed_stats(1)
+
+        print(
+            f"{size:>10}{timed(lambda: join_list(db), args.runs):>10.1f}"
+            f"{timed(lambda: stored_list(db), args.runs):>11.2f}"
+            f"{timed(lambda: stats_before(db, 1), args.runs):>14.1f}"
+            f"{timed(lambda: service.get_feed_stats(1), args.runs):>11.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""Import-to-first-prediction time and per-worker memory for saved models.
+
+Trains a model on a synthetic corpus (or uses --model-dir), saves it both as the
+legacy four-pickle layout and as a bundle, then starts 1, 4 and 8 workers that
+stay alive together while their memory is measured:
+
+* ``legacy``  each worker unpickles the four files itself
+* ``bundle``  each worker loads the bundle with mmap_mode="r"
+* ``preload`` the parent loads the bundle once and forks the workers, the way
+  ``gunicorn --preload`` does
+
+PSS (proportional set size) splits shared pages between the processes using
+them, so it is the number that shows sharing; RSS counts shared pages in full.
+
+    cd backend && python -m benchmarks.bench_model_load --articles 20000
+"""
+from benchmarks.corpus import synthetic_articles
+from pathlib import Path
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+WORKER = """
+import time
+started = time.perf_counter()
+import json, sys
+from pathlib import Path
+from app.ml.models.article_classifier import ArticleClassifier
+classifier = ArticleClassifier(model_dir=Path(sys.argv[1]))
+classifier.load(mmap=sys.argv[2] == "mmap")
+classifier.predict("New open source agent framework released")
+print(json.dumps({"first_prediction": time.perf_counter() - started}), flush=True)
+sys.stdin.readline()
+from benchmarks.bench_model_load import memory
+print(json.dumps(memory()), flush=True)
+sys.stdin.readline()
+"""
+
+def memory() -> dict:
+    """RSS, PSS and USS of the current process in MB"""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss": fields.get("Rss", 0.0),
+        "pss": fields.get("Pss", 0.0),
+        "uss": fields.get("Private_Clean", 0.0) + fields.get("Private_Dirty", 0.0)
+    }
+
+def save_legacy(classifier, model_dir: Path) -> None:
+    import joblib
+    model_dir.mkdir(parents=True, exist_ok=True)
+    joblib.dump(classifier.category_classifier, model_dir / "category_classifier.pkl")
+    joblib.dump(classifier.priority_classifier, model_dir / "priority_classifier.pkl")
+    joblib.dump(classifier.category_encoder, model_dir / "category_encoder.pkl")
+    joblib.dump(classifier.text_features.vectorizer, model_dir / "vectorizer.pkl")
+
+def run_spawned(model_dir: Path, workers: int, mmap: bool) -> list:
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-c", WORKER, str(model_dir), "mmap" if mmap else "copy"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+        for _ in range(workers)
+    ]
+    timings = [json.loads(p.stdout.readline())["first_prediction"] for p in processes]
+    stats = []
+    for p in processes:
+        p.stdin.write("measure\n")
+        p.stdin.flush()
+        stats.append(json.loads(p.stdout.readline()))
+    for p in processes:
+        p.stdin.write("exit\n")
+        p.stdin.flush()
+        p.wait()
+    return [dict(s, first_prediction=t) for s, t in zip(stats, timings)]
+
+def run_preloaded(model_dir: Path, workers: int) -> list:
+    from app.ml.models.article_classifier import ArticleClassifier
+
+    started = time.perf_counter()
+    classifier = ArticleClassifier(model_dir=model_dir)
+    classifier.load()
+    load_time = time.perf_counter() - started
+
+    children = []
+    for _ in range(workers):
+        read_end, write_end = os.pipe()
+        go_read, go_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            os.close(go_write)
+            started = time.perf_counter()
+            classifier.predict("New open source agent framework released")
+            elapsed = load_time + time.perf_counter() - started
+            os.read(go_read, 1)  # wait until every worker exists
+            os.write(write_end, json.dumps(dict(memory(), first_prediction=elapsed)).encode())
+            os.read(go_read, 1)
+            os._exit(0)
+        os.close(write_end)
+        os.close(go_read)
+        children.append((pid, read_end, go_write))
+
+    for _, _, go_write in children:
+        os.write(go_write, b"m")
+    stats = [json.loads(os.read(read_end, 4096)) for _, read_end, _ in children]
+    for pid, _, go_write in children:
+        os.write(go_write, b"x")
+        os.waitpid(pid, 0)
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model-dir", type=Path, help="existing bundle directory")
+    parser.add_argument("--articles", type=int, default=20000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    from app.ml.models.article_classifier import ArticleClassifier
+
+    root = Path(tempfile.mkdtemp())
+    bundle_dir = args.model_dir
+    classifier = ArticleClassifier(model_dir=bundle_dir or root / "bundle")
+    if bundle_dir:
+        classifier.load(mmap=False)
+    else:
+        corpus = synthetic_articles(args.articles)
+        classifier.fit(
+            [f"{title}\n{summary}" for title, summary, _, _ in corpus],
+            [c[2] for c in corpus],
+            [c[3] for c in corpus]
+        )
+        classifier.save()
+        bundle_dir = root / "bundle"
+    save_legacy(classifier, root / "legacy")
+
+    size = (bundle_dir / "model.joblib").stat().st_size / 1024 / 1024
+    print(f"bundle size {size:.1f} MB")
+    print(f"{'mode':<9}{'workers':>8}{'first pred s':>14}{'RSS MB':>9}{'PSS MB':>9}{'USS MB':>9}{'total PSS':>11}")
+    for workers in args.workers:
+        runs = {
+            "legacy": lambda: run_spawned(root / "legacy", workers, mmap=False),
+            "bundle": lambda: run_spawned(bundle_dir, workers, mmap=True),
+            "preload": lambda: run_preloaded(bundle_dir, workers),
+        }
+        for mode, run in runs.items():
+            stats = run()
+            mean = {key: sum(s[key] for s in stats) / len(stats) for key in stats[0]}
+            print(
+                f"{mode:<9}{workers:>8}{mean['first_prediction']:>14.2f}{mean['rss']:>9.0f}"
+                f"{mean['pss']:>9.0f}{mean['uss']:>9.0f}{mean['pss'] * workers:>11.0f}"
+            )
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""Near-duplicate clustering quality and speed on a synthetic syndicated corpus.
+
+Generates --stories distinct stories (Zipf-distributed words) and gives a third
+of them one to three syndicated copies the way aggregators rewrite them: a
+source prefix on the title, HTML around the summary, a "first appeared on"
+footer, a few replaced words, a truncated ending. One in ten stories also gets
+a follow-up, a different story that keeps the title and half the summary,
+which should not join it. Every document is then streamed through
+signature + NearDuplicateIndex.find/add in random order, as ingestion does,
+for each --thresholds setting.
+
+* ``recall``     documents whose story was already indexed that joined it
+* ``precision``  documents that joined a cluster and got their own story's
+* ``sig/s``      signatures computed per second
+* ``find us``    median and p99 lookup time with the whole corpus indexed
+
+    cd backend && python -m benchmarks.bench_near_dup --stories 20000
+"""
+import argparse
+import itertools
+import random
+import statistics
+import time
+
+VOCABULARY = 20000
+
+def word(rank: int) -> str:
+    # Letters only: cleaning strips digits
+    letters = ""
+    while True:
+        rank, digit = divmod(rank, 26)
+        letters += chr(ord("a") + digit)
+        if not rank:
+            return letters + "x"
+
+def corpus(stories: int, rng: random.Random):
+    words = [word(rank) for rank in range(VOCABULARY)]
+    weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(VOCABULARY)))
+    sources = ["OpenAI Blog", "Google AI Blog", "DeepMind Blog", "AI Weekly", "ML News Digest"]
+
+    documents = []
+    for story in range(stories):
+        title = rng.choices(words, cum_weights=weights, k=10)
+        summary = rng.choices(words, cum_weights=weights, k=60)
+        documents.append((story, " ".join(title), " ".join(summary)))
+        if rng.random() < 0.1:
+            follow_up = summary[:30] + rng.choices(words, cum_weights=weights, k=30)
+            documents.append((stories + story, " ".join(title), " ".join(follow_up)))
+        if rng.random() < 1 / 3:
+            for _ in range(rng.randint(1, 3)):
+                copy = list(summary)
+                for _ in range(rng.randint(0, 3)):
+                    copy[rng.randrange(len(copy))] = rng.choices(words, cum_weights=weights)[0]
+                copy = copy[:len(copy) - rng.randint(0, 4)]
+                source = rng.choice(sources)
+                documents.append((
+                    story,
+                    f"{source}: {' '.join(title)}" if rng.random() < 0.5 else " ".join(title),
+                    f"<p>{' '.join(copy)}</p><p>The post appeared first on {source}.</p>"
+                ))
+    rng.shuffle(documents)
+    return documents
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stories", type=int, default=20000)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.3, 0.4, 0.5, 0.6, 0.7])
+    parser.add_argument("--bands", type=int, default=16)
+    args = parser.parse_args()
+
+    from app.services.near_dup import NearDuplicateIndex, signature
+
+    documents = corpus(args.stories, random.Random(42))
+    started = time.perf_counter()
+    signatures = [signature(title, summary) for _, title, summary in documents]
+    per_second = len(documents) / (time.perf_counter() - started)
+    print(f"{len(documents)} documents of {args.stories} stories, {per_second:.0f} signatures/s")
+
+    print(f"{'threshold':>9}{'recall':>9}{'precision':>11}{'find us p50':>13}{'p99':>8}")
+    for threshold in args.thresholds:
+        index = NearDuplicateIndex(threshold, args.bands, capacity=len(documents))
+        story_of_cluster = {}
+        seen_stories = set()
+        joinable = joined = joined_right = 0
+        times = []
+        for article_id, ((story, _, _), value) in enumerate(zip(documents, signatures), start=1):
+            started = time.perf_counter()
+            cluster = index.find(value)
+            times.append(time.perf_counter() - started)
+            if story in seen_stories:
+                joinable += 1
+            if cluster is None:
+                cluster = article_id
+                story_of_cluster[cluster] = story
+            else:
+                joined += 1
+                if story_of_cluster[cluster] == story:
+                    joined_right += 1
+            index.add(article_id, value, cluster)
+            seen_stories.add(story)
+
+        times.sort()
+        print(
+            f"{threshold:>9.1f}{joined_right / max(joinable, 1):>9.3f}{joined_right / max(joined, 1):>11.3f}"
+            f"{statistics.median(times) * 1e6:>13.1f}{times[int(len(times) * 0.99)] * 1e6:>8.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""Accuracy versus update cost: full RandomForest retrains against online SGD updates.
+
+Both models are fit on an initial slice of a synthetic corpus. New labeled
+batches then arrive: the forest is rebuilt from scratch on everything seen so
+far (what the nightly retraining does), the online model absorbs each batch
+with partial_fit. Accuracy is measured on a fixed held-out set after every step.
+
+    cd backend && python -m benchmarks.bench_online_vs_forest
+"""
+from benchmarks.corpus import synthetic_articles
+from app.ml.models.article_classifier import ArticleClassifier
+from app.ml.models.online_classifier import OnlineArticleClassifier
+from pathlib import Path
+import argparse
+import tempfile
+import time
+
+def accuracy(classifier, texts, categories, priorities):
+    predictions = classifier.predict_batch(texts)
+    category = sum(p["category"] == c for p, c in zip(predictions, categories)) / len(texts)
+    priority = sum(p["priority"] == c for p, c in zip(predictions, priorities)) / len(texts)
+    return category, priority
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--initial", type=int, default=5000)
+    parser.add_argument("--batches", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--test", type=int, default=3000)
+    parser.add_argument("--noise", type=float, default=0.1)
+    args = parser.parse_args()
+
+    total = args.initial + args.batches * args.batch_size + args.test
+    corpus = synthetic_articles(total, noise=args.noise)
+    texts = [f"{title}\n{summary}" for title, summary, _, _ in corpus]
+    categories = [c[2] for c in corpus]
+    priorities = [c[3] for c in corpus]
+    test = slice(total - args.test, total)
+    held_out = (texts[test], categories[test], priorities[test])
+
+    models = {
+        "forest": ArticleClassifier(model_dir=Path(tempfile.mkdtemp())),
+        "online": OnlineArticleClassifier(model_dir=Path(tempfile.mkdtemp())),
+    }
+    print(f"{'step':<10}{'model':<8}{'update ms':>11}{'category acc':>14}{'priority acc':>14}")
+    for name, model in models.items():
+        started = time.perf_counter()
+        model.fit(texts[:args.initial], categories[:args.initial], priorities[:args.initial])
+        cost = (time.perf_counter() - started) * 1000
+        category, priority = accuracy(model, *held_out)
+        print(f"{'initial':<10}{name:<8}{cost:>11.0f}{category:>14.3f}{priority:>14.3f}")
+
+    for batch in range(args.batches):
+        end = args.initial + (batch + 1) * args.batch_size
+        start = end - args.batch_size
+
+        forest = models["forest"]
+        started = time.perf_counter()
+        forest.fit(texts[:end], categories[:end], priorities[:end])
+        forest_cost = (time.perf_counter() - started) * 1000
+
+        online = models["online"]
+        started = time.perf_counter()
+        online.partial_fit(texts[start:end], categories[start:end], priorities[start:end])
+        online_cost = (time.perf_counter() - started) * 1000
+
+        for name, cost in (("forest", forest_cost), ("online", online_cost)):
+            category, priority = accuracy(models[name], *held_out)
+            print(f"{f'batch {batch + 1}':<10}{name:<8}{cost:>11.0f}{category:>14.3f}{priority:>14.3f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""Personalized ranking (sort=for_you) latency against the 20 ms budget.
+
+Fills a SQLite database with --articles articles on --topics topics, found
+over the last two weeks, and gives one user --history interactions that favour
+three topics (clicks, saves and shares) and dismiss a fourth. Times, for
+RANKING_CANDIDATES candidates:
+
+* ``fold``      the first load_preferences, folding the whole history
+* ``cold``      the first CandidateCache.get, featurizing every candidate
+* ``score``     Candidates.rank alone, the matrix product and the sort
+* ``request``   rank_for_user with warm caches: preferences and candidate
+  queries, scoring and loading the page of 20
+
+and reports the share of the first page on the favoured topics, for the
+ranked and the newest-first order.
+
+    cd backend && python -m benchmarks.bench_ranking --articles 50000
+"""
+from benchmarks.db import session, sqlite_engine
+from datetime import datetime, timedelta
+from pathlib import Path
+from sqlalchemy import insert
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+def word(rank: int) -> str:
+    letters = ""
+    while True:
+        rank, digit = divmod(rank, 26)
+        letters += chr(ord("a") + digit)
+        if not rank:
+            return letters + "z"
+
+def fill(db, articles: int, topics: int, history: int, rng: random.Random):
+    from app.models.article import Article
+    from app.models.interaction import Interaction
+    from app.models.user import User
+
+    background = [word(rank) for rank in range(3000)]
+    topic_words = [[word(3000 + topic * 20 + i) for i in range(20)] for topic in range(topics)]
+    now = datetime.utcnow()
+    topic_of = {}
+    rows = []
+    for id in range(1, articles + 1):
+        topic = rng.randrange(topics)
+        topic_of[id] = topic
+        words = rng.sample(topic_words[topic], 4) + rng.sample(background, 6)
+        rng.shuffle(words)
+        rows.append({
+            "id": id,
+            "title": " ".join(words),
+            "url": f"https://example.com/{id}",
+            "feed_id": None,
+            "category": f"Topic {topic % 10}",
+            "priority": rng.choice(["High", "Low"]),
+            # Newer ids are found later
+            "date_found": now - timedelta(seconds=(articles - id) * 14 * 86400 / articles)
+        })
+    db.execute(insert(Article), rows)
+    db.execute(insert(User), [{"id": 1, "email": "reader@example.com", "hashed_password": "x"}])
+
+    favourite, disliked = {0, 1, 2}, 3
+    by_topic = {}
+    for id, topic in topic_of.items():
+        by_topic.setdefault(topic, []).append(id)
+    interactions = []
+    for i in range(history):
+        if rng.random() < 0.8:
+            article_id = rng.choice(by_topic[rng.choice(sorted(favourite))])
+            interaction_type = rng.choice(["click", "click", "save", "share"])
+        else:
+            article_id, interaction_type = rng.choice(by_topic[disliked]), "dismiss"
+        interactions.append({
+            "user_id": 1,
+            "article_id": article_id,
+            "interaction_type": interaction_type,
+            "timestamp": now - timedelta(minutes=history - i)
+        })
+    db.execute(insert(Interaction), interactions)
+    db.commit()
+    return topic_of, favourite
+
+def timed(fn, runs: int):
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    times.sort()
+    return statistics.median(times) * 1000, times[int(len(times) * 0.99)] * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=50000)
+    parser.add_argument("--topics", type=int, default=40)
+    parser.add_argument("--history", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    from app.services.ranking_service import candidate_cache, load_preferences, rank_for_user
+
+    db = session(sqlite_engine(str(Path(tempfile.mkdtemp()) / "bench.db")))
+    topic_of, favourite = fill(db, args.articles, args.topics, args.history, random.Random(42))
+
+    started = time.perf_counter()
+    preferences = load_preferences(db, 1)
+    fold = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    candidates = candidate_cache.get(db, None, None, False)
+    cold = (time.perf_counter() - started) * 1000
+
+    now = (datetime.utcnow() - datetime(1970, 1, 1)).total_seconds()
+    score = timed(lambda: candidates.rank(preferences, now), args.runs)
+    request = timed(lambda: rank_for_user(db, 1, 0, 20), args.runs)
+
+    ranked = rank_for_user(db, 1, 0, 20)
+    newest = range(args.articles, args.articles - 20, -1)
+    on_topic = lambda ids: statistics.mean(topic_of[id] in favourite for id in ids)
+
+    print(f"{args.articles} articles, {len(candidates.ids)} candidates, {args.history} interactions")
+    print(f"fold history {fold:.1f} ms, cold candidate matrix {cold:.1f} ms")
+    print(f"{'':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    print(f"{'score':>10}{score[0]:>9.2f}{score[1]:>9.2f}")
+    print(f"{'request':>10}{request[0]:>9.2f}{request[1]:>9.2f}")
+    print(f"favoured topics on page 1: ranked {on_topic(a.id for a in ranked):.2f}, "
+          f"newest first {on_topic(newest):.2f} (expected at random {len(favourite) / args.topics:.2f})")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
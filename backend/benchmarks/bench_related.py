@@ -0,0 +1,106 @@
+"""Related article lookup latency at growing corpus sizes.
+
+Generates synthetic articles on --topics topics (each topic mixes its own
+words with a shared Zipf background), vectorizes them with the app's TF-IDF
+TextFeatureExtractor fitted on the first --fit texts, and builds a
+RelatedIndex over each size. For --queries random articles it times:
+
+* ``index``  RelatedIndex.related, walking the query's cut postings
+* ``brute``  scoring every row (CSR matrix times the query vector)
+
+and reports the share of the brute-force top 10 the index also returns.
+
+    cd backend && python -m benchmarks.bench_related --sizes 100000 500000
+"""
+import argparse
+import itertools
+import random
+import statistics
+import time
+
+import numpy as np
+from scipy import sparse
+
+def word(rank: int) -> str:
+    # Letters only: cleaning strips digits
+    letters = ""
+    while True:
+        rank, digit = divmod(rank, 26)
+        letters += chr(ord("a") + digit)
+        if not rank:
+            return letters + "q"
+
+def texts(count: int, topics: int, rng: random.Random):
+    background = [word(rank) for rank in range(5000)]
+    weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(background))))
+    topic_words = [[word(5000 + topic * 40 + i) for i in range(40)] for topic in range(topics)]
+    for _ in range(count):
+        topic = topic_words[rng.randrange(topics)]
+        words = rng.choices(background, cum_weights=weights, k=30) + rng.choices(topic, k=20)
+        rng.shuffle(words)
+        yield " ".join(words[:8]) + "\n" + " ".join(words[8:])
+
+def brute_force(rows: sparse.csr_matrix, position: int, k: int):
+    scores = rows @ rows[position].toarray().ravel()
+    scores[position] = -1
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.lexsort((top, -scores[top]))]
+
+def timed(fn, positions):
+    times = []
+    for position in positions:
+        started = time.perf_counter()
+        fn(position)
+        times.append(time.perf_counter() - started)
+    times.sort()
+    return statistics.median(times) * 1000, times[int(len(times) * 0.99)] * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 500000])
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--fit", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    from app.ml.features.text_features import TextFeatureExtractor
+    from app.services.related_service import RelatedIndex, vectorize
+
+    rng = random.Random(42)
+    corpus = list(texts(max(args.sizes), args.topics, rng))
+    features = TextFeatureExtractor("tfidf")
+    features.extract_features(corpus[:args.fit], fit=True)
+
+    started = time.perf_counter()
+    vectors = sparse.vstack([
+        vectorize(features, corpus[start:start + 10000]) for start in range(0, len(corpus), 10000)
+    ], format="csr")
+    print(f"vectorized {len(corpus)} texts in {time.perf_counter() - started:.0f} s, "
+          f"{vectors.nnz / vectors.shape[0]:.1f} features per article")
+
+    print(f"{'articles':>10}{'build s':>9}{'index p50':>11}{'p99':>7}{'brute p50':>11}{'p99':>7}{'recall@10':>11}   (ms)")
+    for size in args.sizes:
+        rows = vectors[:size]
+        index = RelatedIndex()
+        started = time.perf_counter()
+        index.build(features, "bench", list(range(1, size + 1)), rows)
+        built = time.perf_counter() - started
+
+        positions = [rng.randrange(size) for _ in range(args.queries)]
+        indexed = timed(lambda position: index.related(position + 1, 25), positions)
+        brute = timed(lambda position: brute_force(rows, position, 25), positions)
+        recall = statistics.mean(
+            len({id for id, _ in index.related(position + 1, 10)}
+                & {int(i) + 1 for i in brute_force(rows, position, 10)}) / 10
+            for position in positions[:100]
+        )
+        print(f"{size:>10}{built:>9.1f}{indexed[0]:>11.2f}{indexed[1]:>7.2f}{brute[0]:>11.2f}{brute[1]:>7.2f}{recall:>11.2f}")
+
+    # Incremental additions land in the tail until it is merged
+    started = time.perf_counter()
+    index.add(list(range(size + 1, size + 51)), corpus[:50])
+    print(f"add 50 articles: {(time.perf_counter() - started) * 1000:.1f} ms, "
+          f"query with tail: {timed(lambda position: index.related(position + 1, 25), positions)[0]:.2f} ms p50")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
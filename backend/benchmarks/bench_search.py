@@ -0,0 +1,102 @@
+"""Full-text search latency as the article table grows.
+
+Fills a database with synthetic articles whose words follow a Zipf
+distribution and times search_articles for a common, a medium and a rare
+word, two words together, and a deep page. On SQLite (the default) this
+measures the in-process fallback index, including the time to build it; with
+--url pointing at a PostgreSQL database migrated to head it measures the
+tsvector/GIN path.
+
+    cd backend && python -m benchmarks.bench_search --sizes 100000 1000000
+"""
+from benchmarks.db import session, sqlite_engine
+from datetime import datetime, timedelta
+from pathlib import Path
+from sqlalchemy import create_engine, insert
+import argparse
+import numpy as np
+import statistics
+import tempfile
+import time
+
+VOCABULARY = 20000
+
+def word(rank: int) -> str:
+    return f"term{rank}x"
+
+def grow(db, start: int, stop: int, rng: np.random.Generator) -> None:
+    from app.models.article import Article
+
+    weights = 1.0 / np.arange(1, VOCABULARY + 1)
+    weights /= weights.sum()
+    now = datetime.utcnow()
+    chunk = 20000
+    for first in range(start, stop, chunk):
+        count = min(stop, first + chunk) - first
+        words = rng.choice(VOCABULARY, size=(count, 48), p=weights)
+        rows = []
+        for offset in range(count):
+            i = first + offset
+            tokens = [word(rank) for rank in words[offset]]
+            rows.append({
+                "id": i + 1,
+                "title": " ".join(tokens[:8]),
+                "summary": " ".join(tokens[8:48]),
+                "url": f"https://example.com/{i}",
+                "source": "Bench",
+                "category": "Research",
+                "priority": "Low",
+                "date_found": now - timedelta(seconds=i)
+            })
+        db.execute(insert(Article), rows)
+    db.commit()
+
+def timed(fn, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--url", help="PostgreSQL database migrated to head, emptied of articles")
+    args = parser.parse_args()
+
+    from app.services.search_service import search_articles, search_index
+
+    if args.url:
+        db = session(create_engine(args.url))
+    else:
+        db = session(sqlite_engine(str(Path(tempfile.mkdtemp()) / "bench.db")))
+    rng = np.random.default_rng(42)
+
+    queries = {
+        "common": word(5),
+        "medium": word(200),
+        "rare": word(5000),
+        "two words": f"{word(20)} {word(300)}"
+    }
+    print(f"{'articles':>10}{'index s':>9}" + "".join(f"{name:>11}" for name in queries) + f"{'skip 1000':>11}   (ms)")
+    size = 0
+    for target in args.sizes:
+        grow(db, size, target, rng)
+        size = target
+
+        started = time.perf_counter()
+        if not args.url:
+            search_index.sync(db)
+        indexed = time.perf_counter() - started
+
+        latencies = [timed(lambda: search_articles(db, q, 0, 20), args.runs) for q in queries.values()]
+        deep = timed(lambda: search_articles(db, queries["medium"], 1000, 20), args.runs)
+        print(
+            f"{size:>10}{indexed:>9.1f}" + "".join(f"{ms:>11.1f}" for ms in latencies) + f"{deep:>11.1f}"
+        )
+        db.expire_all()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""API startup cost: import-time breakdown and time to first 200.
+
+1. Runs ``python -X importtime -c "import app.main"`` and prints the heaviest
+   top-level imports, failing if any --forbid module (scikit-learn by default)
+   is imported while loading the app.
+2. Starts uvicorn and measures the time until ``GET /`` first answers 200 and
+   until ``GET /health/ready`` reports the model loaded.
+
+Exits non-zero when a forbidden module shows up or --max-import-ms is exceeded,
+so it can guard against regressions in CI.
+
+    cd backend && python -m benchmarks.bench_startup
+"""
+from collections import defaultdict
+import argparse
+import http.client
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \| *(\S+)")
+
+def import_breakdown() -> dict:
+    """Import time in microseconds per top-level package, summed over its modules' self time"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True, text=True, env=os.environ.copy()
+    )
+    if result.returncode != 0:
+        sys.exit(f"importing app.main failed:\n{result.stderr[-2000:]}")
+
+    totals = defaultdict(int)
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            totals[match.group(2).split(".")[0]] += int(match.group(1))
+    return totals
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def wait_for(port: int, path: str, started: float, timeout: float) -> float:
+    while time.perf_counter() - started < timeout:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", path)
+            if conn.getresponse().status == 200:
+                return time.perf_counter() - started
+        except OSError:
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(f"{path} did not return 200 within {timeout}s")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--forbid", nargs="*", default=["sklearn", "scipy"])
+    parser.add_argument("--max-import-ms", type=float)
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    totals = import_breakdown()
+    total_ms = sum(totals.values()) / 1000
+    print(f"import app.main: {total_ms:.0f} ms")
+    for name, us in sorted(totals.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<24}{us / 1000:>8.1f} ms")
+
+    failures = [f"{name} is imported at startup" for name in args.forbid if name in totals]
+    if args.max_import_ms and total_ms > args.max_import_ms:
+        failures.append(f"import took {total_ms:.0f} ms > {args.max_import_ms:.0f} ms")
+
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=os.environ.copy()
+    )
+    try:
+        first_200 = wait_for(port, "/", started, args.timeout)
+        ready = wait_for(port, "/health/ready", started, args.timeout)
+    finally:
+        server.terminate()
+        server.wait()
+    print(f"time to first 200 on /: {first_200 * 1000:.0f} ms")
+    print(f"time to /health/ready:  {ready * 1000:.0f} ms")
+
+    if failures:
+        sys.exit("FAIL: " + "; ".join(failures))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""Peak RSS of training the classifier on a synthetic corpus.
+
+Each mode trains in a fresh child process and reports its peak resident set
+size. ``dense`` reproduces the old behaviour by densifying the TF-IDF matrix
+before fitting, ``sparse`` is the current float32 CSR path.
+
+    cd backend && python -m benchmarks.bench_train_memory --articles 200000
+"""
+from benchmarks.corpus import synthetic_articles
+from pathlib import Path
+import argparse
+import multiprocessing
+import resource
+import tempfile
+import time
+
+def train(mode: str, n_articles: int, estimators: int, queue) -> None:
+    from app.ml.models.article_classifier import ArticleClassifier
+
+    corpus = synthetic_articles(n_articles)
+    texts = [f"{title}\n{summary}" for title, summary, _, _ in corpus]
+    classifier = ArticleClassifier(model_dir=Path(tempfile.mkdtemp()))
+    classifier.category_classifier.set_params(n_estimators=estimators)
+    classifier.priority_classifier.set_params(n_estimators=estimators)
+
+    if mode == "dense":
+        sparse_extract = classifier.text_features.extract_features
+        classifier.text_features.extract_features = (
+            lambda texts, fit=False: sparse_extract(texts, fit=fit).toarray().astype("float64")
+        )
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    classifier.fit(texts, [c[2] for c in corpus], [c[3] for c in corpus])
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((baseline / 1024, peak / 1024, elapsed))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=200000)
+    parser.add_argument("--estimators", type=int, default=100)
+    parser.add_argument("--modes", nargs="+", default=["dense", "sparse"])
+    args = parser.parse_args()
+
+    print(f"{args.articles} articles, {args.estimators} trees per forest")
+    print(f"{'mode':<8}{'corpus MB':>12}{'peak MB':>12}{'fit s':>10}")
+    for mode in args.modes:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=train, args=(mode, args.articles, args.estimators, queue)
+        )
+        process.start()
+        baseline, peak, elapsed = queue.get()
+        process.join()
+        print(f"{mode:<8}{baseline:>12.0f}{peak:>12.0f}{elapsed:>10.1f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
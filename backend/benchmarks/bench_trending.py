@@ -0,0 +1,109 @@
+"""Trending topics accuracy, speed and memory on a synthetic key point stream.
+
+Streams --articles articles found evenly over the last 14 days, each with
+five key point terms drawn from a Zipf vocabulary of --vocabulary terms, and
+makes --bursts rare terms pick up in the last --window hours. Every article
+goes through TrendingTopics.add, as ingestion does, and is also counted
+exactly per bucket for comparison:
+
+* ``add/s``        articles counted per second
+* ``query ms``     TrendingTopics.trending median over 50 calls
+* ``bursts found`` injected bursts among the top 20
+* ``top 20``       overlap with the exact top 20 by the same score
+* ``count err``    mean relative overcount of the returned terms
+
+and the sketch memory and snapshot size, save and load times.
+
+    cd backend && python -m benchmarks.bench_trending --articles 200000
+"""
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+import argparse
+import itertools
+import math
+import random
+import statistics
+import tempfile
+import time
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=200000)
+    parser.add_argument("--vocabulary", type=int, default=50000)
+    parser.add_argument("--bursts", type=int, default=10)
+    parser.add_argument("--window", type=int, default=24, help="hours")
+    args = parser.parse_args()
+
+    from app.config import settings
+    from app.services.trending_service import TrendingTopics
+
+    rng = random.Random(42)
+    terms = [f"term {rank}" for rank in range(args.vocabulary)]
+    weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(args.vocabulary)))
+    bursting = rng.sample(terms[1000:], args.bursts)
+    now = datetime.utcnow()
+    span = timedelta(days=14)
+    burst_start = now - timedelta(hours=args.window)
+
+    stream = []
+    for i in range(args.articles):
+        found = now - span + span * (i + 1) / args.articles
+        chosen = rng.choices(terms, cum_weights=weights, k=5)
+        if found > burst_start and rng.random() < 0.05:
+            chosen[0] = rng.choice(bursting)
+        stream.append((found, chosen))
+
+    trending = TrendingTopics(snapshot_path=str(Path(tempfile.mkdtemp()) / "trending.npz"))
+    trending.loaded = True
+    exact = {}
+    started = time.perf_counter()
+    for found, chosen in stream:
+        trending.add(found, chosen)
+    per_second = args.articles / (time.perf_counter() - started)
+    for found, chosen in stream:
+        exact.setdefault(trending._index(found), Counter()).update(set(chosen))
+
+    window = timedelta(hours=args.window)
+    times = []
+    for _ in range(50):
+        started = time.perf_counter()
+        top = trending.trending(window, 20, now)
+        times.append(time.perf_counter() - started)
+
+    # The same score on exact counts, over every term
+    current = trending._index(now)
+    buckets = math.ceil(window.total_seconds() / trending.bucket_seconds)
+    recent, previous = Counter(), Counter()
+    for index, counts in exact.items():
+        if current - buckets < index <= current:
+            recent.update(counts)
+        elif current - 2 * buckets < index <= current - buckets:
+            previous.update(counts)
+    exact_scores = {
+        term: (count - previous[term]) / math.sqrt(previous[term] + 1)
+        for term, count in recent.items() if count >= settings.TRENDING_MIN_COUNT
+    }
+    exact_top = sorted(exact_scores, key=lambda term: (-exact_scores[term], -recent[term]))[:20]
+    found_terms = [topic.term for topic in top]
+    error = statistics.mean((topic.count - recent[topic.term]) / recent[topic.term] for topic in top)
+
+    memory = sum(bucket.sketch.nbytes for bucket in trending._buckets.values())
+    started = time.perf_counter()
+    trending.save()
+    saved = time.perf_counter() - started
+    restored = TrendingTopics(snapshot_path=str(trending.snapshot_path))
+    started = time.perf_counter()
+    restored.load()
+    loaded = time.perf_counter() - started
+    assert restored.trending(window, 20, now) == top
+
+    print(f"{args.articles} articles, {len(trending._buckets)} buckets, sketches {memory / 2 ** 20:.1f} MiB")
+    print(f"add/s {per_second:.0f}, query ms {statistics.median(times) * 1000:.2f}")
+    print(f"bursts found {len(set(found_terms) & set(bursting))}/{args.bursts}, "
+          f"top 20 {len(set(found_terms) & set(exact_top)) / 20:.2f}, count err {error:.3f}")
+    print(f"snapshot {trending.snapshot_path.stat().st_size / 2 ** 20:.1f} MiB, "
+          f"save {saved * 1000:.0f} ms, load {loaded * 1000:.0f} ms")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""Synthetic AI-news corpus shared by the benchmarks"""
+from typing import List, Tuple
+import random
+
+CATEGORIES = {
+    "Models/Agents": [
+        "language", "model", "agent", "reasoning", "transformer", "parameters", "benchmark",
+        "multimodal", "chatbot", "instruction", "alignment", "context", "tokens", "release"
+    ],
+    "Tools": [
+        "library", "framework", "api", "sdk", "plugin", "open", "source", "developer",
+        "toolkit", "deployment", "inference", "server", "python", "integration"
+    ],
+    "Research": [
+        "paper", "study", "dataset", "experiment", "results", "university", "theory",
+        "analysis", "training", "scaling", "laws", "evaluation", "arxiv", "method"
+    ],
+}
+COMMON = [
+    "ai", "new", "announces", "today", "team", "performance", "improved", "users",
+    "data", "learning", "neural", "network", "system", "approach", "faster", "better"
+]
+
+def synthetic_articles(n: int, seed: int = 42, noise: float = 0.0) -> List[Tuple[str, str, str, str]]:
+    """Return n (title, summary, category, priority) tuples with learnable structure
+    
+    ``noise`` is the fraction of articles whose category label is replaced at random.
+    """
+    rng = random.Random(seed)
+    names = list(CATEGORIES)
+    articles = []
+    for i in range(n):
+        category = names[i % len(names)]
+        vocab = CATEGORIES[category]
+        high = rng.random() < 0.3
+        title_words = rng.sample(vocab, 4) + rng.sample(COMMON, 2)
+        summary_words = [
+            rng.choice(vocab) if rng.random() < 0.6 else rng.choice(COMMON)
+            for _ in range(rng.randint(25, 60))
+        ]
+        if high:
+            summary_words += ["breakthrough", "major", "launch"]
+        rng.shuffle(title_words)
+        label = rng.choice(names) if rng.random() < noise else category
+        articles.append((
+            " ".join(title_words).capitalize() + f" #{i}",
+            " ".join(summary_words) + f". Read more at https://example.com/{i}",
+            label,
+            "High" if high else "Low"
+        ))
+    return articles
\ No newline at end of file
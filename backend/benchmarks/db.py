@@ -0,0 +1,31 @@
+"""Throwaway SQLite databases with the app's schema for the benchmarks"""
+from sqlalchemy import ARRAY, create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+from app.db.base import Base
+import app.models.article
+import app.models.feed
+import app.models.interaction
+import app.models.user
+import app.models.user_preference
+
+@compiles(ARRAY, "sqlite")
+def _array_as_json(type_, compiler, **kw):
+    # SQLite has no arrays; benchmark rows leave these columns empty
+    return "JSON"
+
+def sqlite_engine(path: str) -> Engine:
+    """Engine on a SQLite file with every app table created"""
+    engine = create_engine(f"sqlite:///{path}")
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(connection, _):
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=OFF")
+
+    Base.metadata.create_all(engine)
+    return engine
+
+def session(engine: Engine) -> Session:
+    return sessionmaker(bind=engine, autoflush=False)()
\ No newline at end of file
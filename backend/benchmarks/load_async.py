@@ -0,0 +1,208 @@
+"""Load test of the async read routes against the sync stack they replaced.
+
+Serves one of two apps under uvicorn, one worker, on a fresh SQLite file with
+--articles articles, with the response cache off so every request reaches the
+database:
+
+* ``sync``   the handlers as they were: ``def`` routes on the threadpool with
+  a sync Session, and get_current_user querying synchronously on the event loop
+* ``async``  the articles and auth routers as they are now, on the async engine
+
+For each --clients level that many concurrent clients loop for --duration
+seconds over a mix of newest-article pages (60%), single articles (30%) and
+authenticated /auth/test-token calls (10%), and the requests per second and
+latency percentiles are reported. The clients run in this process, so at the
+highest levels they compete with the server for CPU on small machines.
+
+    cd backend && python -m benchmarks.load_async --clients 50 100 250 500
+"""
+from benchmarks.db import session, sqlite_engine
+from datetime import datetime, timedelta
+from pathlib import Path
+from sqlalchemy import insert
+import argparse
+import asyncio
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def prepare(path: Path, articles: int) -> None:
+    from app.models.article import Article
+    from app.models.user import User
+
+    now = datetime.utcnow()
+    db = session(sqlite_engine(str(path)))
+    db.execute(insert(User), [{"id": 1, "email": "load@example.com", "hashed_password": "x", "is_active": True}])
+    db.execute(insert(Article), [
+        {
+            "id": i,
+            "title": f"Article {i}",
+            "url": f"https://example.com/{i}",
+            "source": "load",
+            "summary": f"Summary of article {i}",
+            "category": "Research",
+            "priority": "Low",
+            "date_published": now - timedelta(minutes=i),
+            "date_found": now - timedelta(minutes=i),
+            "is_archived": False
+        }
+        for i in range(1, articles + 1)
+    ])
+    db.commit()
+    db.close()
+
+def sync_app():
+    """The hot routes as they were before the async port"""
+    from fastapi import Depends, FastAPI, HTTPException, Request
+    from jose import jwt
+    from sqlalchemy.orm import Session
+    from typing import List
+    from app.api.dependencies import get_db, oauth2_scheme
+    from app.api.routes.articles import ARTICLE_TABLES, _article, _article_list, list_articles
+    from app.core.response_cache import response_cache
+    from app.core.security import ALGORITHM, SECRET_KEY
+    from app.models.article import Article
+    from app.models.user import User
+    from app.schemas.article import ArticleWithInteractions
+    from app.schemas.user import User as UserSchema
+
+    app = FastAPI()
+
+    async def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
+        # Declared async but querying synchronously, blocking the event loop
+        email = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])["sub"]
+        return db.query(User).filter(User.email == email).first()
+
+    @app.get("/articles/", response_model=List[ArticleWithInteractions])
+    def read_articles(request: Request, skip: int = 0, limit: int = 20, db: Session = Depends(get_db)):
+        def build():
+            articles, next_cursor = list_articles(db, skip, limit)
+            return articles, {"X-Next-Cursor": next_cursor} if next_cursor else {}
+        return response_cache.respond(request, ARTICLE_TABLES, build, _article_list)
+
+    @app.get("/articles/{article_id}", response_model=ArticleWithInteractions)
+    def read_article(article_id: int, request: Request, db: Session = Depends(get_db)):
+        def build():
+            article = db.query(Article).filter(Article.id == article_id).first()
+            if article is None:
+                raise HTTPException(status_code=404, detail="Article not found")
+            return article, {}
+        return response_cache.respond(request, ARTICLE_TABLES, build, _article)
+
+    @app.post("/auth/test-token", response_model=UserSchema)
+    async def test_token(current_user: User = Depends(get_current_user)):
+        return current_user
+
+    return app
+
+def async_app():
+    """The articles and auth routers as they are"""
+    from fastapi import FastAPI
+    from app.api.routes import articles, auth
+
+    app = FastAPI()
+    app.include_router(articles.router, prefix="/articles")
+    app.include_router(auth.router, prefix="/auth")
+    return app
+
+def start_server(path: Path, port: int, stack: str) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        SQLALCHEMY_DATABASE_URL=f"sqlite:///{path}",
+        ML_WARM_ON_STARTUP="false",
+        RESPONSE_CACHE_SIZE="0"
+    )
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", f"benchmarks.load_async:{stack}_app", "--factory",
+            "--port", str(port), "--log-level", "warning", "--backlog", "4096"
+        ],
+        env=env
+    )
+    import httpx
+    for _ in range(600):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/articles/1", timeout=1)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.05)
+    server.kill()
+    raise TimeoutError("server did not start")
+
+async def drive(port: int, clients: int, args) -> dict:
+    import httpx
+    from app.core.security import create_access_token
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'load@example.com'})}"}
+    stats = {"requests": 0, "errors": 0, "latencies": []}
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    deadline = time.perf_counter() + args.duration
+
+    async def client(http, rng: random.Random):
+        while time.perf_counter() < deadline:
+            pick = rng.random()
+            started = time.perf_counter()
+            try:
+                if pick < 0.6:
+                    response = await http.get("/articles/", params={"skip": rng.randrange(0, 200), "limit": 20})
+                elif pick < 0.9:
+                    response = await http.get(f"/articles/{rng.randint(1, args.articles)}")
+                else:
+                    response = await http.post("/auth/test-token", headers=headers)
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            stats["latencies"].append(time.perf_counter() - started)
+            stats["requests"] += 1
+            stats["errors"] += not ok
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60) as http:
+        started = time.perf_counter()
+        await asyncio.gather(*(client(http, random.Random(i)) for i in range(clients)))
+        stats["elapsed"] = time.perf_counter() - started
+    return stats
+
+def run(stack: str, clients: int, path: Path, args) -> None:
+    port = free_port()
+    server = start_server(path, port, stack)
+    try:
+        stats = asyncio.run(drive(port, clients, args))
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+    latencies = sorted(stats["latencies"])
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(
+        f"{stack:<7}{clients:>8}{stats['requests']:>10}{stats['errors']:>8}"
+        f"{stats['requests'] / stats['elapsed']:>10.0f}{p50:>9.1f}{p99:>9.1f}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--clients", type=int, nargs="+", default=[50, 100, 250, 500])
+    parser.add_argument("--articles", type=int, default=10000)
+    parser.add_argument("--stacks", nargs="+", default=["sync", "async"])
+    args = parser.parse_args()
+
+    path = Path(tempfile.mkdtemp()) / "load.db"
+    prepare(path, args.articles)
+    print(f"{'stack':<7}{'clients':>8}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    for clients in args.clients:
+        for stack in args.stacks:
+            run(stack, clients, path, args)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""Load test for interaction ingestion against a local database.
+
+Starts the API under uvicorn on a fresh SQLite file, then keeps --concurrency
+clients posting for --duration seconds:
+
+* ``single`` one event per ``POST /interactions/``, one transaction each
+* ``batch``  --batch events per ``POST /interactions/batch`` through the
+  write-behind buffer
+
+The server is stopped with SIGTERM so the shutdown hook flushes the buffer, and
+the stored rows and article counters are checked against what was accepted.
+Sustained throughput is stored rows divided by the time from the first request
+to the end of the final flush.
+
+    cd backend && python -m benchmarks.load_interactions --duration 20
+"""
+from benchmarks.db import session, sqlite_engine
+from pathlib import Path
+from sqlalchemy import func, insert, select
+import argparse
+import asyncio
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def prepare(path: Path, articles: int) -> None:
+    from app.models.article import Article
+    from app.models.user import User
+
+    db = session(sqlite_engine(str(path)))
+    db.execute(insert(User), [{"id": 1, "email": "load@example.com", "hashed_password": "x", "is_active": True}])
+    db.execute(insert(Article), [
+        {"id": i, "title": f"Article {i}", "url": f"https://example.com/{i}", "source": "load"}
+        for i in range(1, articles + 1)
+    ])
+    db.commit()
+    db.close()
+
+def start_server(path: Path, port: int) -> subprocess.Popen:
+    env = dict(os.environ, SQLALCHEMY_DATABASE_URL=f"sqlite:///{path}", ML_WARM_ON_STARTUP="false")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env
+    )
+    import httpx
+    for _ in range(600):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/health/live", timeout=1)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.05)
+    server.kill()
+    raise TimeoutError("server did not start")
+
+async def drive(port: int, mode: str, args) -> dict:
+    import httpx
+    from app.core.security import create_access_token
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'load@example.com'})}"}
+    stats = {"accepted": 0, "rejected": 0, "requests": 0, "latencies": []}
+    deadline = time.perf_counter() + args.duration
+
+    async def client(rng: random.Random):
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", headers=headers, timeout=30) as http:
+            while time.perf_counter() < deadline:
+                events = [
+                    {"article_id": rng.randint(1, args.articles), "interaction_type": rng.choice(["click", "click", "save", "dismiss"])}
+                    for _ in range(1 if mode == "single" else args.batch)
+                ]
+                started = time.perf_counter()
+                if mode == "single":
+                    response = await http.post("/interactions/", json=events[0])
+                else:
+                    response = await http.post("/interactions/batch", json={"interactions": events})
+                stats["latencies"].append(time.perf_counter() - started)
+                stats["requests"] += 1
+                if response.status_code in (200, 202):
+                    stats["accepted"] += len(events)
+                elif response.status_code == 503:
+                    stats["rejected"] += len(events)
+                    await asyncio.sleep(float(response.headers.get("retry-after", 1)))
+                else:
+                    raise RuntimeError(f"{response.status_code}: {response.text}")
+
+    await asyncio.gather(*(client(random.Random(i)) for i in range(args.concurrency)))
+    return stats
+
+def run(mode: str, args) -> None:
+    from app.models.article import Article
+    from app.models.interaction import Interaction
+
+    path = Path(tempfile.mkdtemp()) / "load.db"
+    prepare(path, args.articles)
+    port = free_port()
+    server = start_server(path, port)
+    started = time.perf_counter()
+    try:
+        stats = asyncio.run(drive(port, mode, args))
+    finally:
+        # SIGTERM runs the shutdown hook, which flushes the buffer
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+    elapsed = time.perf_counter() - started
+
+    db = session(sqlite_engine(str(path)))
+    stored = db.scalar(select(func.count(Interaction.id)))
+    counted = db.scalar(select(func.sum(Article.interaction_count)))
+    latencies = sorted(stats["latencies"])
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(
+        f"{mode:<8}{stats['requests']:>10}{stats['accepted']:>10}{stats['rejected']:>10}{stored:>10}"
+        f"{stored / elapsed:>12.0f}{p50:>9.1f}{p99:>9.1f}"
+    )
+    if stored != stats["accepted"] or counted != stored:
+        sys.exit(f"FAIL: accepted {stats['accepted']}, stored {stored}, counters sum to {counted}")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--articles", type=int, default=10000)
+    parser.add_argument("--modes", nargs="+", default=["single", "batch"])
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'requests':>10}{'accepted':>10}{'rejected':>10}{'stored':>10}{'events/s':>12}{'p50 ms':>9}{'p99 ms':>9}")
+    for mode in args.modes:
+        run(mode, args)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""Shared fixtures: the app configured for a throwaway SQLite database"""
+from pathlib import Path
+import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL", "sqlite://")
+os.environ.setdefault("ML_WARM_ON_STARTUP", "false")
+os.environ.setdefault("RESPONSE_CACHE_SIZE", "0")
+
+from contextlib import contextmanager
+from sqlalchemy import event
+import pytest
+
+from benchmarks.db import session, sqlite_engine
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sqlite_engine(str(tmp_path / "test.db"))
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db(engine):
+    db = session(engine)
+    yield db
+    db.close()
+
+@pytest.fixture
+def count_queries(engine):
+    """Context manager collecting the statements run on the test engine inside the block"""
+    @contextmanager
+    def counting():
+        statements = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+    return counting
\ No newline at end of file
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from unittest import mock
+import pytest
+
+from app.api.routes import articles
+from app.core.security import create_access_token
+from app.db.session import get_async_db
+from app.main import app
+from app.models.article import Article
+from app.models.user import User
+
+@pytest.fixture
+def client(engine, db, tmp_path):
+    now = datetime.utcnow()
+    db.execute(insert(User), [{"id": 1, "email": "reader@example.com", "hashed_password": "x", "is_active": True}])
+    db.execute(insert(Article), [
+        {"id": i, "title": f"Article {i}", "url": f"https://example.com/{i}", "source": "s", "summary": "x", "date_found": now - timedelta(minutes=i)}
+        for i in range(1, 4)
+    ])
+    db.commit()
+    
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    sessions = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    
+    async def get_test_db():
+        async with sessions() as session:
+            yield session
+    
+    app.dependency_overrides[get_async_db] = get_test_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+def bearer(email: str = "reader@example.com", minutes: int = 30):
+    return {"Authorization": f"Bearer {create_access_token({'sub': email}, timedelta(minutes=minutes))}"}
+
+@pytest.mark.parametrize("headers", [
+    {"Authorization": "Bearer bad"},
+    bearer(minutes=-5),
+    bearer("gone@example.com")
+])
+def test_listing_ignores_invalid_tokens(client, headers):
+    response = client.get("/articles/", headers=headers)
+    
+    assert response.status_code == 200
+    assert [article["id"] for article in response.json()] == [1, 2, 3]
+
+def test_for_you_still_needs_a_valid_token(client):
+    assert client.get("/articles/", params={"sort": "for_you"}, headers={"Authorization": "Bearer bad"}).status_code == 401
+
+def test_for_you_ranks_on_a_sync_session(client, engine):
+    with mock.patch.object(articles, "SessionLocal", sessionmaker(bind=engine)):
+        response = client.get("/articles/", params={"sort": "for_you"}, headers=bearer())
+    
+    assert response.status_code == 200
+    # No interactions yet: newest first
+    assert [article["id"] for article in response.json()] == [1, 2, 3]
+
+def test_cursor_pages_through_the_listing(client):
+    first = client.get("/articles/", params={"limit": 2})
+    second = client.get("/articles/", params={"limit": 2, "cursor": first.headers["x-next-cursor"]})
+    
+    assert [article["id"] for article in first.json()] == [1, 2]
+    assert [article["id"] for article in second.json()] == [3]
+    assert "x-next-cursor" not in second.headers
+
+@pytest.mark.parametrize("cursor", [
+    "garbage",
+    "WyIyMDI2LTEwLTE4VDA2OjMwOjAwIiwgSW5maW5pdHld",  # ["2026-10-18T06:30:00", Infinity]
+    "WyIyMDI2LTEwLTE4VDA2OjMwOjAwIiwgMTAwMDAwMDAwMDAwMDAwMDAwMDAwXQ"  # id past BIGINT
+])
+def test_tampered_cursor_is_a_400(client, cursor):
+    response = client.get("/articles/", params={"cursor": cursor})
+    
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
\ No newline at end of file
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+import random
+
+from benchmarks.db import session, sqlite_engine
+from app.models.article import Article
+from app.models.interaction import Interaction
+from app.services.ml_service import ml_service
+
+def legacy_update_from_interactions(db) -> None:
+    """The per-article loop update_from_interactions replaced, as the reference"""
+    recent_interactions = db.query(Interaction).filter(
+        Interaction.timestamp >= datetime.utcnow() - timedelta(days=7)
+    ).all()
+    article_interactions = {}
+    for interaction in recent_interactions:
+        article_interactions.setdefault(interaction.article_id, []).append(interaction)
+    for article_id, interactions in article_interactions.items():
+        article = db.query(Article).filter(Article.id == article_id).first()
+        if not article:
+            continue
+        engagement_score = sum(
+            2 if i.interaction_type == "save" else
+            1 if i.interaction_type == "click" else
+            0 for i in interactions
+        )
+        if engagement_score >= 5 and article.priority != "High":
+            article.priority = "High"
+            db.add(article)
+    db.commit()
+
+def seed(db, articles, interactions) -> None:
+    db.execute(insert(Article), articles)
+    db.execute(insert(Interaction), interactions)
+    db.commit()
+
+def priorities(db):
+    return dict(db.query(Article.id, Article.priority).order_by(Article.id).all())
+
+def both(tmp_path, articles, interactions):
+    """Priorities after the legacy loop and after update_from_interactions on the same data"""
+    results = []
+    for name in ("legacy", "current"):
+        db = session(sqlite_engine(str(tmp_path / f"{name}.db")))
+        seed(db, articles, interactions)
+        if name == "legacy":
+            legacy_update_from_interactions(db)
+            changed = None
+        else:
+            changed = ml_service.update_from_interactions(db)
+        results.append((priorities(db), changed))
+        db.close()
+    (expected, _), (actual, changed) = results
+    return expected, actual, changed
+
+def test_boundaries_match_the_per_article_loop(tmp_path):
+    now = datetime.utcnow()
+    articles = [
+        {"id": 1, "url": "u1", "priority": "Low"},   # 2 saves + 1 click = 5, promoted
+        {"id": 2, "url": "u2", "priority": "Low"},   # 4, just under the threshold
+        {"id": 3, "url": "u3", "priority": None},    # NULL priority, promoted
+        {"id": 4, "url": "u4", "priority": "High"},  # already High
+        {"id": 5, "url": "u5", "priority": "Low"},   # enough, but mostly too old
+        {"id": 6, "url": "u6", "priority": "Low"},   # dismissals and shares weigh nothing
+        {"id": 7, "url": "u7", "priority": "Low"}    # no interactions
+    ]
+    def events(article_id, types, age=timedelta(hours=1)):
+        return [
+            {"user_id": 1, "article_id": article_id, "interaction_type": t, "timestamp": now - age}
+            for t in types
+        ]
+    interactions = (
+        events(1, ["save", "save", "click"])
+        + events(2, ["save", "click", "click"])
+        + events(3, ["click"] * 5)
+        + events(4, ["save"] * 3)
+        + events(5, ["click"]) + events(5, ["save"] * 3, age=timedelta(days=8))
+        + events(6, ["dismiss", "share"] * 5)
+        # An interaction on an article that is gone
+        + events(99, ["save"] * 3)
+    )
+    
+    expected, actual, changed = both(tmp_path, articles, interactions)
+    
+    assert actual == expected
+    assert actual == {1: "High", 2: "Low", 3: "High", 4: "High", 5: "Low", 6: "Low", 7: "Low"}
+    assert changed == 2
+
+def test_random_history_matches_the_per_article_loop(tmp_path):
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    articles = [
+        {"id": i, "url": f"u{i}", "priority": rng.choice(["High", "Low", None])}
+        for i in range(1, 301)
+    ]
+    interactions = [
+        {
+            "user_id": rng.randint(1, 20),
+            "article_id": rng.randint(1, 320),
+            "interaction_type": rng.choice(["click", "click", "save", "share", "dismiss"]),
+            "timestamp": now - timedelta(hours=rng.uniform(0, 10 * 24))
+        }
+        for _ in range(3000)
+    ]
+    
+    expected, actual, changed = both(tmp_path, articles, interactions)
+    
+    assert actual == expected
+    before = {article["id"]: article["priority"] for article in articles}
+    assert changed == sum(before[id] != priority for id, priority in actual.items())
\ No newline at end of file
@@ -0,0 +1,29 @@
+from sqlalchemy import func, select, text
+
+from app.api.routes.feeds import delete_feed
+from app.models.article import Article, user_articles
+from app.models.feed import Feed
+from app.models.interaction import Interaction
+from app.models.user import User
+
+def test_deleting_a_feed_deletes_its_articles_without_loading_them(db, count_queries):
+    # SQLite only enforces foreign keys when asked, per connection
+    db.execute(text("PRAGMA foreign_keys=ON"))
+    feed, other = Feed(name="Example", url="https://example.com/rss"), Feed(name="Other", url="https://other.com/rss")
+    user = User(email="reader@example.com", hashed_password="x")
+    articles = [Article(title=f"Story {i}", url=f"https://example.com/{i}", feed=feed) for i in range(5)]
+    kept = Article(title="Elsewhere", url="https://other.com/1", feed=other)
+    db.add_all([feed, other, user, kept, *articles])
+    db.flush()
+    db.add(Interaction(user_id=user.id, article_id=articles[0].id, interaction_type="click"))
+    db.execute(user_articles.insert().values(user_id=user.id, article_id=articles[1].id))
+    db.commit()
+    db.expire_all()
+    
+    with count_queries() as statements:
+        delete_feed(feed.id, db)
+    
+    assert not any("FROM articles" in statement for statement in statements)
+    assert db.scalars(select(Article.title)).all() == ["Elsewhere"]
+    assert db.scalar(select(func.count()).select_from(Interaction)) == 0
+    assert db.scalar(select(func.count()).select_from(user_articles)) == 0
\ No newline at end of file
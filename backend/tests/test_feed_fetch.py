@@ -0,0 +1,26 @@
+from unittest import mock
+
+from app.api.routes.feeds import fetch_feed_articles
+from app.models.feed import Feed
+from app.services.feed_fetcher import FeedFetcher, FetchResult
+
+def test_unchanged_body_still_stores_the_new_validators(db):
+    feed = Feed(name="Example", url="https://example.com/rss", is_active=True, content_hash="abc", etag='"old"')
+    db.add(feed)
+    db.commit()
+    result = FetchResult(
+        feed_id=feed.id,
+        url=feed.url,
+        status_code=200,
+        content=b"<rss/>",
+        headers={"etag": '"new"', "last-modified": "Sun, 18 Oct 2026 06:00:00 GMT"},
+        content_hash="abc"
+    )
+    
+    with mock.patch.object(FeedFetcher, "fetch", return_value=[result]):
+        fetch_feed_articles(feed.id, db)
+    
+    db.expire_all()
+    assert feed.etag == '"new"'
+    assert feed.last_modified == "Sun, 18 Oct 2026 06:00:00 GMT"
+    assert feed.last_fetched is not None
\ No newline at end of file
@@ -0,0 +1,30 @@
+from fastapi.testclient import TestClient
+from unittest import mock
+
+from app.api.routes import health
+from app.main import app
+from app.services.ml_service import ml_service
+
+client = TestClient(app)
+
+def test_ready_without_warm_up_before_the_model_loads():
+    with mock.patch.object(health.settings, "ML_WARM_ON_STARTUP", False), \
+         mock.patch.object(ml_service, "_classifier", None):
+        response = client.get("/health/ready")
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert response.json()["model_loaded"] is False
+
+def test_not_ready_while_warming_up():
+    with mock.patch.object(health.settings, "ML_WARM_ON_STARTUP", True), \
+         mock.patch.object(ml_service, "_classifier", None):
+        response = client.get("/health/ready")
+    
+    assert response.status_code == 503
+    assert response.json() == {
+        "status": "loading",
+        "model_loaded": False,
+        "model_trained": False,
+        "model_version": ml_service.model_version
+    }
\ No newline at end of file
@@ -0,0 +1,58 @@
+from sqlalchemy.exc import IntegrityError, OperationalError
+import asyncio
+
+from app.services.interaction_buffer import InteractionBuffer
+
+def rows(count: int, start: int = 0):
+    return [{"user_id": 1, "article_id": i, "interaction_type": "click"} for i in range(start, start + count)]
+
+class FlakyWriter:
+    """Stands in for InteractionBuffer._write, failing with ``errors`` first"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.written = []
+
+    def __call__(self, batch):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.written.extend(batch)
+        return len(batch)
+
+def outage():
+    return OperationalError("INSERT", {}, Exception("server closed the connection unexpectedly"))
+
+def flush(buffer: InteractionBuffer, *batches):
+    async def run():
+        buffer.start()
+        for batch in batches:
+            await buffer.put_many(batch)
+        await buffer.stop()
+    asyncio.run(run())
+
+def test_rows_survive_a_database_outage_in_order():
+    buffer = InteractionBuffer(flush_size=10, retries=3, retry_backoff=0.001)
+    buffer._write = writer = FlakyWriter(outage(), outage())
+    
+    flush(buffer, rows(15), rows(5, start=15))
+    
+    assert writer.written == rows(20)
+    assert buffer.stats() == {"pending": 0, "stored": 20, "dropped": 0, "flushes": 2, "retried": 2}
+
+def test_batch_is_dropped_once_retries_run_out():
+    buffer = InteractionBuffer(flush_size=10, retries=2, retry_backoff=0.001)
+    buffer._write = writer = FlakyWriter(outage(), outage(), outage())
+    
+    flush(buffer, rows(20))
+    
+    assert writer.written == rows(10, start=10)
+    assert buffer.dropped == 10 and buffer.retried == 2
+
+def test_rejected_batch_is_dropped_without_retrying():
+    buffer = InteractionBuffer(flush_size=10, retries=3, retry_backoff=0.001)
+    buffer._write = writer = FlakyWriter(IntegrityError("INSERT", {}, Exception("violates constraint")))
+    
+    flush(buffer, rows(20))
+    
+    assert writer.written == rows(10, start=10)
+    assert buffer.dropped == 10 and buffer.retried == 0
\ No newline at end of file
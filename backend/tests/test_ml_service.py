@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import pytest
+
+from app.services.ml_service import MLService, settings
+
+class FakeOnlineClassifier:
+    """Remembers the texts it learned from instead of fitting anything"""
+
+    is_fitted = True
+
+    def __init__(self):
+        self.revision = "v1"
+        self.learned = []
+
+    def partial_fit(self, texts, categories, priorities):
+        self.learned.extend(texts)
+        return len(texts)
+
+@pytest.fixture
+def service():
+    service = MLService()
+    service._swap(FakeOnlineClassifier(), "v1")
+    with mock.patch.object(settings, "ML_CLASSIFIER", "online"):
+        yield service
+
+def test_concurrent_updates_keep_every_row(service):
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda i: service.partial_update([f"text {i}"], ["Research"], ["High"]), range(50)))
+    
+    assert sorted(service.classifier.learned) == sorted(f"text {i}" for i in range(50))
+
+def test_update_of_a_replaced_model_is_dropped(service):
+    stale = service.classifier
+    replacement = FakeOnlineClassifier()
+    
+    def swap_while_reading(self):
+        # The swap lands between reading the model and taking the lock
+        service._swap(replacement, "v2")
+        return stale
+    
+    with mock.patch.object(MLService, "classifier", property(swap_while_reading)):
+        assert service.partial_update(["text"], ["Research"], ["High"]) == 0
+    
+    assert service._classifier is replacement
+    assert service.model_version == "v2"
+    assert replacement.learned == [] and stale.learned == []
+
+def test_submitted_updates_run_off_the_caller(service):
+    future = service.submit_partial_update(["text"], ["Research"], ["High"])
+    
+    assert future.result(timeout=5) == 1
+    assert service.classifier.learned == ["text"]
+    assert service.classifier.revision.startswith("v1+")
\ No newline at end of file
@@ -0,0 +1,40 @@
+from unittest import mock
+import pytest
+
+from app.ml import training
+from app.ml.registry import MANIFEST_FILE, ModelRegistry
+
+def version(registry: ModelRegistry, name: str, manifest: bool = True) -> str:
+    registry.path(name).mkdir(parents=True)
+    if manifest:
+        (registry.path(name) / MANIFEST_FILE).write_text("{}")
+    return name
+
+def test_failed_training_leaves_no_version(tmp_path):
+    registry = ModelRegistry(tmp_path)
+    with mock.patch.object(training, "ModelRegistry", return_value=registry), \
+         mock.patch.object(training, "train_classifier", side_effect=ValueError("no data")):
+        with pytest.raises(ValueError):
+            training.train_new_version()
+    
+    assert list(registry.versions_dir.iterdir()) == []
+
+def test_incomplete_versions_are_not_listed_or_published(tmp_path):
+    registry = ModelRegistry(tmp_path)
+    good = version(registry, "20240101T000000-a")
+    broken = version(registry, "20240102T000000-b", manifest=False)
+    
+    assert registry.versions() == [good]
+    with pytest.raises(ValueError):
+        registry.publish(broken)
+
+def test_rollback_and_prune_skip_incomplete_versions(tmp_path):
+    registry = ModelRegistry(tmp_path, keep=2)
+    registry.publish(version(registry, "20240101T000000-a"))
+    second = version(registry, "20240102T000000-b")
+    version(registry, "20240103T000000-c", manifest=False)  # a run killed mid-training
+    third = version(registry, "20240104T000000-d")
+    registry.publish(third)
+    
+    assert registry.versions() == [second, third]
+    assert registry.rollback() == second
\ No newline at end of file
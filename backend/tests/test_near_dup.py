@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+from app.config import settings
+from app.services.near_dup import NearDuplicateIndex, signature, start_clusters
+
+STORY = (
+    "OpenAI releases a new reasoning model",
+    "The model beats earlier releases on math and coding benchmarks while costing less to run"
+)
+OTHER = (
+    "Researchers map protein folding with diffusion",
+    "A new generative approach predicts structures for proteins that lacked experimental data"
+)
+
+def index() -> NearDuplicateIndex:
+    return NearDuplicateIndex(settings.NEAR_DUP_THRESHOLD, settings.NEAR_DUP_BANDS, 100)
+
+def test_articles_without_words_have_no_signature():
+    assert signature("", "") is None
+    assert signature("<p></p>", "  ") is None
+    assert signature(*STORY) is not None
+
+def test_copies_within_a_batch_join_the_first_of_their_story():
+    values = [signature(*STORY), signature(*OTHER), None, signature(*STORY), None]
+    
+    clusters, firsts = index().find_batch(values)
+    
+    assert clusters == [None] * 5
+    assert firsts == [None, None, None, 0, None]
+    
+    articles = [SimpleNamespace(id=id, cluster_id=None) for id in range(10, 15)]
+    start_clusters(articles, firsts)
+    assert [article.cluster_id for article in articles] == [10, 11, 12, 10, 14]
+
+def test_indexed_story_wins_over_the_batch():
+    near_duplicates = index()
+    near_duplicates.add(1, signature(*STORY), 1)
+    
+    clusters, firsts = near_duplicates.find_batch([signature(*STORY), signature(*STORY)])
+    
+    assert clusters == [1, 1]
+    assert firsts == [None, None]
\ No newline at end of file
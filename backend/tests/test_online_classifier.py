@@ -0,0 +1,21 @@
+import numpy as np
+
+from app.ml.models.article_classifier import load_classifier
+from app.ml.models.online_classifier import OnlineArticleClassifier
+
+TEXTS = [f"machine learning model release {i}" if i % 2 else f"stock market rally {i}" for i in range(40)]
+CATEGORIES = ["AI" if i % 2 else "Finance" for i in range(40)]
+PRIORITIES = ["High" if i % 3 else "Low" for i in range(40)]
+
+def test_loaded_bundle_takes_partial_updates(tmp_path):
+    trained = OnlineArticleClassifier(model_dir=tmp_path)
+    trained.fit(TEXTS, CATEGORIES, PRIORITIES)
+    trained.save()
+    
+    loaded = load_classifier(tmp_path)
+    before = loaded.category_classifier.coef_.copy()
+    
+    # Used to segfault: the weights were read-only memory-mapped pages
+    assert not isinstance(loaded.category_classifier.coef_, np.memmap)
+    assert loaded.partial_fit(TEXTS[:4], CATEGORIES[:4], PRIORITIES[:4]) == 4
+    assert not np.array_equal(loaded.category_classifier.coef_, before)
\ No newline at end of file
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+import base64
+import pytest
+
+from app.api.routes.articles import list_articles
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.article import Article
+
+def raw_cursor(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def test_cursor_round_trip():
+    found = datetime(2026, 10, 18, 6, 30, 15, 123456)
+    
+    assert decode_cursor(encode_cursor(found, 42)) == (found, 42)
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not a cursor!",
+    raw_cursor(b"\xff\xfe"),
+    raw_cursor(b"[]"),
+    raw_cursor(b'{"id": 1}'),
+    raw_cursor(b'["yesterday", 1]'),
+    raw_cursor(b'["2026-10-18T06:30:00", "one"]'),
+    raw_cursor(b'["2026-10-18T06:30:00", Infinity]'),
+    raw_cursor(b'["2026-10-18T06:30:00", 100000000000000000000]'),
+    raw_cursor(b'["2026-10-18T06:30:00", -1]'),
+    raw_cursor(b'[null, 1]')
+])
+def test_malformed_cursors_raise_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+def test_walking_every_page_has_no_duplicates_or_gaps(db):
+    # Whole batches share a date_found, so pages split inside a tie
+    now = datetime(2026, 10, 18, 12, 0)
+    db.execute(insert(Article), [
+        {"id": id, "title": f"Article {id}", "url": f"https://example.com/{id}", "date_found": now - timedelta(minutes=id // 5)}
+        for id in range(1, 24)
+    ])
+    db.commit()
+    
+    seen, cursor, pages = [], None, 0
+    while True:
+        articles, cursor = list_articles(db, limit=3, cursor=cursor)
+        seen.extend(article.id for article in articles)
+        pages += 1
+        if cursor is None:
+            break
+    
+    expected = [id for _, id in sorted(((now - timedelta(minutes=id // 5), id) for id in range(1, 24)), reverse=True)]
+    assert seen == expected
+    assert pages == 8
+
+def test_cursor_resumes_after_a_tied_row(db):
+    found = datetime(2026, 10, 18, 12, 0)
+    db.execute(insert(Article), [
+        {"id": id, "title": f"Article {id}", "url": f"https://example.com/{id}", "date_found": found}
+        for id in range(1, 6)
+    ])
+    db.commit()
+    
+    first, cursor = list_articles(db, limit=2)
+    second, _ = list_articles(db, limit=2, cursor=cursor)
+    
+    assert [article.id for article in first] == [5, 4]
+    assert decode_cursor(cursor) == (found, 4)
+    assert [article.id for article in second] == [3, 2]
\ No newline at end of file
@@ -0,0 +1,66 @@
+from sklearn.feature_extraction.text import HashingVectorizer
+from unittest import mock
+import pytest
+
+from app.services.related_service import IndexNotReady, RelatedIndex, vectorize
+
+class HashedFeatures:
+    """Stands in for the model's TextFeatureExtractor"""
+
+    def __init__(self):
+        self.vectorizer = HashingVectorizer(n_features=2 ** 12, alternate_sign=False, norm=None)
+
+    def extract_features(self, texts):
+        return self.vectorizer.transform(texts)
+
+TEXTS = {
+    1: "transformer language model training",
+    2: "protein structure prediction diffusion",
+    3: "language model training at scale",
+    4: "diffusion model for protein design"
+}
+
+def built(ids, merge_rows: int = 100) -> RelatedIndex:
+    features = HashedFeatures()
+    index = RelatedIndex(merge_rows=merge_rows)
+    index.build(features, "v1", ids, vectorize(features, [TEXTS[id] for id in ids]))
+    return index
+
+def test_article_in_the_tail_finds_the_main_matrix_and_not_itself():
+    index = built([1, 2])
+    index.add([3, 4], [TEXTS[3], TEXTS[4]])
+    
+    related = index.related(3, 5)
+    
+    assert [id for id, _ in related][0] == 1
+    assert 3 not in [id for id, _ in related]
+    assert [id for id, _ in index.related(4, 5)][0] == 2
+
+def test_tail_lookups_match_a_merged_index():
+    tail = built([1, 2])
+    tail.add([3, 4], [TEXTS[3], TEXTS[4]])
+    merged = built([1, 2, 3, 4])
+    
+    for id in TEXTS:
+        assert tail.related(id, 3) == pytest.approx(merged.related(id, 3))
+
+def test_first_lookup_builds_in_the_background():
+    index = RelatedIndex()
+    with mock.patch.object(index, "_rebuild_in_background") as rebuild:
+        with pytest.raises(IndexNotReady):
+            index.sync(db=None)
+    
+    rebuild.assert_called_once()
+
+def test_cut_posting_lists_still_rank_the_best_matches_first():
+    features = HashedFeatures()
+    texts = [f"language model training run {i}" for i in range(40)] + [TEXTS[1], TEXTS[3]]
+    ids = list(range(1, len(texts) + 1))
+    vectors = vectorize(features, texts)
+    exact = RelatedIndex()
+    exact.build(features, "v1", ids, vectors)
+    pruned = RelatedIndex(max_postings=5, rescore=10)
+    pruned.build(features, "v1", ids, vectors)
+    
+    assert pruned._postings.nnz < exact._postings.nnz
+    assert pruned.related(41, 1) == pytest.approx(exact.related(41, 1))
\ No newline at end of file
@@ -0,0 +1,87 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from unittest import mock
+import pytest
+
+from app.core.cache import MemoryCache
+from app.core.response_cache import response_cache
+from app.db.session import get_async_db
+from app.main import app
+from app.models.feed import Feed
+
+@pytest.fixture
+def client(db, tmp_path):
+    db.execute(insert(Feed), [{"id": 1, "name": "First", "url": "https://example.com/1", "is_active": True}])
+    db.commit()
+    
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    sessions = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    
+    async def get_test_db():
+        async with sessions() as session:
+            yield session
+    
+    # conftest turns the cache off for every other test
+    app.dependency_overrides[get_async_db] = get_test_db
+    with mock.patch.object(response_cache, "enabled", True), \
+         mock.patch.object(response_cache, "local", MemoryCache(100)):
+        yield TestClient(app)
+    app.dependency_overrides.clear()
+
+def names(response):
+    return [feed["name"] for feed in response.json()]
+
+def test_repeated_reads_are_served_from_the_cache(client):
+    hits = response_cache.hits
+    
+    first, second = client.get("/feeds/"), client.get("/feeds/")
+    
+    assert response_cache.hits == hits + 1
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+
+def test_if_none_match_returns_304(client):
+    etag = client.get("/feeds/").headers["etag"]
+    
+    response = client.get("/feeds/", headers={"If-None-Match": etag})
+    
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert client.get("/feeds/", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+def test_committed_flush_evicts_the_page(client, db):
+    assert names(client.get("/feeds/")) == ["First"]
+    generation = response_cache.generations.get(["feeds"])[0]
+    
+    db.add(Feed(name="Second", url="https://example.com/2", is_active=True))
+    db.commit()
+    
+    assert response_cache.generations.get(["feeds"]) == [generation + 1]
+    assert names(client.get("/feeds/")) == ["First", "Second"]
+
+def test_committed_bulk_statement_evicts_the_page(client, db):
+    etag = client.get("/feeds/").headers["etag"]
+    
+    db.execute(update(Feed).where(Feed.id == 1).values(name="Renamed"))
+    db.commit()
+    
+    response = client.get("/feeds/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert names(response) == ["Renamed"]
+
+def test_rolled_back_write_keeps_the_page(client, db):
+    client.get("/feeds/")
+    generations = response_cache.generations.get(["feeds"])
+    hits = response_cache.hits
+    
+    db.add(Feed(name="Second", url="https://example.com/2", is_active=True))
+    db.flush()
+    db.execute(update(Feed).where(Feed.id == 1).values(name="Renamed"))
+    db.rollback()
+    db.commit()
+    
+    assert response_cache.generations.get(["feeds"]) == generations
+    assert names(client.get("/feeds/")) == ["First"]
+    assert response_cache.hits == hits + 1
\ No newline at end of file
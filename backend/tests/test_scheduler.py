@@ -0,0 +1,120 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+import random
+import pytest
+
+from app.core.scheduler import FeedScheduler
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+def scheduler(clock: FakeClock, jitter: float = 0.0) -> FeedScheduler:
+    return FeedScheduler(clock=clock, rng=random.Random(0), min_interval=60, max_interval=3600, jitter=jitter)
+
+def fetched_at(clock: FakeClock) -> datetime:
+    # The scheduler reads naive UTC datetimes, like Feed.last_fetched
+    return datetime.fromtimestamp(clock.now, timezone.utc).replace(tzinfo=None)
+
+def test_interval_shrinks_for_active_feeds_and_grows_for_idle_ones():
+    clock = FakeClock()
+    feeds = scheduler(clock)
+    feeds.add(1, 600, fetched_at(clock))
+    feeds.add(2, 600, fetched_at(clock))
+    
+    for _ in range(10):
+        feeds.record_result(1, 3)
+        feeds.record_result(2, 0)
+    
+    assert feeds.interval(1) == 60
+    assert feeds.interval(2) == 3600
+    feeds.record_result(2, 1)
+    assert feeds.interval(2) == 1800
+
+def test_failures_back_off_exponentially_up_to_the_cap():
+    clock = FakeClock()
+    feeds = scheduler(clock)
+    feeds.add(1, 300, fetched_at(clock))
+    
+    delays = []
+    for _ in range(6):
+        feeds.record_result(1, None)
+        delays.append(feeds.seconds_until_next())
+    
+    assert delays == [600, 1200, 2400, 3600, 3600, 3600]
+    # The learned interval is kept, and a success resets the backoff
+    assert feeds.interval(1) == 300
+    feeds.record_result(1, 0)
+    assert feeds.seconds_until_next() == 450
+
+def test_jitter_stays_within_bounds():
+    clock = FakeClock()
+    feeds = scheduler(clock, jitter=0.1)
+    for feed_id in range(200):
+        feeds.add(feed_id, 1000, fetched_at(clock))
+    
+    backoffs, slowdowns = [], []
+    for feed_id in range(200):
+        feeds.record_result(feed_id, None)
+        backoffs.append(feeds._states[feed_id].due - clock.now)
+        feeds.record_result(feed_id, 0)
+        slowdowns.append(feeds._states[feed_id].due - clock.now)
+    
+    assert all(1800 <= delay <= 2200 for delay in backoffs)
+    assert all(1350 <= delay <= 1650 for delay in slowdowns)
+    # Spread out rather than all at the same offset
+    assert max(slowdowns) - min(slowdowns) > 150
+
+def test_new_feeds_are_spread_over_a_fraction_of_their_interval():
+    clock = FakeClock()
+    feeds = scheduler(clock, jitter=0.2)
+    for feed_id in range(100):
+        feeds.add(feed_id, 1000)
+    
+    clock.advance(100)
+    early = feeds.pop_due()
+    clock.advance(100)
+    late = feeds.pop_due()
+    
+    assert 0 < len(early) < 100
+    assert sorted(early + late) == list(range(100))
+
+def test_update_frequency_is_honored_and_feeds_come_due_in_order():
+    clock = FakeClock()
+    feeds = scheduler(clock)
+    feeds.sync([
+        SimpleNamespace(id=1, update_frequency=900, last_fetched=fetched_at(clock)),
+        SimpleNamespace(id=2, update_frequency=300, last_fetched=fetched_at(clock)),
+        SimpleNamespace(id=3, update_frequency=600, last_fetched=fetched_at(clock))
+    ])
+    
+    order = []
+    for _ in range(3):
+        clock.advance(feeds.seconds_until_next())
+        due = feeds.pop_due()
+        order.extend(due)
+        assert len(due) == 1
+    
+    assert order == [2, 3, 1]
+    assert clock.now - 1_000_000.0 == pytest.approx(900)
+    assert feeds.pop_due() == []
+    assert feeds.seconds_until_next() is None
+
+def test_sync_picks_up_a_changed_frequency_and_drops_removed_feeds():
+    clock = FakeClock()
+    feeds = scheduler(clock)
+    feeds.sync([SimpleNamespace(id=1, update_frequency=900, last_fetched=None),
+                SimpleNamespace(id=2, update_frequency=900, last_fetched=None)])
+    
+    feeds.sync([SimpleNamespace(id=1, update_frequency=120, last_fetched=None)])
+    
+    assert feeds.interval(1) == 120
+    assert 2 not in feeds
+    clock.advance(1)
+    assert feeds.pop_due() == [1]
\ No newline at end of file
@@ -0,0 +1,76 @@
+from sqlalchemy import insert
+from unittest import mock
+import pytest
+
+from app.models.article import Article
+from app.services import search_service
+from app.services.search_service import SearchIndex, analyze, search_articles
+
+@pytest.fixture
+def articles(db):
+    db.execute(insert(Article), [
+        {"id": 1, "title": "Rust compilers get faster", "url": "https://example.com/1",
+         "summary": "A look at incremental builds in the Rust toolchain."},
+        {"id": 2, "title": "Weekly roundup", "url": "https://example.com/2",
+         "summary": "Python packaging news, a Rust release and the compilers people are talking about this week."},
+        {"id": 3, "title": "Python typing in practice", "url": "https://example.com/3",
+         "summary": "Gradual typing for large Python codebases."},
+        {"id": 4, "title": "The of and", "url": "https://example.com/4", "summary": None}
+    ])
+    db.commit()
+    # A fresh index per test; the session listeners see the patched one
+    with mock.patch.object(search_service, "search_index", SearchIndex()):
+        yield db
+
+def ids(hits):
+    return [hit.article.id for hit in hits]
+
+def test_title_matches_rank_above_summary_matches(articles):
+    hits = search_articles(articles, "rust compiler")
+    
+    assert ids(hits) == [1, 2]
+    assert hits[0].rank > hits[1].rank > 0
+
+def test_every_word_must_match(articles):
+    assert ids(search_articles(articles, "python typing")) == [3]
+    assert ids(search_articles(articles, "rust typing")) == []
+    assert ids(search_articles(articles, "kotlin")) == []
+
+def test_snippet_marks_the_matched_words(articles):
+    hit = search_articles(articles, "packaging")[0]
+    
+    assert hit.article.id == 2
+    assert hit.snippet == (
+        "Python <mark>packaging</mark> news, a Rust release and the compilers people are talking about this week."
+    )
+    # Stemmed matches are marked in their original form
+    assert "<mark>compilers</mark>" in search_articles(articles, "compiler")[1].snippet
+
+def test_snippet_falls_back_to_the_title(articles):
+    hit = search_articles(articles, "practice")[0]
+    
+    assert hit.snippet == "Python typing in <mark>practice</mark>"
+
+@pytest.mark.parametrize("q", ["", "   ", "the of and", "!!!"])
+def test_queries_without_index_terms_find_nothing(articles, q):
+    assert analyze(q) == []
+    assert search_articles(articles, q) == []
+
+def test_skip_and_limit_page_through_the_ranking(articles):
+    ranked = ids(search_articles(articles, "python"))
+    
+    assert ranked == [3, 2]
+    assert ids(search_articles(articles, "python", skip=1, limit=1)) == [2]
+    assert ids(search_articles(articles, "python", skip=2)) == []
+
+def test_edits_and_deletes_are_reflected_after_commit(articles):
+    search_articles(articles, "rust")
+    first = articles.get(Article, 1)
+    first.title = "Zig compilers get faster"
+    articles.delete(articles.get(Article, 3))
+    articles.commit()
+    
+    assert ids(search_articles(articles, "zig")) == [1]
+    # The summary still mentions Rust
+    assert sorted(ids(search_articles(articles, "rust"))) == [1, 2]
+    assert ids(search_articles(articles, "gradual")) == []
\ No newline at end of file
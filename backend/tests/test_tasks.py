@@ -0,0 +1,25 @@
+from unittest import mock
+import asyncio
+
+from app.core import tasks
+
+async def idle():
+    await asyncio.sleep(3600)
+
+def test_started_tasks_save_trending_snapshots_until_cancelled():
+    async def run():
+        with mock.patch.object(tasks, "periodic_feed_updates", idle), \
+             mock.patch.object(tasks, "periodic_model_training", idle), \
+             mock.patch.object(tasks.settings, "TRENDING_SNAPSHOT_INTERVAL", 0.01), \
+             mock.patch.object(tasks.trending_topics, "save") as save:
+            started = tasks.start_background_tasks()
+            await asyncio.sleep(0.2)
+            for task in started:
+                task.cancel()
+            await asyncio.gather(*started, return_exceptions=True)
+            return started, save.call_count
+    
+    started, saves = asyncio.run(run())
+    
+    assert len(started) == 3 and all(task.cancelled() for task in started)
+    assert saves >= 3
\ No newline at end of file
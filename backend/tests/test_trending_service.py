@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta
+import numpy as np
+import pytest
+
+from app.services.trending_service import TrendingTopics, parse_window
+
+NOW = datetime(2026, 10, 18, 12, 30)
+
+def topics(tmp_path, **options) -> TrendingTopics:
+    options = {"bucket_minutes": 60, "max_window_hours": 24, "width": 256, "depth": 4, "terms_per_bucket": 20, **options}
+    trending = TrendingTopics(snapshot_path=str(tmp_path / "trending.npz"), **options)
+    trending.loaded = True
+    return trending
+
+def add_many(trending: TrendingTopics, hours_ago: float, terms, count: int) -> None:
+    for _ in range(count):
+        trending.add(NOW - timedelta(hours=hours_ago), terms)
+
+def test_rising_terms_rank_above_steady_ones(tmp_path):
+    trending = topics(tmp_path)
+    add_many(trending, 30, ["steady"], 6)
+    add_many(trending, 2, ["steady"], 6)
+    add_many(trending, 3, ["burst"], 8)
+    
+    ranked = trending.trending(timedelta(hours=24), now=NOW)
+    
+    assert [topic.term for topic in ranked] == ["burst", "steady"]
+    assert (ranked[0].count, ranked[0].previous_count) == (8, 0)
+    assert (ranked[1].count, ranked[1].previous_count) == (6, 6)
+    assert ranked[0].score > ranked[1].score == 0
+
+def test_windows_only_count_their_own_buckets(tmp_path):
+    trending = topics(tmp_path)
+    add_many(trending, 0.5, ["fresh"], 3)
+    add_many(trending, 5, ["older"], 3)
+    
+    assert [topic.term for topic in trending.trending(timedelta(hours=1), now=NOW)] == ["fresh"]
+    assert {topic.term for topic in trending.trending(timedelta(hours=6), now=NOW)} == {"fresh", "older"}
+
+def test_terms_below_the_minimum_count_dont_trend(tmp_path):
+    trending = topics(tmp_path)
+    add_many(trending, 1, ["rare"], 2)
+    
+    assert trending.trending(timedelta(hours=24), now=NOW) == []
+
+def test_terms_are_counted_once_per_article_and_normalized(tmp_path):
+    trending = topics(tmp_path)
+    add_many(trending, 1, ["GPU", " gpu ", "", "gpu"], 3)
+    
+    assert [(topic.term, topic.count) for topic in trending.trending(timedelta(hours=2), now=NOW)] == [("gpu", 3)]
+
+def test_sketch_never_undercounts(tmp_path):
+    # A narrow sketch forces collisions
+    trending = topics(tmp_path, width=16, terms_per_bucket=1000)
+    counts = {f"term{i}": i % 7 + 3 for i in range(200)}
+    for term, count in counts.items():
+        add_many(trending, 0.25, [term], count)
+    
+    estimates = {topic.term: topic.count for topic in trending.trending(timedelta(hours=1), limit=1000, now=NOW)}
+    
+    assert set(estimates) == set(counts)
+    assert all(estimates[term] >= count for term, count in counts.items())
+
+def test_old_buckets_roll_out_of_the_kept_span(tmp_path):
+    trending = topics(tmp_path)
+    add_many(trending, 47, ["ancient"], 5)
+    assert len(trending._buckets) == 1
+    
+    # A bucket two days later pushes the first one past twice the longest window
+    add_many(trending, -2, ["news"], 3)
+    assert len(trending._buckets) == 1
+    
+    # Articles older than the kept span are dropped on arrival
+    add_many(trending, 47, ["ancient"], 5)
+    assert len(trending._buckets) == 1
+    later = NOW + timedelta(hours=2)
+    assert [topic.term for topic in trending.trending(timedelta(hours=24), now=later)] == ["news"]
+
+def test_windows_longer_than_the_kept_span_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        topics(tmp_path).trending(timedelta(hours=25), now=NOW)
+
+@pytest.mark.parametrize("window, expected", [
+    ("90m", timedelta(minutes=90)),
+    ("24H", timedelta(hours=24)),
+    ("7d", timedelta(days=7))
+])
+def test_parse_window(window, expected):
+    assert parse_window(window) == expected
+
+@pytest.mark.parametrize("window", ["", "0h", "24", "1w", "-1h", "h"])
+def test_parse_window_rejects_malformed_windows(window):
+    with pytest.raises(ValueError):
+        parse_window(window)
+
+def test_snapshot_round_trip(tmp_path):
+    trending = topics(tmp_path)
+    add_many(trending, 30, ["steady"], 4)
+    add_many(trending, 2, ["steady"], 4)
+    add_many(trending, 3, ["burst"], 8)
+    trending.max_id = 42
+    
+    trending.save()
+    restored = topics(tmp_path)
+    
+    assert restored.load()
+    assert restored.max_id == 42
+    assert sorted(restored._buckets) == sorted(trending._buckets)
+    for index, bucket in trending._buckets.items():
+        assert np.array_equal(restored._buckets[index].sketch, bucket.sketch)
+        assert restored._buckets[index].top == bucket.top
+    window = timedelta(hours=24)
+    assert restored.trending(window, now=NOW) == trending.trending(window, now=NOW)
+    # Counting carries on from the restored state
+    add_many(restored, 3, ["burst"], 1)
+    assert restored.trending(window, now=NOW)[0].count == 9
+
+def test_snapshot_made_with_other_settings_is_ignored(tmp_path):
+    trending = topics(tmp_path)
+    add_many(trending, 1, ["burst"], 3)
+    trending.save()
+    
+    assert not topics(tmp_path, width=512).load()
+    assert not topics(tmp_path, bucket_minutes=30).load()
+    assert not topics(tmp_path / "elsewhere").load()
+
+def test_unloaded_counts_dont_overwrite_the_snapshot(tmp_path):
+    trending = topics(tmp_path)
+    add_many(trending, 1, ["burst"], 3)
+    trending.save()
+    
+    fresh = topics(tmp_path)
+    fresh.loaded = False
+    fresh.save()
+    
+    restored = topics(tmp_path)
+    assert restored.load()
+    assert [topic.term for topic in restored.trending(timedelta(hours=24), now=NOW)] == ["burst"]
\ No newline at end of file
@@ -0,0 +1,40 @@
+from sqlalchemy import insert
+from types import SimpleNamespace
+import pytest
+
+from app.models.article import Article
+from app.services.url_dedup import filter_new_entries, recent_urls
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    recent_urls.clear()
+    yield
+    recent_urls.clear()
+
+def entries(count: int):
+    return [SimpleNamespace(link=f"https://example.com/{i}", title=f"Entry {i}") for i in range(count)]
+
+@pytest.mark.parametrize("count", [1, 50])
+def test_one_query_per_feed_however_many_entries(db, count_queries, count):
+    # Every other entry is stored already
+    db.execute(insert(Article), [{"url": f"https://example.com/{i}"} for i in range(0, count, 2)])
+    db.commit()
+    
+    with count_queries() as statements:
+        new = filter_new_entries(db, entries(count))
+    
+    assert len(statements) == 1
+    assert [entry.link for entry in new] == [f"https://example.com/{i}" for i in range(1, count, 2)]
+
+def test_cached_urls_skip_the_query(db, count_queries):
+    recent_urls.add_many(entry.link for entry in entries(50))
+    
+    with count_queries() as statements:
+        assert filter_new_entries(db, entries(50)) == []
+    
+    assert statements == []
+
+def test_duplicate_links_in_a_feed_are_returned_once(db):
+    feed = entries(3) + entries(3)
+    
+    assert [entry.link for entry in filter_new_entries(db, feed)] == [entry.link for entry in entries(3)]
\ No newline at end of file